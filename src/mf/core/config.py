@@ -57,6 +57,12 @@ class SitePaths:
     packages_db: Path
     packages_backups: Path
 
+    # Paper sync manifest (regenerable cache, in .mf/cache/)
+    sync_manifest: Path
+
+    # GitHub API ETag cache (regenerable cache, in .mf/cache/)
+    http_etags: Path
+
 
 def get_global_config_path() -> Path:
     """Return the path to the global mf config file.
@@ -218,4 +224,6 @@ def get_paths(site_root: Path | None = None) -> SitePaths:
         packages=site_root / "content" / "packages",
         packages_db=mf_dir / "packages_db.json",
         packages_backups=mf_dir / "backups" / "packages",
+        sync_manifest=mf_dir / "cache" / "sync_manifest.json",
+        http_etags=mf_dir / "cache" / "http_etags.json",
     )
@@ -2,25 +2,66 @@
 Cryptographic utilities.
 
 Provides hash computation for file integrity checking.
+
+Besides the hashlib algorithms, the fast non-cryptographic ``xxh3`` and
+``blake3`` prefixes are recognized when the optional ``xxhash`` / ``blake3``
+packages are installed (``pip install mf[hash]``).
 """
 
 from __future__ import annotations
 
 import hashlib
+import os
+import time
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+# Optional fast hashers for change detection, keyed by hash prefix
+FAST_HASHERS: dict[str, Callable[[], Any]] = {}
+
+try:
+    import xxhash
+    FAST_HASHERS["xxh3"] = xxhash.xxh3_64
+except ImportError:
+    pass
+
+try:
+    import blake3
+    FAST_HASHERS["blake3"] = blake3.blake3
+except ImportError:
+    pass
+
+
+def _new_hasher(algorithm: str) -> Any:
+    """Create a hasher for an algorithm name.
+
+    Raises:
+        ValueError: If algorithm is not supported
+    """
+    if algorithm in FAST_HASHERS:
+        return FAST_HASHERS[algorithm]()
+    try:
+        return hashlib.new(algorithm)
+    except ValueError as e:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}") from e
 
 
 def compute_file_hash(
-    file_path: Path,
+    file_path: str | Path,
     algorithm: str = "sha256",
-    chunk_size: int = 8192,
+    chunk_size: int = 65536,
     prefix: bool = True,
 ) -> str:
     """Compute hash of a file using chunked reading.
 
+    Files up to ``chunk_size`` are hashed from a single read; larger files
+    are streamed through one reused buffer to avoid per-chunk allocations.
+
     Args:
         file_path: Path to file to hash
-        algorithm: Hash algorithm (sha256, sha1, md5, etc.)
+        algorithm: Hash algorithm (sha256, sha1, md5, xxh3, blake3, etc.)
         chunk_size: Size of chunks to read at a time
         prefix: Include algorithm prefix (e.g., "sha256:abc123...")
 
@@ -31,33 +72,61 @@ def compute_file_hash(
         FileNotFoundError: If file doesn't exist
         ValueError: If algorithm is not supported
     """
-    file_path = Path(file_path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"Cannot hash non-existent file: {file_path}")
-
-    try:
-        hasher = hashlib.new(algorithm)
-    except ValueError as e:
-        raise ValueError(f"Unsupported hash algorithm: {algorithm}") from e
+    return compute_file_hash_and_fingerprint(file_path, algorithm, chunk_size, prefix)[0]
 
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            hasher.update(chunk)
 
-    digest = hasher.hexdigest()
-    return f"{algorithm}:{digest}" if prefix else digest
+def compute_file_hash_and_fingerprint(
+    file_path: str | Path,
+    algorithm: str = "sha256",
+    chunk_size: int = 65536,
+    prefix: bool = True,
+) -> tuple[str, dict[str, Any]]:
+    """Hash a file and fingerprint the exact file that was hashed.
 
-
-def verify_file_hash(file_path: Path, expected_hash: str) -> bool:
-    """Verify a file's hash matches an expected value.
+    The fingerprint comes from ``fstat`` on the open descriptor before it is
+    read, so it can never describe newer contents than the hash does. It
+    also records when it was taken, for ``fingerprint_matches``.
 
     Args:
-        file_path: Path to file to verify
-        expected_hash: Expected hash (with or without algorithm prefix)
+        file_path: Path to file to hash
+        algorithm: Hash algorithm (sha256, sha1, md5, xxh3, blake3, etc.)
+        chunk_size: Size of chunks to read at a time
+        prefix: Include algorithm prefix (e.g., "sha256:abc123...")
 
     Returns:
-        True if hash matches, False otherwise
+        Tuple of (hash string, stat fingerprint with a recorded_ns key)
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If algorithm is not supported
     """
+    try:
+        with open(file_path, "rb") as f:
+            hasher = _new_hasher(algorithm)
+            st = os.fstat(f.fileno())
+            recorded_ns = time.time_ns()
+            if st.st_size <= chunk_size:
+                hasher.update(f.read())
+            else:
+                buf = bytearray(chunk_size)
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    hasher.update(view[:n])
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Cannot hash non-existent file: {file_path}") from e
+
+    digest = hasher.hexdigest()
+    file_hash = f"{algorithm}:{digest}" if prefix else digest
+    return file_hash, {**stat_fingerprint(st), "recorded_ns": recorded_ns}
+
+
+# Files modified this recently may change again within the same mtime
+# tick without the stat key noticing, so their results are never cached.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _verify_file_hash_uncached(file_path: str | Path, expected_hash: str) -> bool:
+    """Hash a file and compare against an expected value."""
     # Parse expected hash to extract algorithm
     if ":" in expected_hash:
         algorithm, expected_digest = expected_hash.split(":", 1)
@@ -69,6 +138,80 @@ def verify_file_hash(file_path: Path, expected_hash: str) -> bool:
     return actual_hash == expected_digest
 
 
+@lru_cache(maxsize=8192)
+def _verify_file_hash_cached(
+    file_path: str, expected_hash: str, ino: int, mtime_ns: int, size: int
+) -> bool:
+    """Memoized verification; the stat triple in the key invalidates entries."""
+    return _verify_file_hash_uncached(file_path, expected_hash)
+
+
+def verify_file_hash(file_path: str | Path, expected_hash: str) -> bool:
+    """Verify a file's hash matches an expected value.
+
+    Results are memoized per process, keyed on the file's inode, mtime and
+    size, so re-checking an unchanged file does not re-read it.
+
+    Args:
+        file_path: Path to file to verify
+        expected_hash: Expected hash (with or without algorithm prefix)
+
+    Returns:
+        True if hash matches, False otherwise
+    """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Cannot hash non-existent file: {file_path}") from e
+
+    if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+        return _verify_file_hash_uncached(file_path, expected_hash)
+
+    return _verify_file_hash_cached(
+        os.fspath(file_path), expected_hash, st.st_ino, st.st_mtime_ns, st.st_size
+    )
+
+
+def stat_fingerprint(st: os.stat_result) -> dict[str, Any]:
+    """Build a cheap change-detection fingerprint from a stat result.
+
+    If a file's inode, mtime and size all match a stored fingerprint, its
+    contents can be assumed unchanged without re-hashing.
+
+    Args:
+        st: Result of os.stat() on the file
+
+    Returns:
+        Dict with ino, mtime_ns and size keys (JSON-serializable)
+    """
+    return {"ino": st.st_ino, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def fingerprint_matches(stored: dict[str, Any] | None, st: os.stat_result) -> bool:
+    """Check whether a stored fingerprint still vouches for a file's contents.
+
+    Fingerprints recorded within the racy window of the file's mtime are
+    never trusted: the file may have changed again in the same mtime tick.
+    Fingerprints without a recorded_ns are treated the same way.
+
+    Args:
+        stored: Fingerprint from compute_file_hash_and_fingerprint, or None
+        st: Current os.stat() of the file
+
+    Returns:
+        True if the file can be assumed unchanged without re-hashing
+    """
+    if not stored:
+        return False
+    recorded_ns = stored.get("recorded_ns")
+    mtime_ns = stored.get("mtime_ns")
+    if recorded_ns is None or mtime_ns is None or recorded_ns - mtime_ns < _RACY_WINDOW_NS:
+        return False
+    return (stored.get("ino"), mtime_ns, stored.get("size")) == (
+        st.st_ino, st.st_mtime_ns, st.st_size
+    )
+
+
 def compute_directory_hash(
     dir_path: Path,
     algorithm: str = "sha256",
@@ -81,7 +224,7 @@ def compute_directory_hash(
 
     Args:
         dir_path: Path to directory to hash
-        algorithm: Hash algorithm (sha256, sha1, md5, etc.)
+        algorithm: Hash algorithm (sha256, sha1, md5, xxh3, blake3, etc.)
         prefix: Include algorithm prefix (e.g., "sha256:abc123...")
 
     Returns:
@@ -97,10 +240,7 @@ def compute_directory_hash(
     if not dir_path.is_dir():
         raise ValueError(f"Path is not a directory: {dir_path}")
 
-    try:
-        hasher = hashlib.new(algorithm)
-    except ValueError as e:
-        raise ValueError(f"Unsupported hash algorithm: {algorithm}") from e
+    hasher = _new_hasher(algorithm)
 
     # Get all files sorted by relative path for deterministic ordering
     all_files = sorted(dir_path.rglob("*"))
@@ -19,17 +19,27 @@ from rich.console import Console
 
 from mf.core.backup import safe_write_json
 from mf.core.config import get_paths
+from mf.core.jsonio import load_json_file
 
 console = Console()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaperEntry:
-    """A single paper entry in the database."""
+    """A single paper entry in the database.
+
+    Entries are lightweight views over the database's dicts: the slug and
+    data binding are fixed, while ``data`` itself stays mutable.
+    """
 
     slug: str
     data: dict[str, Any] = field(default_factory=dict)
 
+    def __hash__(self) -> int:
+        # Hash on the slug only (data is an unhashable dict). str caches its
+        # own hash, so this is constant time after the first call.
+        return hash(self.slug)
+
     @property
     def title(self) -> str:
         return str(self.data.get("title", self.slug))
@@ -91,6 +101,11 @@ class PaperEntry:
     def source_hash(self) -> str | None:
         return self.data.get("source_hash")
 
+    @property
+    def source_stat(self) -> dict[str, Any] | None:
+        """Get the stat fingerprint recorded alongside source_hash."""
+        return self.data.get("source_stat")
+
     @property
     def source_format(self) -> str:
         """Get source format (tex, docx, pregenerated). Defaults to tex."""
@@ -145,10 +160,26 @@ class PaperEntry:
         """Update entry data."""
         self.data.update(kwargs)
 
-    def set_source_tracking(self, source_path: Path, source_hash: str) -> None:
-        """Set source file tracking info."""
+    def set_source_tracking(
+        self,
+        source_path: Path,
+        source_hash: str,
+        source_stat: dict[str, Any] | None = None,
+    ) -> None:
+        """Set source file tracking info.
+
+        Args:
+            source_path: Source file that was hashed
+            source_hash: Hash of the source file
+            source_stat: Fingerprint taken while hashing, as returned by
+                compute_file_hash_and_fingerprint (omit to store none)
+        """
         self.data["source_path"] = str(source_path)
         self.data["source_hash"] = source_hash
+        if source_stat is not None:
+            self.data["source_stat"] = source_stat
+        else:
+            self.data.pop("source_stat", None)
         self.data["last_generated"] = datetime.now().isoformat()
 
     @property
@@ -239,6 +270,12 @@ class PaperDatabase:
             "source_path": "/path/to/source/paper.tex",
             "source_format": "tex",  # tex (default), docx, pregenerated
             "source_hash": "sha256:abcdef...",
+            "source_stat": {
+                "ino": 1234567,
+                "mtime_ns": 1728304496000000000,
+                "size": 20480,
+                "recorded_ns": 1728304560000000000,
+            },
             "last_generated": "2025-10-07T12:34:56",
         },
     }
@@ -267,8 +304,7 @@ class PaperDatabase:
             return
 
         try:
-            with open(self.db_path, encoding="utf-8") as f:
-                self._data = json.load(f)
+            self._data = load_json_file(self.db_path)
             self._loaded = True
 
         except json.JSONDecodeError as e:
@@ -388,10 +424,11 @@ class PaperDatabase:
 
     def papers_with_source(self) -> Iterator[PaperEntry]:
         """Iterate over papers that have source tracking."""
-        for slug in self:
-            entry = self.get(slug)
-            if entry and entry.source_path:
-                yield entry
+        # Single pass over the raw dict: no per-slug re-lookup and no Path
+        # construction just to test for a source path.
+        for slug, data in self._data.items():
+            if slug not in self.SPECIAL_KEYS and data.get("source_path"):
+                yield PaperEntry(slug=slug, data=data)
 
     def search(
         self,
@@ -537,6 +574,22 @@ class ProjectsDatabase:
         self._data: dict[str, Any] = {}
         self._loaded = False
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], db_path: Path | None = None) -> ProjectsDatabase:
+        """Create a loaded database from in-memory data without reading a file.
+
+        Args:
+            data: Database contents; used directly, not copied
+            db_path: Where ``save()`` writes (uses default if not provided)
+
+        Returns:
+            Loaded ProjectsDatabase
+        """
+        db = cls(db_path)
+        db._data = data
+        db._loaded = True
+        return db
+
     def load(self) -> None:
         """Load database from file."""
         if not self.db_path.exists():
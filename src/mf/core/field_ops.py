@@ -8,7 +8,8 @@ that normalizes access to the three different database return types (dict vs Ent
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
@@ -35,9 +36,14 @@ class FieldDef:
     choices: list[str] | None = None
     min_val: int | None = None
     max_val: int | None = None
+    # Hashed copy of choices for validation; choices keeps display order
+    choices_set: frozenset[str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.choices_set = frozenset(self.choices or ())
 
-@dataclass
+
+@dataclass(slots=True)
 class ChangeResult:
     """Result of a field change operation."""
 
@@ -137,16 +143,21 @@ def parse_field_path(field: str) -> tuple[str, str | None]:
         "packages.pypi" -> ("packages", "pypi")
         "external_docs.readthedocs" -> ("external_docs", "readthedocs")
     """
-    parts = field.split(".", 1)
-    if len(parts) == 2:
-        return parts[0], parts[1]
-    return parts[0], None
+    top, sep, sub = field.partition(".")
+    return (top, sub) if sep else (top, None)
 
 
 # ---------------------------------------------------------------------------
 # Coercion
 # ---------------------------------------------------------------------------
 
+# Lowercased tokens accepted for BOOL fields
+_TRUE_VALUES = frozenset({"true", "yes", "1", "on"})
+_FALSE_VALUES = frozenset({"false", "no", "0", "off"})
+
+# Comma separator for STRING_LIST values, absorbing surrounding whitespace
+_LIST_SPLIT_RE = re.compile(r"\s*,\s*")
+
 
 def coerce_value(value_str: str, field_def: FieldDef) -> Any:
     """Coerce a string value to the field's expected type.
@@ -173,10 +184,10 @@ def coerce_value(value_str: str, field_def: FieldDef) -> Any:
             raise ValueError(f"Expected integer, got: {value_str!r}") from e
 
     if ft == FieldType.BOOL:
-        lower = value_str.lower()
-        if lower in ("true", "yes", "1", "on"):
+        lower = value_str.strip().lower()
+        if lower in _TRUE_VALUES:
             return True
-        if lower in ("false", "no", "0", "off"):
+        if lower in _FALSE_VALUES:
             return False
         raise ValueError(f"Expected boolean (true/false/yes/no/1/0/on/off), got: {value_str!r}")
 
@@ -190,7 +201,7 @@ def coerce_value(value_str: str, field_def: FieldDef) -> Any:
                     return [str(item) for item in parsed]
             except json.JSONDecodeError:
                 pass
-        return [item.strip() for item in value_str.split(",") if item.strip()]
+        return [item for item in _LIST_SPLIT_RE.split(stripped) if item]
 
     if ft == FieldType.DICT:
         # Only accept JSON objects
@@ -242,7 +253,7 @@ def validate_field(field: str, value: Any, schema: dict[str, FieldDef]) -> list[
         if field_def.max_val is not None and value > field_def.max_val:
             errors.append(f"{top}: value {value} is above maximum {field_def.max_val}.")
 
-    if field_def.choices is not None and isinstance(value, str) and value not in field_def.choices:
+    if field_def.choices is not None and isinstance(value, str) and value not in field_def.choices_set:
             errors.append(f"{top}: {value!r} is not a valid choice. Options: {', '.join(field_def.choices)}.")
 
     return errors
@@ -286,6 +297,7 @@ def set_field(
 
     if sub is not None:
         # Nested dict: packages.pypi = "my-pkg"
+        # Copy on write, as unset_field does, so get_data() dicts stay unmutated
         old_dict: dict[str, Any] = current.get(top, {})
         old_value = old_dict.get(sub)
         new_dict = dict(old_dict)
@@ -380,16 +392,11 @@ def modify_list_field(
     if replace is not None:
         new_value = replace
     else:
-        new_value = list(old_value)
-        if add:
-            seen = set(new_value)
-            for item in add:
-                if item not in seen:
-                    new_value.append(item)
-                    seen.add(item)
-        if remove:
-            remove_set = set(remove)
-            new_value = [item for item in new_value if item not in remove_set]
+        # One pass: dict.fromkeys dedupes in first-seen order, then drop removals
+        remove_set = frozenset(remove or ())
+        new_value = [
+            item for item in dict.fromkeys((*old_value, *(add or ()))) if item not in remove_set
+        ]
 
     db.update_data(slug, **{field: new_value})
 
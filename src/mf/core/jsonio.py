@@ -0,0 +1,88 @@
+"""
+JSON reading and formatting helpers.
+
+Uses the optional ``orjson`` package (``pip install mf[json]``) when it is
+installed, falling back to the stdlib ``json`` module.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from datetime import date, time
+from pathlib import Path
+from typing import Any
+
+# Optional faster JSON parser/encoder
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def load_json_file(path: Path) -> Any:
+    """Parse a JSON file from a single bytes read.
+
+    Uses orjson when installed, falling back to the stdlib parser. Both raise
+    json.JSONDecodeError (orjson's error subclasses it) on invalid input.
+
+    Args:
+        path: JSON file to read
+
+    Returns:
+        Parsed JSON value
+    """
+    raw = path.read_bytes()
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_key(key: Any) -> Any:
+    """Convert a dict key the stdlib encoder rejects, as orjson would."""
+    if key is None or isinstance(key, (str, int, float)):
+        return key
+    if isinstance(key, (date, time)):
+        return key.isoformat()
+    return str(key)
+
+
+def _stringify_keys(value: Any) -> Any:
+    """Recursively convert non-JSON dict keys (e.g. YAML date keys)."""
+    if isinstance(value, dict):
+        return {_json_key(k): _stringify_keys(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_stringify_keys(v) for v in value]
+    return value
+
+
+def dumps_json(data: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize a value as 2-space indented JSON for CLI output.
+
+    Uses orjson when installed, falling back to the stdlib encoder. Both
+    backends emit the same text: non-ASCII characters are written as-is,
+    and dict keys that are not strings (ints, dates from YAML front
+    matter) are converted to strings.
+
+    Args:
+        data: Value to serialize
+        default: Fallback for values the encoder can't handle (e.g. ``str``)
+
+    Returns:
+        JSON text
+    """
+    if HAS_ORJSON:
+        # Pass datetimes to ``default`` so both backends format them alike
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(data, default=default, option=option).decode()
+    # orjson always writes UTF-8, so keep non-ASCII text unescaped here too
+    try:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=default)
+    except TypeError:
+        # Only pay for the key walk when a non-JSON key is actually present
+        return json.dumps(
+            _stringify_keys(data), indent=2, ensure_ascii=False, default=default
+        )
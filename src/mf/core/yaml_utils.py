@@ -0,0 +1,38 @@
+"""
+Helpers for writing YAML front matter by hand.
+
+The generators emit fixed front-matter schemas line by line instead of
+going through ``yaml.dump``; these helpers make their string values safe.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def yaml_escape(value: Any) -> str:
+    """Escape a value for use inside a double-quoted YAML scalar.
+
+    YAML double-quoted scalars accept JSON string escapes, so the body of
+    ``json.dumps`` handles quotes, backslashes and control characters.
+
+    Args:
+        value: Value to escape (converted with ``str``)
+
+    Returns:
+        Escaped string, without surrounding quotes
+    """
+    return json.dumps(str(value), ensure_ascii=False)[1:-1]
+
+
+def yaml_quote(value: Any) -> str:
+    """Render a value as a double-quoted YAML scalar.
+
+    Args:
+        value: Value to quote (converted with ``str``)
+
+    Returns:
+        Escaped string wrapped in double quotes
+    """
+    return json.dumps(str(value), ensure_ascii=False)
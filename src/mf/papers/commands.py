@@ -915,7 +915,12 @@ def zenodo_import(
     from rich.progress import Progress
 
     from mf.core.database import PaperDatabase
-    from mf.papers.zenodo import ZenodoRecord, compute_match_score
+    from mf.papers.zenodo import (
+        ZenodoRecord,
+        author_last_names,
+        compute_match_score_normalized,
+        normalize_title,
+    )
 
     if not slug and not import_all:
         console.print("[red]Specify a paper slug or use --all[/red]")
@@ -980,6 +985,8 @@ def zenodo_import(
 
             # Build search queries
             candidates = []
+            title_norm = normalize_title(entry.title)
+            last_names = author_last_names(entry.authors)
 
             # Query 1: DOI search (if paper has one)
             if entry.doi:
@@ -987,8 +994,8 @@ def zenodo_import(
                     hits = client.search_records(f'doi:"{entry.doi}"', size=5)
                     for hit in hits:
                         rec = ZenodoRecord.from_search_hit(hit)
-                        score = compute_match_score(
-                            entry.title, entry.authors, rec.title, rec.creators,
+                        score = compute_match_score_normalized(
+                            title_norm, last_names, rec.title, rec.creators,
                         )
                         candidates.append((rec, score))
                 except Exception:
@@ -1015,8 +1022,8 @@ def zenodo_import(
                     hits = client.search_records(query, size=10)
                     for hit in hits:
                         rec = ZenodoRecord.from_search_hit(hit)
-                        score = compute_match_score(
-                            entry.title, entry.authors, rec.title, rec.creators,
+                        score = compute_match_score_normalized(
+                            title_norm, last_names, rec.title, rec.creators,
                         )
                         candidates.append((rec, score))
                 except Exception as e:
@@ -14,7 +14,7 @@ from pathlib import Path
 from rich.console import Console
 
 from mf.core.config import get_paths
-from mf.core.crypto import compute_file_hash
+from mf.core.crypto import compute_file_hash_and_fingerprint
 from mf.core.database import PaperDatabase
 from mf.core.prompts import confirm, prompt_user, select_from_list
 
@@ -287,7 +287,7 @@ def process_paper(
             return False
 
     # Compute source hash
-    source_hash = compute_file_hash(tex_file)
+    source_hash, source_stat = compute_file_hash_and_fingerprint(tex_file)
     console.print(f"Source hash: {source_hash[:20]}...")
 
     # Check if unchanged
@@ -341,7 +341,7 @@ def process_paper(
         console.print("  Updating paper database...")
         if not dry_run:
             entry = db.get_or_create(slug)
-            entry.set_source_tracking(tex_file, source_hash)
+            entry.set_source_tracking(tex_file, source_hash, source_stat)
             db.save()
 
             # Generate Hugo content
@@ -6,16 +6,25 @@ Check if source .tex files have changed and regenerate papers as needed.
 
 from __future__ import annotations
 
+import json
+import math
+import os
+import stat
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 from rich.table import Table
 
-from mf.core.crypto import verify_file_hash
+from mf.core.backup import safe_write_json
+from mf.core.config import get_paths
+from mf.core.crypto import fingerprint_matches, stat_fingerprint, verify_file_hash
 from mf.core.database import PaperDatabase, PaperEntry
 from mf.core.prompts import confirm
 
@@ -24,18 +33,32 @@ console = Console()
 # Default timeout in seconds (5 minutes)
 DEFAULT_TIMEOUT = 300
 
+# Source formats whose files are hashed for staleness (others are skipped)
+TRACKABLE_FORMATS = frozenset({"tex"})
 
-@dataclass
+
+class SyncStatusCode(Enum):
+    """Result of checking a single paper's source for staleness."""
+
+    UP_TO_DATE = "up_to_date"  # Source unchanged
+    STALE = "stale"  # Source has changed
+    NO_HASH = "no_hash"  # No hash stored (assume stale)
+    MISSING = "missing"  # Source file not found
+    SKIPPED = "skipped"  # Source is a directory (not trackable)
+    SKIPPED_NON_TEX = "skipped_non_tex"  # Source format is not tex
+
+
+@dataclass(slots=True)
 class SyncStatus:
     """Status of papers after checking for staleness."""
 
-    stale: list[tuple[PaperEntry, Path, str]]  # (entry, source_path, reason)
+    stale: list[tuple[PaperEntry, str, str]]  # (entry, source_path, reason)
     missing: list[tuple[PaperEntry, str]]  # (entry, source_path_str)
-    up_to_date: list[tuple[PaperEntry, Path]]
+    up_to_date: list[tuple[PaperEntry, str]]  # (entry, source_path)
     skipped: list[tuple[PaperEntry, str]]  # (entry, reason)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing a single paper."""
 
@@ -45,13 +68,15 @@ class ProcessingResult:
     duration: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResults:
     """Results of sync operation."""
 
     succeeded: list[ProcessingResult] = field(default_factory=list)
     failed: list[ProcessingResult] = field(default_factory=list)
 
+    # len() on a list is O(1); these stay plain properties rather than
+    # cached values that would need invalidating on every append.
     @property
     def success_count(self) -> int:
         return len(self.succeeded)
@@ -60,15 +85,22 @@ class SyncResults:
     def failure_count(self) -> int:
         return len(self.failed)
 
+    @property
+    def total_duration(self) -> float:
+        """Total processing time of all results, in seconds."""
+        return math.fsum(r.duration for r in (*self.succeeded, *self.failed))
+
     def print_summary(self) -> None:
         """Print a summary of results."""
         if self.succeeded:
-            console.print(f"\n[green]✓ Succeeded ({len(self.succeeded)}):[/green]")
-            for r in self.succeeded:
-                console.print(f"  • {r.slug} ({r.duration:.1f}s)")
+            lines = [f"\n[green]✓ Succeeded ({self.success_count}):[/green]"]
+            lines.extend(f"  • {r.slug} ({r.duration:.1f}s)" for r in self.succeeded)
+            if self.success_count > 1:
+                lines.append(f"  [dim]Total: {self.total_duration:.1f}s[/dim]")
+            console.print("\n".join(lines))
 
         if self.failed:
-            console.print(f"\n[red]✗ Failed ({len(self.failed)}):[/red]")
+            console.print(f"\n[red]✗ Failed ({self.failure_count}):[/red]")
             table = Table(show_header=True, header_style="bold red")
             table.add_column("Paper")
             table.add_column("Error")
@@ -77,106 +109,292 @@ class SyncResults:
             console.print(table)
 
 
-def check_paper_staleness(entry: PaperEntry) -> tuple[str, Path | None]:
+def check_paper_staleness(entry: PaperEntry) -> tuple[SyncStatusCode, str | None]:
     """Check if a paper's source has changed.
 
     Args:
         entry: Paper database entry
 
     Returns:
-        Tuple of (status, source_path) where status is one of:
-        - "up_to_date": Source unchanged
-        - "stale": Source has changed
-        - "no_hash": No hash stored (assume stale)
-        - "missing": Source file not found
-        - "skipped": Source is a directory (not trackable)
-        - "skipped_non_tex": Source format is not tex (docx, pregenerated)
+        Tuple of (status, source_path) where status is a SyncStatusCode
     """
-    # Check for non-tex source formats first
-    if entry.source_format != "tex":
-        return ("skipped_non_tex", entry.source_path)
+    # Check for non-tex source formats first, before touching the filesystem
+    if entry.data.get("source_format", "tex") not in TRACKABLE_FORMATS:
+        return (SyncStatusCode.SKIPPED_NON_TEX, entry.data.get("source_path"))
 
-    source_path = entry.source_path
+    # Work on the raw path string; no Path object is needed for stat/hash
+    source_path = entry.data.get("source_path")
     if not source_path:
-        return ("skipped", None)
+        return (SyncStatusCode.SKIPPED, None)
 
-    if not source_path.exists():
-        return ("missing", source_path)
+    # A single stat() answers both "exists?" and "is it a directory?"
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return (SyncStatusCode.MISSING, source_path)
 
-    if source_path.is_dir():
-        return ("skipped", source_path)
+    if stat.S_ISDIR(st.st_mode):
+        return (SyncStatusCode.SKIPPED, source_path)
 
     stored_hash = entry.source_hash
     if not stored_hash:
-        return ("no_hash", source_path)
+        return (SyncStatusCode.NO_HASH, source_path)
+
+    # Unchanged inode, mtime and size: skip re-hashing the file
+    if fingerprint_matches(entry.source_stat, st):
+        return (SyncStatusCode.UP_TO_DATE, source_path)
 
     if verify_file_hash(source_path, stored_hash):
-        return ("up_to_date", source_path)
+        return (SyncStatusCode.UP_TO_DATE, source_path)
     else:
-        return ("stale", source_path)
+        return (SyncStatusCode.STALE, source_path)
+
+
+def _categorize(
+    status: SyncStatus, entry: PaperEntry, result: SyncStatusCode, path: str | None
+) -> None:
+    """Add a paper to the matching SyncStatus bucket.
+
+    Args:
+        status: SyncStatus being assembled
+        entry: Paper database entry
+        result: Status code from check_paper_staleness
+        path: Source path from check_paper_staleness
+    """
+    if result is SyncStatusCode.UP_TO_DATE and path is not None:
+        status.up_to_date.append((entry, path))
+    elif result is SyncStatusCode.STALE and path is not None:
+        status.stale.append((entry, path, "changed"))
+    elif result is SyncStatusCode.NO_HASH and path is not None:
+        status.stale.append((entry, path, "no hash"))
+    elif result is SyncStatusCode.MISSING:
+        status.missing.append((entry, str(path)))
+    elif result is SyncStatusCode.SKIPPED:
+        status.skipped.append((entry, "directory reference"))
+    elif result is SyncStatusCode.SKIPPED_NON_TEX:
+        status.skipped.append((entry, f"non-tex format ({entry.source_format})"))
+
+
+def load_sync_manifest(manifest_path: Path) -> dict[str, Any]:
+    """Load the staleness manifest from a previous sync.
+
+    The manifest maps slug -> {"record": source identity, "status": code}.
+    It is a regenerable cache, so unreadable files yield an empty manifest.
+
+    Args:
+        manifest_path: Path to sync_manifest.json
+
+    Returns:
+        Manifest dict (empty if missing or invalid)
+    """
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
 
 
-def check_all_papers(db: PaperDatabase) -> SyncStatus:
+def save_sync_manifest(manifest_path: Path, manifest: dict[str, Any]) -> None:
+    """Save the staleness manifest (no backup - regenerable).
+
+    Args:
+        manifest_path: Path to sync_manifest.json
+        manifest: Manifest dict as updated by check_all_papers
+    """
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    safe_write_json(manifest_path, manifest, create_backup_first=False)
+
+
+def _manifest_record(entry: PaperEntry) -> dict[str, Any] | None:
+    """Identify a paper's tracked source by path, stored hash and stat.
+
+    Returns None for entries that are not regular, trackable files; those
+    are cheap to check and are never served from the manifest.
+    """
+    source_path = entry.data.get("source_path")
+    if not source_path or entry.data.get("source_format", "tex") not in TRACKABLE_FORMATS:
+        return None
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return {"source_path": source_path, "source_hash": entry.source_hash, **stat_fingerprint(st)}
+
+
+def _reusable_status(record: dict[str, Any] | None, previous: Any) -> SyncStatusCode | None:
+    """Return the manifest's status if the source identity is unchanged."""
+    if record is None or not isinstance(previous, dict) or previous.get("record") != record:
+        return None
+    try:
+        return SyncStatusCode(previous.get("status"))
+    except ValueError:
+        return None
+
+
+def _remember(
+    manifest: dict[str, Any] | None,
+    entry: PaperEntry,
+    record: dict[str, Any] | None,
+    result: SyncStatusCode,
+) -> None:
+    """Record a freshly checked paper's status in the manifest."""
+    if manifest is None:
+        return
+    if record is not None:
+        manifest[entry.slug] = {"record": record, "status": result.value}
+    else:
+        manifest.pop(entry.slug, None)
+
+
+def iter_check_all_papers(
+    db: PaperDatabase,
+    max_workers: int | None = None,
+    manifest: dict[str, Any] | None = None,
+) -> Iterator[tuple[PaperEntry, SyncStatusCode, str | None]]:
+    """Check all papers for staleness, yielding each result as it is known.
+
+    Papers served from the manifest are yielded first; the rest are yielded
+    in completion order as the thread pool finishes them. Consumers may stop
+    early (e.g. at the first stale paper); outstanding checks are cancelled.
+
+    The checks are I/O-bound (stat and file hashing both release the GIL),
+    so they run on a thread pool. When a manifest is given, papers whose
+    source path, stored hash and stat triple match the previous run reuse
+    its status without being checked. The manifest is updated in place as
+    results are produced.
+
+    Args:
+        db: Paper database (must be loaded)
+        max_workers: Thread pool size (default: min(32, 4 * CPU count))
+        manifest: Staleness manifest from load_sync_manifest (optional)
+
+    Yields:
+        Tuples of (entry, status, source_path)
+    """
+    entries = list(db.papers_with_source())
+    pending: list[tuple[PaperEntry, dict[str, Any] | None]] = []
+
+    if manifest is not None:
+        # Forget papers that are no longer tracked
+        tracked = {entry.slug for entry in entries}
+        for slug in [slug for slug in manifest if slug not in tracked]:
+            del manifest[slug]
+
+    for entry in entries:
+        record = None
+        if manifest is not None:
+            record = _manifest_record(entry)
+            reused = _reusable_status(record, manifest.get(entry.slug))
+            if record is not None and reused is not None:
+                yield entry, reused, record["source_path"]
+                continue
+        pending.append((entry, record))
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    if len(pending) <= 1 or max_workers <= 1:
+        for entry, record in pending:
+            result, path = check_paper_staleness(entry)
+            _remember(manifest, entry, record, result)
+            yield entry, result, path
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(pending)))
+    try:
+        futures = {
+            executor.submit(check_paper_staleness, entry): (entry, record)
+            for entry, record in pending
+        }
+        for future in as_completed(futures):
+            entry, record = futures[future]
+            result, path = future.result()
+            _remember(manifest, entry, record, result)
+            yield entry, result, path
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def check_all_papers(
+    db: PaperDatabase,
+    max_workers: int | None = None,
+    manifest: dict[str, Any] | None = None,
+) -> SyncStatus:
     """Check all papers for staleness.
 
+    Drains iter_check_all_papers and buckets the results in database order.
+
     Args:
         db: Paper database (must be loaded)
+        max_workers: Thread pool size (default: min(32, 4 * CPU count))
+        manifest: Staleness manifest from load_sync_manifest (optional)
 
     Returns:
         SyncStatus with categorized papers
     """
     status = SyncStatus(stale=[], missing=[], up_to_date=[], skipped=[])
 
+    results = {
+        entry.slug: (result, path)
+        for entry, result, path in iter_check_all_papers(db, max_workers, manifest)
+    }
     for entry in db.papers_with_source():
-        result, path = check_paper_staleness(entry)
-
-        if result == "up_to_date" and path is not None:
-            status.up_to_date.append((entry, path))
-        elif result == "stale" and path is not None:
-            status.stale.append((entry, path, "changed"))
-        elif result == "no_hash" and path is not None:
-            status.stale.append((entry, path, "no hash"))
-        elif result == "missing":
-            status.missing.append((entry, str(entry.source_path)))
-        elif result == "skipped":
-            status.skipped.append((entry, "directory reference"))
-        elif result == "skipped_non_tex":
-            status.skipped.append((entry, f"non-tex format ({entry.source_format})"))
+        _categorize(status, entry, *results[entry.slug])
 
     return status
 
 
+# Count block printed at the top of print_sync_status
+_STATUS_HEADER = "\n".join([
+    "",
+    "=" * 60,
+    "[green]Up to date:[/green]  {up_to_date}",
+    "[yellow]Stale:[/yellow]       {stale}",
+    "[blue]Skipped:[/blue]     {skipped}",
+    "[red]Missing:[/red]     {missing}",
+    "=" * 60,
+])
+
+
 def print_sync_status(status: SyncStatus) -> None:
-    """Print sync status summary."""
-    console.print()
-    console.print("=" * 60)
-    console.print(f"[green]Up to date:[/green]  {len(status.up_to_date)}")
-    console.print(f"[yellow]Stale:[/yellow]       {len(status.stale)}")
-    console.print(f"[blue]Skipped:[/blue]     {len(status.skipped)}")
-    console.print(f"[red]Missing:[/red]     {len(status.missing)}")
-    console.print("=" * 60)
+    """Print sync status summary.
+
+    Lines are collected and handed to the console in one call rather than
+    one print per paper.
+    """
+    lines = [
+        _STATUS_HEADER.format(
+            up_to_date=len(status.up_to_date),
+            stale=len(status.stale),
+            skipped=len(status.skipped),
+            missing=len(status.missing),
+        )
+    ]
 
     if status.up_to_date:
-        console.print("\n[green]Up-to-date papers:[/green]")
-        for entry, _ in status.up_to_date:
-            console.print(f"  ✓ {entry.slug}")
+        lines.append("\n[green]Up-to-date papers:[/green]")
+        lines.extend(f"  ✓ {entry.slug}" for entry, _ in status.up_to_date)
 
     if status.skipped:
-        console.print("\n[blue]Skipped (directory references):[/blue]")
-        for entry, _reason in status.skipped:
-            console.print(f"  ⊘ {entry.slug}")
+        lines.append("\n[blue]Skipped (directory references):[/blue]")
+        lines.extend(f"  ⊘ {entry.slug}" for entry, _reason in status.skipped)
 
     if status.missing:
-        console.print("\n[red]Missing source files:[/red]")
+        lines.append("\n[red]Missing source files:[/red]")
         for entry, path in status.missing:
-            console.print(f"  ✗ {entry.slug}")
-            console.print(f"    Source: {path}")
+            lines.append(f"  ✗ {entry.slug}")
+            lines.append(f"    Source: {path}")
 
     if status.stale:
-        console.print("\n[yellow]Stale papers:[/yellow]")
+        lines.append("\n[yellow]Stale papers:[/yellow]")
         for entry, stale_path, reason in status.stale:
-            console.print(f"  • {entry.slug} ({reason})")
-            console.print(f"    Source: {stale_path}")
+            lines.append(f"  • {entry.slug} ({reason})")
+            lines.append(f"    Source: {stale_path}")
+
+    console.print("\n".join(lines))
 
 
 def sync_papers(
@@ -213,28 +431,32 @@ def sync_papers(
             return
 
         result, source_path = check_paper_staleness(entry)
-        if result == "missing":
+        if result is SyncStatusCode.MISSING:
             console.print(f"[red]Source file missing: {entry.source_path}[/red]")
             return
-        if result == "skipped":
+        if result is SyncStatusCode.SKIPPED:
             console.print(f"[yellow]Paper {slug} has directory source (cannot sync)[/yellow]")
             return
-        if result == "up_to_date":
+        if result is SyncStatusCode.UP_TO_DATE:
             console.print(f"[green]Paper {slug} is up to date[/green]")
             return
         if source_path is None:
             console.print(f"[red]No source path for paper {slug}[/red]")
             return
 
-        console.print(f"Paper {slug} is stale ({result})")
+        console.print(f"Paper {slug} is stale ({result.value})")
         if process_stale_paper(slug, source_path, auto_yes, dry_run, timeout):
             console.print(f"[green]Successfully processed {slug}[/green]")
         return
 
     console.print(f"Checking {len(db)} papers for changes...")
 
-    # Check staleness
-    status = check_all_papers(db)
+    # Check staleness, reusing results for papers unchanged since last sync
+    manifest_path = get_paths().sync_manifest
+    manifest = load_sync_manifest(manifest_path)
+    status = check_all_papers(db, manifest=manifest)
+    if not dry_run:
+        save_sync_manifest(manifest_path, manifest)
     print_sync_status(status)
 
     if not status.stale:
@@ -263,7 +485,7 @@ def sync_papers(
 
 
 def _process_papers_sequential(
-    stale_papers: list[tuple[PaperEntry, Path, str]],
+    stale_papers: list[tuple[PaperEntry, str, str]],
     auto_yes: bool,
     dry_run: bool,
     timeout: int,
@@ -294,7 +516,7 @@ def _process_papers_sequential(
 
 
 def _process_papers_parallel(
-    stale_papers: list[tuple[PaperEntry, Path, str]],
+    stale_papers: list[tuple[PaperEntry, str, str]],
     auto_yes: bool,
     dry_run: bool,
     workers: int,
@@ -381,7 +603,7 @@ def _process_papers_parallel(
 
 def _process_single_paper_with_timeout(
     slug: str,
-    source_path: Path,
+    source_path: str | Path,
     auto_yes: bool,
     dry_run: bool,
     timeout: int,
@@ -474,7 +696,7 @@ sys.exit(0 if success else 1)
 
 def process_stale_paper(
     slug: str,
-    source_path: Path,
+    source_path: str | Path,
     auto_yes: bool = False,
     dry_run: bool = False,
     timeout: int = DEFAULT_TIMEOUT,
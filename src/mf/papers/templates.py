@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from mf.core.yaml_utils import yaml_escape
+
 PAPER_TEMPLATE = '''---
 title: "{title}"
 slug: "{slug}"
@@ -193,7 +195,7 @@ def format_yaml_list(items: list[str], indent: int = 2) -> str:
     if not items:
         return "[]"
     prefix = " " * indent
-    return "\n" + "\n".join(f'{prefix}- "{item}"' for item in items)
+    return "\n" + "\n".join(f'{prefix}- "{yaml_escape(item)}"' for item in items)
 
 
 def render_frontmatter_field(
@@ -225,9 +227,36 @@ def render_frontmatter_field(
     if isinstance(value, (int, float)):
         return f"{key}: {value}\n"
 
-    # String value - escape quotes
-    value = str(value).replace('"', '\\"')
-    return f'{key}: "{value}"\n'
+    return f'{key}: "{yaml_escape(value)}"\n'
+
+
+# Optional quoted-string fields, rendered only when set. The template
+# placeholder and metadata key share the same name.
+_OPTIONAL_STRING_FIELDS = (
+    "category",
+    "venue",
+    "status",
+    "arxiv_id",
+    "doi",
+    "github_url",
+    "project_url",
+    "external_url",
+    "image",
+)
+
+# Template placeholder -> metadata key for list fields.
+_LIST_FIELDS = {
+    "authors": "authors",
+    "keywords": "tags",
+    "genres": "genres",
+}
+
+
+def _render_list_field(key: str, items: list[Any]) -> str:
+    """Render a non-empty list field as a block sequence of quoted strings."""
+    if not items:
+        return ""
+    return f"{key}:" + format_yaml_list(items) + "\n"
 
 
 def render_paper_frontmatter(
@@ -239,6 +268,9 @@ def render_paper_frontmatter(
 ) -> dict[str, str]:
     """Render frontmatter substitution variables.
 
+    Every value is pre-escaped, so the result can be passed straight to
+    ``PAPER_TEMPLATE.format`` without going through a YAML dumper.
+
     Args:
         slug: Paper slug
         metadata: Paper metadata dict
@@ -249,112 +281,44 @@ def render_paper_frontmatter(
     Returns:
         Dict of template substitution variables
     """
-    # Escape title for YAML
-    title = metadata.get("title", slug).replace('"', '\\"')
-
-    # Format authors
-    authors = metadata.get("authors", [])
-    authors_str = ""
-    if authors:
-        authors_str = "authors:\n" + "\n".join(f'  - "{a}"' for a in authors) + "\n"
-
-    # Format abstract
-    abstract = metadata.get("abstract", "")
-    abstract_str = ""
-    if abstract:
-        # Escape for YAML
-        abstract = abstract.replace('"', '\\"').replace("\n", " ")
-        abstract_str = f'abstract: "{abstract}"\n'
-
-    # Format keywords/tags
-    keywords = metadata.get("tags", [])
-    keywords_str = ""
-    if keywords:
-        keywords_str = "tags:\n" + "\n".join(f'  - "{k}"' for k in keywords) + "\n"
-
-    # Format genres taxonomy
-    genres = metadata.get("genres", [])
-    genres_str = ""
-    if genres:
-        genres_str = "genres:\n" + "\n".join(f'  - "{g}"' for g in genres) + "\n"
-
-    # Optional fields
-    category = metadata.get("category", "")
-    category_str = f'category: "{category}"\n' if category else ""
-
-    stars = metadata.get("stars")
-    stars_str = f"stars: {stars}\n" if stars else ""
-
-    venue = metadata.get("venue", "")
-    venue_str = f'venue: "{venue}"\n' if venue else ""
-
-    status = metadata.get("status", "")
-    status_str = f'status: "{status}"\n' if status else ""
-
-    featured = metadata.get("featured", False)
-    featured_str = "featured: true\n" if featured else ""
-
-    arxiv_id = metadata.get("arxiv_id", "")
-    arxiv_str = f'arxiv_id: "{arxiv_id}"\n' if arxiv_id else ""
-
-    doi = metadata.get("doi", "")
-    doi_str = f'doi: "{doi}"\n' if doi else ""
-
-    github_url = metadata.get("github_url", "")
-    github_str = f'github_url: "{github_url}"\n' if github_url else ""
+    substitutions: dict[str, Any] = {
+        "title": yaml_escape(metadata.get("title", slug)),
+        "slug": slug,
+        "date": metadata.get("date", "2024-01-01"),
+        "pdf_file": pdf_file,
+        "pdf_size": pdf_size,
+        "page_count": page_count,
+    }
 
-    project_url = metadata.get("project_url", "")
-    project_str = f'project_url: "{project_url}"\n' if project_url else ""
+    for placeholder, key in _LIST_FIELDS.items():
+        substitutions[placeholder] = _render_list_field(key, metadata.get(key, []))
 
-    external_url = metadata.get("external_url", "")
-    external_str = f'external_url: "{external_url}"\n' if external_url else ""
+    for key in _OPTIONAL_STRING_FIELDS:
+        value = metadata.get(key, "")
+        substitutions[key] = f'{key}: "{yaml_escape(value)}"\n' if value else ""
 
-    image = metadata.get("image", "")
-    image_str = f'image: "{image}"\n' if image else ""
+    # Abstract is folded onto a single line
+    abstract = metadata.get("abstract", "").replace("\n", " ")
+    substitutions["abstract"] = f'abstract: "{yaml_escape(abstract)}"\n' if abstract else ""
 
-    # Date
-    date = metadata.get("date", "2024-01-01")
+    stars = metadata.get("stars")
+    substitutions["stars"] = f"stars: {stars}\n" if stars else ""
+    substitutions["featured"] = "featured: true\n" if metadata.get("featured", False) else ""
+    substitutions["draft"] = "draft: true\n" if metadata.get("draft", False) else ""
 
     # Aliases for Hugo redirects
     aliases = metadata.get("aliases", [])
-    aliases_str = ""
-    if aliases:
-        aliases_str = "aliases:\n" + "\n".join(f'  - {a}' for a in aliases) + "\n"
-
-    # Draft status
-    draft = metadata.get("draft", False)
-    draft_str = "draft: true\n" if draft else ""
+    substitutions["aliases"] = (
+        "aliases:\n" + "\n".join(f"  - {a}" for a in aliases) + "\n" if aliases else ""
+    )
 
     # Action bar links
-    pdf_link = f'<a href="/latex/{slug}/{pdf_file}" target="_blank" rel="noopener">Download PDF</a>\n  '
-    arxiv_link = ""
-    if arxiv_id:
-        arxiv_link = f'<a href="https://arxiv.org/abs/{arxiv_id}" target="_blank" rel="noopener">arXiv</a>'
+    substitutions["pdf_link"] = f'<a href="/latex/{slug}/{pdf_file}" target="_blank" rel="noopener">Download PDF</a>\n  '
+    arxiv_id = metadata.get("arxiv_id", "")
+    substitutions["arxiv_link"] = (
+        f'<a href="https://arxiv.org/abs/{arxiv_id}" target="_blank" rel="noopener">arXiv</a>'
+        if arxiv_id
+        else ""
+    )
 
-    return {
-        "title": title,
-        "slug": slug,
-        "date": date,
-        "aliases": aliases_str,
-        "draft": draft_str,
-        "authors": authors_str,
-        "abstract": abstract_str,
-        "keywords": keywords_str,
-        "genres": genres_str,
-        "category": category_str,
-        "stars": stars_str,
-        "venue": venue_str,
-        "status": status_str,
-        "featured": featured_str,
-        "arxiv_id": arxiv_str,
-        "doi": doi_str,
-        "github_url": github_str,
-        "project_url": project_str,
-        "external_url": external_str,
-        "image": image_str,
-        "pdf_file": pdf_file,
-        "pdf_size": pdf_size,
-        "page_count": page_count,
-        "pdf_link": pdf_link,
-        "arxiv_link": arxiv_link,
-    }
+    return substitutions
@@ -25,15 +25,19 @@ Usage:
 from __future__ import annotations
 
 import json
+import random
 import time
 import urllib.parse
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
 console = Console()
@@ -146,19 +150,33 @@ def _extract_last_name(author: Any) -> str:
     return parts[-1].lower() if parts else ""
 
 
-def compute_match_score(
-    paper_title: str,
-    paper_authors: list[Any],
+@lru_cache(maxsize=4096)
+def normalize_title(title: str) -> str:
+    """Normalize a title for similarity comparison."""
+    return title.lower().strip()
+
+
+def author_last_names(authors: list[Any]) -> frozenset[str]:
+    """Collect normalized, non-empty last names from an author list."""
+    names = {_extract_last_name(a) for a in authors}
+    names.discard("")
+    return frozenset(names)
+
+
+def compute_match_score_normalized(
+    paper_title_norm: str,
+    paper_last_names: frozenset[str],
     record_title: str,
     record_creators: list[dict[str, str]],
 ) -> float:
-    """Compute a match confidence score between a paper and a Zenodo record.
+    """Score a Zenodo record against a pre-normalized paper.
 
-    Uses title similarity (70% weight) and author name overlap (30% weight).
+    Use this when scoring many records for the same paper: normalize the
+    paper once with ``normalize_title`` and ``author_last_names``.
 
     Args:
-        paper_title: Title from local paper database
-        paper_authors: Authors list (strings or dicts with "name" key)
+        paper_title_norm: Normalized title from local paper database
+        paper_last_names: Normalized author last names of the paper
         record_title: Title from Zenodo record
         record_creators: Creators from Zenodo record (dicts with "name" key)
 
@@ -168,15 +186,12 @@ def compute_match_score(
     # Title similarity (70% weight)
     title_score = SequenceMatcher(
         None,
-        paper_title.lower().strip(),
-        record_title.lower().strip(),
+        paper_title_norm,
+        normalize_title(record_title),
     ).ratio()
 
     # Author overlap (30% weight)
-    paper_last_names = {_extract_last_name(a) for a in paper_authors}
-    paper_last_names.discard("")
-    record_last_names = {_extract_last_name(c) for c in record_creators}
-    record_last_names.discard("")
+    record_last_names = author_last_names(record_creators)
 
     if paper_last_names and record_last_names:
         overlap = paper_last_names & record_last_names
@@ -191,6 +206,33 @@ def compute_match_score(
     return 0.7 * title_score + 0.3 * author_score
 
 
+def compute_match_score(
+    paper_title: str,
+    paper_authors: list[Any],
+    record_title: str,
+    record_creators: list[dict[str, str]],
+) -> float:
+    """Compute a match confidence score between a paper and a Zenodo record.
+
+    Uses title similarity (70% weight) and author name overlap (30% weight).
+
+    Args:
+        paper_title: Title from local paper database
+        paper_authors: Authors list (strings or dicts with "name" key)
+        record_title: Title from Zenodo record
+        record_creators: Creators from Zenodo record (dicts with "name" key)
+
+    Returns:
+        Float between 0.0 and 1.0
+    """
+    return compute_match_score_normalized(
+        normalize_title(paper_title),
+        author_last_names(paper_authors),
+        record_title,
+        record_creators,
+    )
+
+
 # Mapping from paper categories to Zenodo upload types
 CATEGORY_TO_UPLOAD_TYPE: dict[str, tuple[str, str | None]] = {
     # (upload_type, publication_type)
@@ -354,24 +396,75 @@ class ZenodoClient:
     PRODUCTION_URL = "https://zenodo.org/api"
     SANDBOX_URL = "https://sandbox.zenodo.org/api"
 
-    def __init__(self, api_token: str, sandbox: bool = False):
+    # Connection pool sizing for bulk operations against a single host
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+
+    def __init__(
+        self,
+        api_token: str,
+        sandbox: bool = False,
+        sleeper: Callable[[float], None] = time.sleep,
+    ):
         """Initialize Zenodo client.
 
         Args:
             api_token: Zenodo API token
             sandbox: Use sandbox.zenodo.org for testing
+            sleeper: Function used to wait between rate-limit retries
         """
         self.api_token = api_token
         self.sandbox = sandbox
+        self._sleeper = sleeper
         self.base_url = self.SANDBOX_URL if sandbox else self.PRODUCTION_URL
         self._session = requests.Session()
         self._session.headers.update({
             "Authorization": f"Bearer {api_token}",
         })
+        # Retries are handled in _request, so the adapter must not retry
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=0,
+        )
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> ZenodoClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     # Retry config for 429 rate-limit responses
     MAX_RETRIES = 3
     RETRY_BACKOFF_BASE = 2.0  # seconds; doubles each retry
+    RETRY_BACKOFF_MAX = 30.0  # cap on computed backoff, before jitter
+
+    def _retry_delay(self, retry_after: str | None, attempt: int) -> float:
+        """Compute the wait before retrying a rate-limited request.
+
+        A numeric Retry-After header is honored as-is. Otherwise the delay
+        is capped exponential backoff with +/-50% jitter, so concurrent
+        runs do not retry in lockstep.
+
+        Args:
+            retry_after: Value of the Retry-After header, if any
+            attempt: Zero-based attempt number that was rate limited
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        delay = min(self.RETRY_BACKOFF_MAX, self.RETRY_BACKOFF_BASE * 2.0**attempt)
+        return delay * random.uniform(0.5, 1.5)
 
     def _request(
         self,
@@ -414,19 +507,12 @@ class ZenodoClient:
 
             # Retry on 429 rate limit
             if response.status_code == 429 and attempt < self.MAX_RETRIES:
-                retry_after = response.headers.get("Retry-After")
-                if retry_after:
-                    try:
-                        wait = float(retry_after)
-                    except ValueError:
-                        wait = self.RETRY_BACKOFF_BASE * (2 ** attempt)
-                else:
-                    wait = self.RETRY_BACKOFF_BASE * (2 ** attempt)
+                wait = self._retry_delay(response.headers.get("Retry-After"), attempt)
                 console.print(
                     f"[yellow]Rate limited, retrying in {wait:.0f}s "
                     f"(attempt {attempt + 1}/{self.MAX_RETRIES})...[/yellow]"
                 )
-                time.sleep(wait)
+                self._sleeper(wait)
                 continue
 
             break  # Not a 429, or exhausted retries
@@ -6,18 +6,28 @@ Uses ContentScanner for reading and FrontMatterEditor for writing.
 
 from __future__ import annotations
 
-import json as json_module
 import re
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
 from rich.console import Console
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from mf.content.frontmatter import FrontMatterEditor
+    from mf.content.scanner import ContentItem
+
 console = Console()
 
 
+class PostNotFoundError(KeyError):
+    """No post matches the requested slug."""
+
+
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
@@ -115,61 +125,65 @@ def _find_post_file(slug: str) -> Path | None:
 
 
 # ---------------------------------------------------------------------------
-# Click command group
+# Post operations
+#
+# Plain functions behind the Click commands, callable without a CLI context.
 # ---------------------------------------------------------------------------
 
 
-@click.group(name="posts")
-def posts() -> None:
-    """Manage blog posts.
+def _open_post(slug: str) -> FrontMatterEditor:
+    """Load a front matter editor for the post matching *slug*.
 
-    Convenience layer over Hugo content files -- no database.
+    Raises:
+        PostNotFoundError: If no post matches *slug*
+        RuntimeError: If the post's front matter cannot be loaded
     """
-    pass
+    from mf.content.frontmatter import FrontMatterEditor
 
+    path = _find_post_file(slug)
+    if path is None:
+        raise PostNotFoundError(slug)
 
-# ---------------------------------------------------------------------------
-# mf posts list
-# ---------------------------------------------------------------------------
+    editor = FrontMatterEditor(path)
+    if not editor.load():
+        raise RuntimeError(f"Could not load front matter: {path}")
+    return editor
 
 
-@posts.command(name="list")
-@click.option("-q", "--query", default=None, help="Full-text search in title/body")
-@click.option("-t", "--tag", multiple=True, help="Filter by tag (can repeat)")
-@click.option("-c", "--category", multiple=True, help="Filter by category (can repeat)")
-@click.option("--series", "series_slug", default=None, help="Filter by series slug")
-@click.option("--featured", is_flag=True, help="Only featured posts")
-@click.option("--include-drafts", is_flag=True, help="Include draft posts")
-@click.option(
-    "--since", default=None, help="Only posts since date (YYYY-MM-DD or 30d/4w/3m)"
-)
-@click.option("--json", "as_json", is_flag=True, help="Output as JSON array")
-def list_posts(
-    query: str | None,
-    tag: tuple[str, ...],
-    category: tuple[str, ...],
-    series_slug: str | None,
-    featured: bool,
-    include_drafts: bool,
-    since: str | None,
-    as_json: bool,
-) -> None:
-    """List blog posts with optional filters."""
+def _save_post(editor: FrontMatterEditor) -> None:
+    """Save an editor's changes.
+
+    Raises:
+        RuntimeError: If the file cannot be written
+    """
+    if not editor.save():
+        raise RuntimeError("Failed to save.")
+
+
+def _filter_posts(
+    query: str | None = None,
+    tags: tuple[str, ...] = (),
+    categories: tuple[str, ...] = (),
+    series_slug: str | None = None,
+    featured: bool = False,
+    include_drafts: bool = False,
+    since: str | None = None,
+) -> list[ContentItem]:
+    """Scan posts, apply filters, and sort newest first."""
     from mf.content.scanner import ContentScanner
 
     scanner = ContentScanner()
     items = scanner.scan_type("post", include_drafts=include_drafts)
 
-    # --- filters ---
     if query:
         items = [it for it in items if it.mentions_text(query)]
 
-    if tag:
-        tag_set = set(tag)
+    if tags:
+        tag_set = set(tags)
         items = [it for it in items if tag_set & set(it.tags)]
 
-    if category:
-        cat_set = set(category)
+    if categories:
+        cat_set = set(categories)
         items = [it for it in items if cat_set & set(it.categories)]
 
     if series_slug:
@@ -199,29 +213,217 @@ def list_posts(
         items = filtered
 
     # Sort newest first
-    def _sort_key(item):
+    def _sort_key(item: ContentItem) -> str:
         d = item.date
         return str(d)[:10] if d else ""
 
     items.sort(key=_sort_key, reverse=True)
+    return items
+
+
+def _show_post(slug: str) -> dict[str, Any]:
+    """Return the full front matter of the post matching *slug*.
+
+    Raises:
+        PostNotFoundError: If no post matches *slug*
+        RuntimeError: If the post's front matter cannot be loaded
+    """
+    return dict(_open_post(slug).front_matter)
+
+
+def _post_to_dict(item: ContentItem) -> dict[str, Any]:
+    """Summarize a post for JSON output."""
+    return {
+        "slug": item.slug,
+        "title": item.title,
+        "date": item.date,
+        "tags": item.tags,
+        "categories": item.categories,
+        "series": item.front_matter.get("series", []),
+        "featured": bool(item.front_matter.get("featured")),
+        "draft": item.is_draft,
+    }
+
+
+def _create_post_file(
+    title: str,
+    slug: str | None = None,
+    date: str | None = None,
+    tags: tuple[str, ...] = (),
+    categories: tuple[str, ...] = (),
+    series: tuple[str, ...] = (),
+    description: str | None = None,
+    featured: bool = False,
+) -> Path:
+    """Write a new draft post and return its ``index.md`` path.
+
+    Raises:
+        FileExistsError: If a post with the same date and slug exists
+    """
+    import yaml
+
+    from mf.core.config import get_paths
+
+    if slug is None:
+        slug = _slugify(title)
+
+    if date is None:
+        date = datetime.now().strftime("%Y-%m-%d")
+
+    post_dir = get_paths().posts / f"{date}-{slug}"
+    index_file = post_dir / "index.md"
+
+    if index_file.exists():
+        raise FileExistsError(index_file)
+
+    # Build front matter
+    fm: dict = {
+        "title": title,
+        "date": date,
+        "draft": True,
+    }
+    if tags:
+        fm["tags"] = list(tags)
+    if categories:
+        fm["categories"] = list(categories)
+    if series:
+        fm["series"] = list(series)
+    if description:
+        fm["description"] = description
+    if featured:
+        fm["featured"] = True
+
+    fm_str = yaml.dump(fm, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    content = f"---\n{fm_str}---\n\n"
+
+    post_dir.mkdir(parents=True, exist_ok=True)
+    index_file.write_text(content, encoding="utf-8")
+    return index_file
+
+
+def _set_post_field(slug: str, field: str, value: str) -> Any:
+    """Set a front matter field from its string form; return the coerced value."""
+    editor = _open_post(slug)
+    coerced = _coerce_value(value)
+    editor.set(field, coerced)
+    _save_post(editor)
+    return coerced
+
+
+def _unset_post_field(slug: str, field: str) -> bool:
+    """Remove a front matter field; return False if it was not present."""
+    editor = _open_post(slug)
+    if field not in editor.front_matter:
+        return False
+    del editor.front_matter[field]
+    _save_post(editor)
+    return True
+
+
+def _update_post_tags(
+    slug: str,
+    add: tuple[str, ...] = (),
+    remove: tuple[str, ...] = (),
+    set_tags: str | None = None,
+) -> list[str]:
+    """Add/remove tags, or replace them from a comma-separated string.
+
+    Returns:
+        The post's tags after the update
+    """
+    editor = _open_post(slug)
+    if set_tags is not None:
+        new_tags = [t.strip() for t in set_tags.split(",") if t.strip()]
+        editor.set("tags", new_tags)
+    else:
+        for t in add:
+            editor.add_to_list("tags", t)
+        for t in remove:
+            editor.remove_from_list("tags", t)
+    _save_post(editor)
+    tags: list[str] = editor.front_matter.get("tags", [])
+    return tags
+
+
+def _set_post_featured(slug: str, featured: bool = True) -> None:
+    """Mark a post as featured, or remove the flag."""
+    editor = _open_post(slug)
+    if featured:
+        editor.set("featured", True)
+    elif "featured" in editor.front_matter:
+        del editor.front_matter["featured"]
+    _save_post(editor)
+
+
+@contextmanager
+def _post_errors(slug: str) -> Iterator[None]:
+    """Report post operation errors and exit with status 1."""
+    try:
+        yield
+    except PostNotFoundError:
+        console.print(f"[red]Post not found: {slug}[/red]")
+        raise SystemExit(1) from None
+    except RuntimeError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1) from None
+
+
+# ---------------------------------------------------------------------------
+# Click command group
+# ---------------------------------------------------------------------------
+
+
+@click.group(name="posts")
+def posts() -> None:
+    """Manage blog posts.
+
+    Convenience layer over Hugo content files -- no database.
+    """
+    pass
+
+
+# ---------------------------------------------------------------------------
+# mf posts list
+# ---------------------------------------------------------------------------
+
+
+@posts.command(name="list")
+@click.option("-q", "--query", default=None, help="Full-text search in title/body")
+@click.option("-t", "--tag", multiple=True, help="Filter by tag (can repeat)")
+@click.option("-c", "--category", multiple=True, help="Filter by category (can repeat)")
+@click.option("--series", "series_slug", default=None, help="Filter by series slug")
+@click.option("--featured", is_flag=True, help="Only featured posts")
+@click.option("--include-drafts", is_flag=True, help="Include draft posts")
+@click.option(
+    "--since", default=None, help="Only posts since date (YYYY-MM-DD or 30d/4w/3m)"
+)
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON array")
+def list_posts(
+    query: str | None,
+    tag: tuple[str, ...],
+    category: tuple[str, ...],
+    series_slug: str | None,
+    featured: bool,
+    include_drafts: bool,
+    since: str | None,
+    as_json: bool,
+) -> None:
+    """List blog posts with optional filters."""
+    items = _filter_posts(
+        query=query,
+        tags=tag,
+        categories=category,
+        series_slug=series_slug,
+        featured=featured,
+        include_drafts=include_drafts,
+        since=since,
+    )
 
-    # --- output ---
     if as_json:
-        output = []
-        for it in items:
-            output.append(
-                {
-                    "slug": it.slug,
-                    "title": it.title,
-                    "date": it.date,
-                    "tags": it.tags,
-                    "categories": it.categories,
-                    "series": it.front_matter.get("series", []),
-                    "featured": bool(it.front_matter.get("featured")),
-                    "draft": it.is_draft,
-                }
-            )
-        click.echo(json_module.dumps(output, indent=2, default=str))
+        from mf.core.jsonio import dumps_json
+
+        output = [_post_to_dict(it) for it in items]
+        click.echo(dumps_json(output, default=str))
         return
 
     if not items:
@@ -257,6 +459,32 @@ def list_posts(
     console.print(table)
 
 
+# ---------------------------------------------------------------------------
+# mf posts show
+# ---------------------------------------------------------------------------
+
+
+@posts.command(name="show")
+@click.argument("slug")
+@click.option("--json", "as_json", is_flag=True, help="Output front matter as JSON")
+def show_post(slug: str, as_json: bool) -> None:
+    """Show the front matter of a post."""
+    from mf.core.jsonio import dumps_json
+
+    with _post_errors(slug):
+        fm = _show_post(slug)
+
+    if as_json:
+        click.echo(dumps_json(fm, default=str))
+        return
+
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
+    syntax = Syntax(dumps_json(fm, default=str), "json", theme="monokai")
+    console.print(Panel(syntax, title=f"Post: {slug}"))
+
+
 # ---------------------------------------------------------------------------
 # mf posts create
 # ---------------------------------------------------------------------------
@@ -286,47 +514,20 @@ def create_post(
     featured: bool,
 ) -> None:
     """Scaffold a new blog post."""
-    import yaml
-
-    from mf.core.config import get_paths
-
-    if slug is None:
-        slug = _slugify(title)
-
-    if date is None:
-        date = datetime.now().strftime("%Y-%m-%d")
-
-    dir_name = f"{date}-{slug}"
-    posts_dir = get_paths().posts
-    post_dir = posts_dir / dir_name
-    index_file = post_dir / "index.md"
-
-    if index_file.exists():
-        console.print(f"[red]Post already exists: {index_file}[/red]")
-        raise SystemExit(1)
-
-    # Build front matter
-    fm: dict = {
-        "title": title,
-        "date": date,
-        "draft": True,
-    }
-    if tag:
-        fm["tags"] = list(tag)
-    if category:
-        fm["categories"] = list(category)
-    if series:
-        fm["series"] = list(series)
-    if description:
-        fm["description"] = description
-    if featured:
-        fm["featured"] = True
-
-    fm_str = yaml.dump(fm, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    content = f"---\n{fm_str}---\n\n"
-
-    post_dir.mkdir(parents=True, exist_ok=True)
-    index_file.write_text(content, encoding="utf-8")
+    try:
+        index_file = _create_post_file(
+            title,
+            slug=slug,
+            date=date,
+            tags=tag,
+            categories=category,
+            series=series,
+            description=description,
+            featured=featured,
+        )
+    except FileExistsError as e:
+        console.print(f"[red]Post already exists: {e}[/red]")
+        raise SystemExit(1) from None
 
     console.print(f"[green]Created:[/green] {index_file}")
     console.print()
@@ -350,24 +551,9 @@ def set_field(slug: str, field: str, value: str) -> None:
 
     Values are auto-coerced: true/false -> bool, integers, floats, else string.
     """
-    from mf.content.frontmatter import FrontMatterEditor
-
-    path = _find_post_file(slug)
-    if path is None:
-        console.print(f"[red]Post not found: {slug}[/red]")
-        raise SystemExit(1)
-
-    editor = FrontMatterEditor(path)
-    if not editor.load():
-        raise SystemExit(1)
-
-    coerced = _coerce_value(value)
-    editor.set(field, coerced)
-    if editor.save():
-        console.print(f"[green]Set[/green] {field}={coerced!r} on [cyan]{slug}[/cyan]")
-    else:
-        console.print("[red]Failed to save.[/red]")
-        raise SystemExit(1)
+    with _post_errors(slug):
+        coerced = _set_post_field(slug, field, value)
+    console.print(f"[green]Set[/green] {field}={coerced!r} on [cyan]{slug}[/cyan]")
 
 
 # ---------------------------------------------------------------------------
@@ -380,27 +566,12 @@ def set_field(slug: str, field: str, value: str) -> None:
 @click.argument("field")
 def unset_field(slug: str, field: str) -> None:
     """Remove a front matter field from a post."""
-    from mf.content.frontmatter import FrontMatterEditor
-
-    path = _find_post_file(slug)
-    if path is None:
-        console.print(f"[red]Post not found: {slug}[/red]")
-        raise SystemExit(1)
-
-    editor = FrontMatterEditor(path)
-    if not editor.load():
-        raise SystemExit(1)
-
-    if field not in editor.front_matter:
-        console.print(f"[yellow]Field '{field}' not present on {slug}[/yellow]")
-        return
-
-    del editor.front_matter[field]
-    if editor.save():
+    with _post_errors(slug):
+        removed = _unset_post_field(slug, field)
+    if removed:
         console.print(f"[green]Removed[/green] '{field}' from [cyan]{slug}[/cyan]")
     else:
-        console.print("[red]Failed to save.[/red]")
-        raise SystemExit(1)
+        console.print(f"[yellow]Field '{field}' not present on {slug}[/yellow]")
 
 
 # ---------------------------------------------------------------------------
@@ -420,34 +591,9 @@ def manage_tags(
     set_tags: str | None,
 ) -> None:
     """Manage tags on a post."""
-    from mf.content.frontmatter import FrontMatterEditor
-
-    path = _find_post_file(slug)
-    if path is None:
-        console.print(f"[red]Post not found: {slug}[/red]")
-        raise SystemExit(1)
-
-    editor = FrontMatterEditor(path)
-    if not editor.load():
-        raise SystemExit(1)
-
-    if set_tags is not None:
-        new_tags = [t.strip() for t in set_tags.split(",") if t.strip()]
-        editor.set("tags", new_tags)
-    else:
-        for t in add:
-            editor.add_to_list("tags", t)
-        for t in remove:
-            editor.remove_from_list("tags", t)
-
-    if editor.save():
-        console.print(
-            f"[green]Updated tags[/green] on [cyan]{slug}[/cyan]: "
-            f"{editor.front_matter.get('tags', [])}"
-        )
-    else:
-        console.print("[red]Failed to save.[/red]")
-        raise SystemExit(1)
+    with _post_errors(slug):
+        tags = _update_post_tags(slug, add=add, remove=remove, set_tags=set_tags)
+    console.print(f"[green]Updated tags[/green] on [cyan]{slug}[/cyan]: {tags}")
 
 
 # ---------------------------------------------------------------------------
@@ -460,26 +606,7 @@ def manage_tags(
 @click.option("--off", is_flag=True, help="Remove featured status")
 def feature_post(slug: str, off: bool) -> None:
     """Toggle featured status on a post."""
-    from mf.content.frontmatter import FrontMatterEditor
-
-    path = _find_post_file(slug)
-    if path is None:
-        console.print(f"[red]Post not found: {slug}[/red]")
-        raise SystemExit(1)
-
-    editor = FrontMatterEditor(path)
-    if not editor.load():
-        raise SystemExit(1)
-
-    if off:
-        if "featured" in editor.front_matter:
-            del editor.front_matter["featured"]
-    else:
-        editor.set("featured", True)
-
-    if editor.save():
-        status = "unfeatured" if off else "featured"
-        console.print(f"[green]{status.capitalize()}[/green] [cyan]{slug}[/cyan]")
-    else:
-        console.print("[red]Failed to save.[/red]")
-        raise SystemExit(1)
+    with _post_errors(slug):
+        _set_post_featured(slug, featured=not off)
+    status = "unfeatured" if off else "featured"
+    console.print(f"[green]{status.capitalize()}[/green] [cyan]{slug}[/cyan]")
@@ -34,11 +34,97 @@ Example codemeta.json:
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+import re
+import sys
+import threading
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urlsplit
+
+# Optional faster JSON parsers. simdjson parses on demand, so only the
+# fields in _CODEMETA_KEYS are ever turned into Python objects.
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# License families recognized in free-text license strings, matched in one
+# case-insensitive pass. "General Public License" is folded into GPL.
+_LICENSE_FAMILY_RE = re.compile(r"MIT|APACHE|GPL|GENERAL PUBLIC LICENSE|BSD", re.IGNORECASE)
+
+# Canonical copies of the small license/status vocabularies, so values
+# sliced out of URLs share one string object across parsed projects
+_SPDX_IDS = {
+    s: s
+    for s in map(
+        sys.intern,
+        (
+            "MIT",
+            "Apache-2.0",
+            "GPL-2.0",
+            "GPL-3.0",
+            "LGPL-2.1",
+            "LGPL-3.0",
+            "AGPL-3.0",
+            "BSD-2-Clause",
+            "BSD-3-Clause",
+            "MPL-2.0",
+            "ISC",
+            "Unlicense",
+            "CC0-1.0",
+        ),
+    )
+}
+_STATUS_VALUES = {
+    s: s
+    for s in map(
+        sys.intern,
+        (
+            "concept",
+            "wip",
+            "suspended",
+            "abandoned",
+            "active",
+            "inactive",
+            "unsupported",
+            "moved",
+        ),
+    )
+}
 
-
-@dataclass
+# Top-level codemeta keys read by parse_codemeta
+_CODEMETA_KEYS = (
+    "name",
+    "description",
+    "author",
+    "programmingLanguage",
+    "license",
+    "keywords",
+    "version",
+    "dateCreated",
+    "dateModified",
+    "codeRepository",
+    "developmentStatus",
+    "softwareRequirements",
+    "runtimePlatform",
+    "operatingSystem",
+    "identifier",
+    "citation",
+    "readme",
+    "issueTracker",
+    "funding",
+)
+
+
+@dataclass(slots=True)
 class CodeMetadata:
     """Parsed codemeta.json data.
 
@@ -68,24 +154,39 @@ class CodeMetadata:
     funding: list[dict[str, Any]] = field(default_factory=list)
 
 
+# List-valued CodeMetadata fields, copied out of the parse cache per call
+_LIST_FIELDS = tuple(f for f in fields(CodeMetadata) if f.default_factory is list)
+
+
 def parse_codemeta(content: str) -> CodeMetadata:
     """Parse codemeta.json content.
 
+    Parses are memoized by content; each call returns its own copy, so
+    callers may mutate the result freely.
+
     Args:
         content: Raw JSON content from codemeta.json file
 
     Returns:
         CodeMetadata with parsed fields
     """
-    if not content or not content.strip():
+    # Blank or literal-null files skip the parser and the cache entirely
+    if not content or content.strip() in ("", "null"):
         return CodeMetadata()
 
-    try:
-        data = json.loads(content)
-    except json.JSONDecodeError:
-        return CodeMetadata()
+    cm = _parse_codemeta_cached(content)
+    copies: dict[str, Any] = {
+        f.name: [dict(v) if isinstance(v, dict) else v for v in getattr(cm, f.name)]
+        for f in _LIST_FIELDS
+    }
+    return replace(cm, **copies)
 
-    if not data or not isinstance(data, dict):
+
+@lru_cache(maxsize=128)
+def _parse_codemeta_cached(content: str) -> CodeMetadata:
+    """Parse codemeta.json content; the result is shared and must not be mutated."""
+    data = _load_codemeta_object(content)
+    if not data:
         return CodeMetadata()
 
     return CodeMetadata(
@@ -112,6 +213,61 @@ def parse_codemeta(content: str) -> CodeMetadata:
     )
 
 
+# simdjson parsers are not thread-safe, and parse() invalidates the
+# previous document, so each thread gets its own
+_simdjson_local = threading.local()
+
+
+def _simdjson_parser() -> simdjson.Parser:
+    """Return the calling thread's reusable simdjson parser."""
+    parser = getattr(_simdjson_local, "parser", None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    return parser
+
+
+def _load_codemeta_object(content: str) -> dict[str, Any] | None:
+    """Decode codemeta JSON into a dict of the keys parse_codemeta reads.
+
+    Returns:
+        Dict of the present ``_CODEMETA_KEYS``, or None if the content is
+        not valid JSON or not a JSON object
+    """
+    if not HAS_SIMDJSON:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        try:
+            data = orjson.loads(content) if HAS_ORJSON else json.loads(content)
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    raw = content.encode()
+    try:
+        try:
+            doc = _simdjson_parser().parse(raw)
+        except RuntimeError:
+            # This thread's parser is still referenced; use a private one
+            doc = simdjson.Parser().parse(raw)
+    except ValueError:
+        return None
+
+    if not isinstance(doc, simdjson.Object):
+        return None
+
+    # One lookup per key; absent keys and JSON nulls read the same downstream
+    result: dict[str, Any] = {}
+    for key in _CODEMETA_KEYS:
+        value: Any = doc.get(key)
+        if value is None:
+            continue
+        if isinstance(value, simdjson.Object):
+            value = value.as_dict()
+        elif isinstance(value, simdjson.Array):
+            value = value.as_list()
+        result[key] = value
+    return result
+
+
 def _parse_authors(author_data: Any) -> list[dict[str, Any]]:
     """Parse author field which can be a single object or list."""
     if not author_data:
@@ -130,9 +286,9 @@ def _parse_authors(author_data: Any) -> list[dict[str, Any]]:
             entry: dict[str, Any] = {}
             # Handle Person type
             if author.get("@type") == "Person":
-                given = author.get("givenName", "")
-                family = author.get("familyName", "")
-                name = author.get("name") or f"{given} {family}".strip()
+                name = author.get("name") or " ".join(
+                    filter(None, (author.get("givenName"), author.get("familyName")))
+                )
                 if name:
                     entry["name"] = name
                 if author.get("email"):
@@ -206,21 +362,22 @@ def _extract_spdx_id(license_data: Any) -> str | None:
 
     # Extract from SPDX URL like https://spdx.org/licenses/MIT
     if "spdx.org/licenses/" in license_str:
-        return license_str.split("spdx.org/licenses/")[-1].rstrip("/")
+        spdx_id = license_str.split("spdx.org/licenses/")[-1].rstrip("/")
+        return _SPDX_IDS.get(spdx_id, spdx_id)
 
-    # Common license names
-    license_upper = license_str.upper()
-    if "MIT" in license_upper:
+    # Common license names, in priority order
+    families = {m.upper() for m in _LICENSE_FAMILY_RE.findall(license_str)}
+    if "MIT" in families:
         return "MIT"
-    if "APACHE" in license_upper and "2" in license_str:
+    if "APACHE" in families and "2" in license_str:
         return "Apache-2.0"
     # Handle both "GPL" and "GNU General Public License"
-    if "GPL" in license_upper or "GENERAL PUBLIC LICENSE" in license_upper:
+    if "GPL" in families or "GENERAL PUBLIC LICENSE" in families:
         if "3" in license_str:
             return "GPL-3.0"
         if "2" in license_str:
             return "GPL-2.0"
-    if "BSD" in license_upper:
+    if "BSD" in families:
         if "3" in license_str:
             return "BSD-3-Clause"
         if "2" in license_str:
@@ -239,8 +396,8 @@ def _parse_dev_status(status: Any) -> str | None:
             # Extract status from URL like https://www.repostatus.org/#active
             parts = status.split("#")
             if len(parts) > 1:
-                return parts[-1]
-        return status
+                return _STATUS_VALUES.get(parts[-1], parts[-1])
+        return _STATUS_VALUES.get(status, status)
     return None
 
 
@@ -272,6 +429,37 @@ def _parse_funding(funding_data: Any) -> list[dict[str, Any]]:
     return result
 
 
+# CodeMetadata attribute -> projects_db field, copied over when non-empty
+_SIMPLE_PROJECT_FIELDS = (
+    ("name", "name"),
+    ("description", "description"),
+    ("programming_languages", "languages"),
+    ("keywords", "tags"),
+    ("license_id", "license"),
+    ("version", "version"),
+)
+
+
+# codeRepository hosts accepted as the project's GitHub URL
+_GITHUB_HOSTS = frozenset({"github.com", "www.github.com"})
+
+
+def _is_github_url(url: str) -> bool:
+    """Check whether a codeRepository URL is hosted on GitHub.
+
+    Handles scheme URLs (https, git+https, git, ssh), scp-style SSH
+    (``git@github.com:user/repo``) and scheme-less ``github.com/user/repo``.
+    """
+    if "://" not in url:
+        # scp-style and scheme-less forms parse as a network location
+        url = "//" + url
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return False
+    return host in _GITHUB_HOSTS
+
+
 def codemeta_to_project_fields(cm: CodeMetadata) -> dict[str, Any]:
     """Convert CodeMeta to projects_db fields (for merging).
 
@@ -285,37 +473,28 @@ def codemeta_to_project_fields(cm: CodeMetadata) -> dict[str, Any]:
     Returns:
         Dict of projects_db fields (only non-empty values)
     """
-    fields: dict[str, Any] = {}
-
-    if cm.name:
-        fields["name"] = cm.name
-    if cm.description:
-        fields["description"] = cm.description
-    if cm.programming_languages:
-        fields["languages"] = cm.programming_languages
-    if cm.keywords:
-        fields["tags"] = cm.keywords
-    if cm.license_id:
-        fields["license"] = cm.license_id
-    if cm.version:
-        fields["version"] = cm.version
+    project_fields: dict[str, Any] = {}
+
+    for attr, key in _SIMPLE_PROJECT_FIELDS:
+        value = getattr(cm, attr)
+        if value:
+            project_fields[key] = value
+
     if cm.development_status:
-        fields["status"] = _map_dev_status(cm.development_status)
-    if cm.date_created:
-        # Extract year from date
-        try:
-            year = int(cm.date_created[:4])
-            fields["year_started"] = year
-        except (ValueError, TypeError):
-            pass
-    if cm.code_repository and "github.com" in cm.code_repository:
-        fields["github"] = cm.code_repository
+        project_fields["status"] = _map_dev_status(cm.development_status)
+    if isinstance(cm.date_created, str):
+        # Extract year from an ISO date; skip anything without a 4-digit year
+        year = cm.date_created[:4]
+        if len(year) == 4 and year.isdecimal():
+            project_fields["year_started"] = int(year)
+    if cm.code_repository and _is_github_url(cm.code_repository):
+        project_fields["github"] = cm.code_repository
     if cm.identifier and ("doi.org" in str(cm.identifier) or cm.identifier.startswith("10.")):
-            fields["doi"] = cm.identifier
+        project_fields["doi"] = cm.identifier
     if cm.authors:
-        fields["authors"] = cm.authors
+        project_fields["authors"] = cm.authors
 
-    return fields
+    return project_fields
 
 
 def _map_dev_status(status: str) -> str:
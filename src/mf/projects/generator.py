@@ -10,13 +10,17 @@ Supports two modes:
 
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from rich.console import Console
 
 from mf.core.config import get_paths
 from mf.core.database import ProjectsCache, ProjectsDatabase
+from mf.core.yaml_utils import yaml_escape, yaml_quote
 from mf.projects.readme import rewrite_readme_urls
 
 console = Console()
@@ -56,6 +60,46 @@ SECTION_TEMPLATES = {
     },
 }
 
+# Fixed-shape frontmatter blocks, formatted once per page with format_map
+_SECTION_FRONTMATTER_FMT = """---
+title: "{title}"
+layout: project-section
+description: "{description}"
+weight: {weight}
+---
+
+"""
+
+_PACKAGE_KEYS = ("pypi", "npm", "cran", "r_universe", "crates", "conan", "vcpkg")
+_PACKAGES_FMT = "\n".join(
+    ["", "packages:", *(f"  {key}: {{{key}}}" for key in _PACKAGE_KEYS)]
+)
+
+
+def _write_file(path: Path, data: bytes, exclusive: bool = False) -> bool:
+    """Write bytes to a file through a raw descriptor.
+
+    Args:
+        path: File to write
+        data: Encoded file content
+        exclusive: Create only; leave an existing file untouched
+
+    Returns:
+        False if exclusive and the file already existed, else True
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
 
 def merge_project_data(
     slug: str,
@@ -139,7 +183,7 @@ def generate_project_frontmatter(
 
     lines = [
         "---",
-        f'title: "{title}"',
+        f"title: {yaml_quote(title)}",
     ]
 
     # Add layout for rich projects (branch bundles)
@@ -152,15 +196,15 @@ def generate_project_frontmatter(
     ])
 
     if description:
-        safe_desc = description.replace('"', '\\"').replace("\n", " ")
-        lines.append(f'description: "{safe_desc}"')
+        safe_desc = description.replace("\n", " ")
+        lines.append(f"description: {yaml_quote(safe_desc)}")
 
     lines.append(f"featured: {str(metadata.get('featured', False)).lower()}")
     lines.append("categories: []")
 
     # Top-level fields used by list layout for filtering/sorting
     if primary_language and primary_language != "Unknown":
-        lines.append(f'primary_language: "{primary_language}"')
+        lines.append(f"primary_language: {yaml_quote(primary_language)}")
     github_stars = github_data.get("stargazers_count", 0)
     lines.append(f"github_stars: {github_stars}")
     license_info = metadata.get("license") or github_data.get("license")
@@ -169,10 +213,10 @@ def generate_project_frontmatter(
     else:
         license_id = str(license_info) if license_info else ""
     if license_id and license_id != "NOASSERTION":
-        lines.append(f'license: "{license_id}"')
+        lines.append(f"license: {yaml_quote(license_id)}")
     demo_url = metadata.get("demo_url", "")
     if demo_url:
-        lines.append(f'demo_url: "{demo_url}"')
+        lines.append(f"demo_url: {yaml_quote(demo_url)}")
 
     # Aliases for Hugo redirects
     aliases = metadata.get("aliases", [])
@@ -186,7 +230,7 @@ def generate_project_frontmatter(
         "",
         "project:",
         '  status: "active"',
-        f'  type: "{category}"',
+        f"  type: {yaml_quote(category)}",
         f"  year_started: {created_at[:4] if created_at else datetime.now().year}",
     ])
 
@@ -196,12 +240,11 @@ def generate_project_frontmatter(
         "tech:",
         "  languages:",
     ])
-    for lang in languages:
-        lines.append(f'    - "{lang}"')
+    lines.extend(f"    - {yaml_quote(lang)}" for lang in languages)
     lines.append("  frameworks: []")
 
     if tags:
-        lines.append("  topics: [" + ", ".join(f'"{tag}"' for tag in tags) + "]")
+        lines.append("  topics: [" + ", ".join(map(yaml_quote, tags)) + "]")
     else:
         lines.append("  topics: []")
 
@@ -209,24 +252,16 @@ def generate_project_frontmatter(
     lines.extend([
         "",
         "sources:",
-        f'  github: "{github_url}"',
-        f'  github_pages: "{github_pages_url}"',
-        f'  documentation: "{metadata.get("documentation_url", "")}"',
+        f"  github: {yaml_quote(github_url)}",
+        f"  github_pages: {yaml_quote(github_pages_url)}",
+        f"  documentation: {yaml_quote(metadata.get('documentation_url', ''))}",
     ])
 
     # Packages section
     packages = metadata.get("packages", {})
-    lines.extend([
-        "",
-        "packages:",
-        f'  pypi: "{packages.get("pypi", "")}"',
-        f'  npm: "{packages.get("npm", "")}"',
-        f'  cran: "{packages.get("cran", "")}"',
-        f'  r_universe: "{packages.get("r_universe", "")}"',
-        f'  crates: "{packages.get("crates", "")}"',
-        f'  conan: "{packages.get("conan", "")}"',
-        f'  vcpkg: "{packages.get("vcpkg", "")}"',
-    ])
+    lines.append(_PACKAGES_FMT.format_map(
+        {key: yaml_quote(packages.get(key, "")) for key in _PACKAGE_KEYS}
+    ))
 
     # External docs section (for rich projects)
     external_docs = metadata.get("external_docs", {})
@@ -236,22 +271,24 @@ def generate_project_frontmatter(
             "external_docs:",
         ])
         for doc_type, url in external_docs.items():
-            lines.append(f'  {doc_type}: "{url}"')
+            lines.append(f"  {doc_type}: {yaml_quote(url)}")
 
     # Papers section
     papers = metadata.get("papers", [])
     if papers:
         lines.extend(["", "papers:"])
         for paper in papers:
-            lines.append(f'  - title: "{paper.get("title", "")}"')
-            lines.append(f'    venue: "{paper.get("venue", "")}"')
-            lines.append(f'    year: {paper.get("year", "")}')
+            lines.extend([
+                f"  - title: {yaml_quote(paper.get('title', ''))}",
+                f"    venue: {yaml_quote(paper.get('venue', ''))}",
+                f'    year: {paper.get("year", "")}',
+            ])
             if paper.get("arxiv"):
-                lines.append(f'    arxiv: "{paper["arxiv"]}"')
+                lines.append(f"    arxiv: {yaml_quote(paper['arxiv'])}")
             if paper.get("doi"):
-                lines.append(f'    doi: "{paper["doi"]}"')
+                lines.append(f"    doi: {yaml_quote(paper['doi'])}")
             if paper.get("pdf"):
-                lines.append(f'    pdf: "{paper["pdf"]}"')
+                lines.append(f"    pdf: {yaml_quote(paper['pdf'])}")
     else:
         lines.extend(["", "papers: []"])
 
@@ -266,14 +303,14 @@ def generate_project_frontmatter(
 
     # Image section
     if metadata.get("screenshot"):
-        lines.append(f'\nimage: "{metadata["screenshot"]}"')
+        lines.append(f"\nimage: {yaml_quote(metadata['screenshot'])}")
 
     # Related content
     related_posts = metadata.get("related_posts", [])
     if related_posts:
         lines.extend(["", "related_posts:"])
         for post in related_posts:
-            lines.append(f'  - "{post}"')
+            lines.append(f"  - {yaml_quote(post)}")
     else:
         lines.extend(["", "related_posts: []"])
 
@@ -281,7 +318,7 @@ def generate_project_frontmatter(
     if related_projects:
         lines.append("related_projects:")
         for proj in related_projects:
-            lines.append(f'  - "{proj}"')
+            lines.append(f"  - {yaml_quote(proj)}")
     else:
         lines.append("related_projects: []")
 
@@ -306,19 +343,32 @@ def generate_section_frontmatter(
     Returns:
         YAML frontmatter string
     """
-    tmpl = template or SECTION_TEMPLATES.get(section, {})
+    if not template:
+        return _default_section_frontmatter(section, project_title)
+    return _render_section_frontmatter(section, project_title, template)
+
+
+@lru_cache(maxsize=512)
+def _default_section_frontmatter(section: str, project_title: str) -> str:
+    """Render section frontmatter from SECTION_TEMPLATES (memoized)."""
+    return _render_section_frontmatter(
+        section, project_title, SECTION_TEMPLATES.get(section, {})
+    )
+
+
+def _render_section_frontmatter(
+    section: str,
+    project_title: str,
+    tmpl: dict[str, Any],
+) -> str:
+    """Render section frontmatter from a template dict."""
     title = tmpl.get("title", section.title())
     description = tmpl.get("description", f"{title} for {project_title}")
     weight = tmpl.get("weight", 99)
 
-    return f"""---
-title: "{title}"
-layout: project-section
-description: "{description}"
-weight: {weight}
----
-
-"""
+    return _SECTION_FRONTMATTER_FMT.format(
+        title=yaml_escape(title), description=yaml_escape(description), weight=weight
+    )
 
 
 def generate_project_content(
@@ -366,11 +416,11 @@ def generate_project_content(
     frontmatter = generate_project_frontmatter(slug, metadata, is_branch_bundle=is_rich)
 
     # Build content
-    content = frontmatter
-    if readme_content:
-        content += readme_content + "\n"
-    elif metadata.get("abstract"):
-        content += metadata["abstract"] + "\n"
+    parts = [frontmatter]
+    body = readme_content or metadata.get("abstract")
+    if body:
+        parts.extend([body, "\n"])
+    content = "".join(parts)
 
     # Determine content file name based on bundle type
     if is_rich:
@@ -387,7 +437,7 @@ def generate_project_content(
         return True
 
     content_path.parent.mkdir(parents=True, exist_ok=True)
-    content_path.write_text(content, encoding="utf-8")
+    _write_file(content_path, content.encode("utf-8"))
     console.print(f"  [green]✓[/green] Generated: {content_path}")
 
     # Generate section pages for rich projects
@@ -395,11 +445,10 @@ def generate_project_content(
         project_title = metadata.get("title", github_data.get("name", slug))
         for section in content_sections:
             section_path = paths.projects / slug / section / "_index.md"
+            section_path.parent.mkdir(parents=True, exist_ok=True)
+            section_content = generate_section_frontmatter(section, project_title)
             # Only create if doesn't exist (preserve manual edits)
-            if not section_path.exists():
-                section_path.parent.mkdir(parents=True, exist_ok=True)
-                section_content = generate_section_frontmatter(section, project_title)
-                section_path.write_text(section_content, encoding="utf-8")
+            if _write_file(section_path, section_content.encode("utf-8"), exclusive=True):
                 console.print(f"  [green]✓[/green] Generated section: {section_path}")
             else:
                 console.print(f"  [dim]Section exists (skipped): {section_path}[/dim]")
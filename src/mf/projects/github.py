@@ -4,26 +4,40 @@ GitHub API client with rate limiting and caching.
 
 from __future__ import annotations
 
-import base64
+import binascii
 import json
 import os
 import subprocess
 import time
-import urllib.error
-import urllib.request
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, cast
 
+import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
+from mf.core.backup import safe_write_json
+
 console = Console()
 
+# Optional faster JSON parser for API responses
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 GITHUB_API = "https://api.github.com"
 
 
+@lru_cache(maxsize=1)
 def _get_gh_auth_token() -> str | None:
     """Try to get token from GitHub CLI (gh auth token).
 
+    Memoized, so ``gh`` is spawned at most once per process.
+
     Returns:
         Token string or None if gh CLI not available/authenticated
     """
@@ -44,7 +58,11 @@ def _get_gh_auth_token() -> str | None:
 class GitHubClient:
     """GitHub API client with rate limit handling."""
 
-    def __init__(self, token: str | None = None):
+    # Connection pool sizing; every request goes to api.github.com
+    POOL_CONNECTIONS = 1
+    POOL_MAXSIZE = 4
+
+    def __init__(self, token: str | None = None, etag_cache: Path | None = None):
         """Initialize client.
 
         Token resolution order:
@@ -54,10 +72,67 @@ class GitHubClient:
 
         Args:
             token: GitHub personal access token
+            etag_cache: Path to a JSON file of ETags and response bodies.
+                When set, requests are conditional and a 304 Not Modified
+                (which does not count against the rate limit) is answered
+                from the cache. Call save_etag_cache() or close() to persist.
         """
         self.token = token or os.environ.get("GITHUB_TOKEN") or _get_gh_auth_token()
-        self._rate_limit_remaining = None
-        self._rate_limit_reset = None
+        self._rate_limit_remaining: str | None = None
+        self._rate_limit_reset: str | None = None
+        # One keep-alive session for all calls; retries are handled in
+        # _make_request, so the adapter must not retry
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "mf-github-import/1.0",
+        })
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=0,
+        )
+        self._session.mount("https://", adapter)
+
+        self._etag_cache_path = etag_cache
+        self._etags: dict[str, dict[str, Any]] | None = None
+        self._etags_dirty = False
+        if etag_cache is not None:
+            # Load up front so concurrent requests share one dict
+            self._load_etags()
+
+    def _load_etags(self) -> dict[str, dict[str, Any]]:
+        """Load the ETag cache on first use (empty if missing or invalid)."""
+        if self._etags is None:
+            self._etags = {}
+            if self._etag_cache_path is not None:
+                try:
+                    with open(self._etag_cache_path, encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        self._etags = data
+                except (OSError, json.JSONDecodeError):
+                    pass
+        return self._etags
+
+    def save_etag_cache(self) -> None:
+        """Write the ETag cache if it changed (no backup - regenerable)."""
+        if self._etag_cache_path is None or not self._etags_dirty:
+            return
+        self._etag_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        safe_write_json(self._etag_cache_path, self._load_etags(), create_backup_first=False)
+        self._etags_dirty = False
+
+    def close(self) -> None:
+        """Persist the ETag cache and close the pooled HTTP session."""
+        self.save_etag_cache()
+        self._session.close()
+
+    def __enter__(self) -> GitHubClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _make_request(
         self,
@@ -73,68 +148,101 @@ class GitHubClient:
         Returns:
             JSON response as dict/list, or None on error
         """
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "mf-github-import/1.0",
-        }
+        return self._get_page(url, max_retries)[0]
+
+    def _get_page(
+        self,
+        url: str,
+        max_retries: int = 5,
+    ) -> tuple[dict | list | None, str | None]:
+        """Fetch one API page along with its Link header's rel="next" URL.
+
+        The next URL is returned rather than stored on the client, so
+        concurrent requests on one client cannot see each other's pages.
+
+        Args:
+            url: Full API URL
+            max_retries: Maximum retry attempts
 
+        Returns:
+            Tuple of (JSON response as dict/list or None on error, next URL or None)
+        """
+        headers: dict[str, str] = {}
         if self.token:
             headers["Authorization"] = f"token {self.token}"
 
+        cached = None
+        if self._etag_cache_path is not None:
+            cached = self._load_etags().get(url)
+            if cached:
+                headers["If-None-Match"] = cached["etag"]
+
         for attempt in range(max_retries):
             try:
-                req = urllib.request.Request(url, headers=headers)
-                with urllib.request.urlopen(req, timeout=30) as response:
-                    # Update rate limit info
-                    self._rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
-                    self._rate_limit_reset = response.headers.get("X-RateLimit-Reset")
-                    return cast(dict | list | None, json.loads(response.read()))
-
-            except urllib.error.HTTPError as e:
-                if e.code in [403, 429]:
-                    # Rate limit exceeded
-                    reset_time = e.headers.get("X-RateLimit-Reset")
-                    remaining = e.headers.get("X-RateLimit-Remaining", "0")
-
-                    if remaining == "0" and reset_time:
-                        reset_dt = datetime.fromtimestamp(int(reset_time))
-                        wait_seconds = max(0, (reset_dt - datetime.now()).total_seconds())
-
-                        if 0 < wait_seconds < 3600:
-                            console.print(
-                                f"[yellow]Rate limit exceeded. "
-                                f"Waiting {int(wait_seconds)}s until {reset_dt.strftime('%H:%M:%S')}...[/yellow]"
-                            )
-                            time.sleep(wait_seconds + 5)
-                            continue
-                        else:
-                            console.print(f"[red]Rate limit exceeded. Reset at {reset_dt}[/red]")
-                            return None
-
-                    # Exponential backoff
-                    wait_time = min(2 ** attempt, 300)
-                    console.print(f"[yellow]Rate limit hit. Retrying in {wait_time}s...[/yellow]")
-                    time.sleep(wait_time)
-                    continue
-
-                if attempt == max_retries - 1:
-                    console.print(f"[red]GitHub API error {e.code}: {e.reason}[/red]")
-                return None
-
-            except urllib.error.URLError as e:
+                response = self._session.get(url, headers=headers, timeout=30)
+            except requests.RequestException as e:
                 if attempt < max_retries - 1:
                     wait_time = min(2 ** attempt, 60)
                     console.print(f"[yellow]Network error. Retrying in {wait_time}s...[/yellow]")
                     time.sleep(wait_time)
                     continue
                 console.print(f"[red]Network error: {e}[/red]")
-                return None
-
-            except Exception as e:
+                return None, None
+
+            if response.status_code == 304 and cached:
+                return cast(dict | list | None, cached["body"]), cached.get("next")
+
+            if response.status_code in (403, 429):
+                # Rate limit exceeded
+                reset_time = response.headers.get("X-RateLimit-Reset")
+                remaining = response.headers.get("X-RateLimit-Remaining", "0")
+
+                if remaining == "0" and reset_time:
+                    reset_dt = datetime.fromtimestamp(int(reset_time))
+                    wait_seconds = max(0, (reset_dt - datetime.now()).total_seconds())
+
+                    if 0 < wait_seconds < 3600:
+                        console.print(
+                            f"[yellow]Rate limit exceeded. "
+                            f"Waiting {int(wait_seconds)}s until {reset_dt.strftime('%H:%M:%S')}...[/yellow]"
+                        )
+                        time.sleep(wait_seconds + 5)
+                        continue
+                    else:
+                        console.print(f"[red]Rate limit exceeded. Reset at {reset_dt}[/red]")
+                        return None, None
+
+                # Exponential backoff
+                wait_time = min(2 ** attempt, 300)
+                console.print(f"[yellow]Rate limit hit. Retrying in {wait_time}s...[/yellow]")
+                time.sleep(wait_time)
+                continue
+
+            if response.status_code >= 400:
+                if attempt == max_retries - 1:
+                    console.print(
+                        f"[red]GitHub API error {response.status_code}: {response.reason}[/red]"
+                    )
+                return None, None
+
+            # Update rate limit info
+            self._rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
+            self._rate_limit_reset = response.headers.get("X-RateLimit-Reset")
+            # Both parsers take the raw bytes; orjson's error is a ValueError
+            try:
+                body = orjson.loads(response.content) if HAS_ORJSON else json.loads(response.content)
+            except ValueError as e:
                 console.print(f"[red]Request error: {e}[/red]")
-                return None
+                return None, None
 
-        return None
+            next_url = response.links.get("next", {}).get("url")
+            etag = response.headers.get("ETag")
+            if etag and self._etag_cache_path is not None:
+                self._load_etags()[url] = {"etag": etag, "body": body, "next": next_url}
+                self._etags_dirty = True
+            return cast(dict | list | None, body), next_url
+
+        return None, None
 
     def get_rate_limit(self) -> dict[str, Any] | None:
         """Get current rate limit status.
@@ -162,22 +270,16 @@ class GitHubClient:
             List of repository data dicts
         """
         repos: list[dict[str, Any]] = []
-        page = 1
-
-        while True:
-            visibility = "all" if include_private else "public"
-            url = f"{GITHUB_API}/users/{username}/repos?per_page=100&page={page}&type={visibility}"
+        visibility = "all" if include_private else "public"
+        url: str | None = f"{GITHUB_API}/users/{username}/repos?per_page=100&type={visibility}"
 
-            data = self._make_request(url)
+        # Follow the Link header's rel="next" until GitHub stops sending one
+        while url:
+            data, url = self._get_page(url)
             if not data or not isinstance(data, list):
                 break
 
             repos.extend(data)
-            page += 1
-
-            # Check if there are more pages
-            if len(data) < 100:
-                break
 
         return repos
 
@@ -235,8 +337,10 @@ class GitHubClient:
         if not isinstance(data, dict) or "content" not in data:
             return None
 
+        # GitHub wraps the base64 payload at 60 columns; a2b_base64 skips the
+        # newlines itself, so no pre-scrubbing pass is needed
         try:
-            content = base64.b64decode(data["content"]).decode("utf-8")
+            content = binascii.a2b_base64(data["content"]).decode("utf-8")
             return content
         except Exception:
             return None
@@ -8,7 +8,10 @@ from __future__ import annotations
 
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
 from rich.console import Console
@@ -21,6 +24,14 @@ from mf.projects.github import GitHubClient, check_rate_limit
 console = Console()
 
 
+def _etag_cache_path() -> Path | None:
+    """Locate the GitHub ETag cache, or None outside an initialized site."""
+    try:
+        return get_paths().http_etags
+    except FileNotFoundError:
+        return None
+
+
 def filter_repos(
     repos: list[dict],
     exclude_forks: bool = False,
@@ -78,6 +89,9 @@ def extract_repo_metadata(
 ) -> dict[str, Any]:
     """Extract and augment GitHub repo data.
 
+    The languages, GitHub Pages and README lookups are independent GETs,
+    so they are issued concurrently over the client's pooled session.
+
     Args:
         repo: Repository data from GitHub API
         client: GitHub API client
@@ -94,22 +108,25 @@ def extract_repo_metadata(
     # Add sync metadata
     github_data["_last_synced"] = datetime.now(timezone.utc).isoformat()
 
-    # Get language breakdown
-    console.print("    Fetching languages...")
-    languages = client.get_repo_languages(owner, name)
+    console.print("    Fetching languages, GitHub Pages and README...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        languages_future = executor.submit(client.get_repo_languages, owner, name)
+        pages_future = executor.submit(client.get_github_pages_url, owner, name)
+        readme_future = executor.submit(client.get_repo_readme, owner, name)
+    languages = languages_future.result()
+    pages_url = pages_future.result()
+    readme = readme_future.result()
+
+    # Language breakdown
     if languages:
         github_data["_languages_breakdown"] = languages
 
-    # Check for GitHub Pages
-    console.print("    Checking GitHub Pages...")
-    pages_url = client.get_github_pages_url(owner, name)
+    # GitHub Pages
     if pages_url:
         github_data["_github_pages_url"] = pages_url
         console.print(f"    [green]✓[/green] Pages: {pages_url}")
 
-    # Fetch README
-    console.print("    Fetching README...")
-    readme = client.get_repo_readme(owner, name)
+    # README
     if readme:
         github_data["_readme_content"] = readme
         console.print(f"    [green]✓[/green] README ({len(readme)} bytes)")
@@ -151,79 +168,81 @@ def import_user_repos(
         console.print("=" * 60)
         console.print()
 
-    client = GitHubClient(token)
+    # close() saves the ETag cache even if the import fails part way;
+    # dry runs leave it alone
+    etag_cache = None if dry_run else _etag_cache_path()
+    with closing(GitHubClient(token, etag_cache=etag_cache)) as client:
+        # Check rate limit first
+        check_rate_limit(token)
+        console.print()
 
-    # Check rate limit first
-    check_rate_limit(token)
-    console.print()
+        console.print(f"[cyan]Fetching repositories for: {username}[/cyan]")
+
+        repos = client.get_user_repos(username, include_private)
+        console.print(f"Found {len(repos)} repositories")
+
+        # Filter repos
+        filtered = filter_repos(
+            repos,
+            exclude_forks=exclude_forks,
+            exclude_archived=exclude_archived,
+            min_stars=min_stars,
+            has_description=has_description,
+            languages=languages,
+            topics=topics,
+        )
+        console.print(f"After filtering: {len(filtered)} repositories")
+
+        if dry_run:
+            console.print("\n[yellow]Would import:[/yellow]")
+            for repo in filtered:
+                lang = repo.get("language", "Unknown")
+                console.print(f"  - {repo['full_name']} ({lang})")
+            return
 
-    console.print(f"[cyan]Fetching repositories for: {username}[/cyan]")
+        # Load existing data
+        db = ProjectsDatabase()
+        db.load()
 
-    repos = client.get_user_repos(username, include_private)
-    console.print(f"Found {len(repos)} repositories")
+        cache = ProjectsCache()
+        cache.load()
 
-    # Filter repos
-    filtered = filter_repos(
-        repos,
-        exclude_forks=exclude_forks,
-        exclude_archived=exclude_archived,
-        min_stars=min_stars,
-        has_description=has_description,
-        languages=languages,
-        topics=topics,
-    )
-    console.print(f"After filtering: {len(filtered)} repositories")
+        # Import each repo
+        imported = 0
+        skipped = 0
 
-    if dry_run:
-        console.print("\n[yellow]Would import:[/yellow]")
-        for repo in filtered:
-            lang = repo.get("language", "Unknown")
-            console.print(f"  - {repo['full_name']} ({lang})")
-        return
-
-    # Load existing data
-    db = ProjectsDatabase()
-    db.load()
+        for i, repo in enumerate(filtered):
+            slug = repo["name"]
 
-    cache = ProjectsCache()
-    cache.load()
-
-    # Import each repo
-    imported = 0
-    skipped = 0
-
-    for i, repo in enumerate(filtered):
-        slug = repo["name"]
-
-        # Skip if already exists (unless force)
-        if slug in cache and not force:
-            console.print(f"[dim]Skipping {slug} (exists, use --force)[/dim]")
-            skipped += 1
-            continue
+            # Skip if already exists (unless force)
+            if slug in cache and not force:
+                console.print(f"[dim]Skipping {slug} (exists, use --force)[/dim]")
+                skipped += 1
+                continue
 
-        console.print(f"\n[cyan]Importing: {repo['full_name']}[/cyan]")
+            console.print(f"\n[cyan]Importing: {repo['full_name']}[/cyan]")
 
-        # Extract GitHub data
-        github_data = extract_repo_metadata(repo, client)
+            # Extract GitHub data
+            github_data = extract_repo_metadata(repo, client)
 
-        # Store in cache
-        cache.set(slug, github_data)
+            # Store in cache
+            cache.set(slug, github_data)
 
-        # Merge with manual overrides
-        overrides = db.get(slug) or {}
-        merged = merge_project_data(slug, github_data, overrides)
+            # Merge with manual overrides
+            overrides = db.get(slug) or {}
+            merged = merge_project_data(slug, github_data, overrides)
 
-        # Generate Hugo content
-        generate_project_content(slug, merged)
+            # Generate Hugo content
+            generate_project_content(slug, merged)
 
-        imported += 1
+            imported += 1
 
-        # Polite delay between requests
-        if i < len(filtered) - 1:
-            time.sleep(0.5)
+            # Polite delay between requests
+            if i < len(filtered) - 1:
+                time.sleep(0.5)
 
-    # Save cache
-    cache.save()
+        # Save cache
+        cache.save()
 
     console.print(f"\n[green]Imported {imported} projects[/green]")
     if skipped:
@@ -254,128 +273,129 @@ def refresh_projects(
         console.print("=" * 60)
         console.print()
 
-    client = GitHubClient(token)
-    check_rate_limit(token)
-    console.print()
+    etag_cache = None if dry_run else _etag_cache_path()
+    with closing(GitHubClient(token, etag_cache=etag_cache)) as client:
+        check_rate_limit(token)
+        console.print()
 
-    cache = ProjectsCache()
-    cache.load()
+        cache = ProjectsCache()
+        cache.load()
 
-    db = ProjectsDatabase()
-    db.load()
+        db = ProjectsDatabase()
+        db.load()
 
-    if slug:
-        # Single project
-        if slug not in cache:
-            console.print(f"[red]Project not found: {slug}[/red]")
-            return
-        projects = [slug]
-    else:
-        projects = list(cache)
+        if slug:
+            # Single project
+            if slug not in cache:
+                console.print(f"[red]Project not found: {slug}[/red]")
+                return
+            projects = [slug]
+        else:
+            projects = list(cache)
 
-    # Filter by time if specified
-    if older_than or newer_than:
-        now = datetime.now(timezone.utc)
-        filtered = []
+        # Filter by time if specified
+        if older_than or newer_than:
+            now = datetime.now(timezone.utc)
+            filtered = []
 
-        for s in projects:
-            cached = cache.get(s)
-            last_synced_str: str | None = str(cached.get("_last_synced")) if cached and cached.get("_last_synced") else None
+            for s in projects:
+                cached = cache.get(s)
+                last_synced_str: str | None = str(cached.get("_last_synced")) if cached and cached.get("_last_synced") else None
 
-            if not last_synced_str:
-                filtered.append(s)
-                continue
+                if not last_synced_str:
+                    filtered.append(s)
+                    continue
 
-            try:
-                last_synced = datetime.fromisoformat(last_synced_str.replace("Z", "+00:00"))
-                hours_since = (now - last_synced).total_seconds() / 3600
+                try:
+                    last_synced = datetime.fromisoformat(last_synced_str.replace("Z", "+00:00"))
+                    hours_since = (now - last_synced).total_seconds() / 3600
 
-                if older_than and hours_since < older_than:
-                    continue
-                if newer_than and hours_since > newer_than:
-                    continue
+                    if older_than and hours_since < older_than:
+                        continue
+                    if newer_than and hours_since > newer_than:
+                        continue
 
-                filtered.append(s)
-            except (ValueError, AttributeError):
-                filtered.append(s)
+                    filtered.append(s)
+                except (ValueError, AttributeError):
+                    filtered.append(s)
 
-        console.print(f"Filtered to {len(filtered)} projects based on sync time")
-        projects = filtered
+            console.print(f"Filtered to {len(filtered)} projects based on sync time")
+            projects = filtered
 
-    if not projects:
-        console.print("No projects to refresh")
-        return
+        if not projects:
+            console.print("No projects to refresh")
+            return
 
-    console.print(f"Refreshing {len(projects)} project(s)...\n")
+        console.print(f"Refreshing {len(projects)} project(s)...\n")
 
-    updated = 0
-    unchanged = 0
+        updated = 0
+        unchanged = 0
 
-    for s in projects:
-        cached = cache.get(s)
-        if not cached:
-            continue
+        for s in projects:
+            cached = cache.get(s)
+            if not cached:
+                continue
 
-        github_url = cached.get("html_url")
-        if not github_url:
-            continue
+            github_url = cached.get("html_url")
+            if not github_url:
+                continue
 
-        # Parse owner/repo
-        parts = github_url.rstrip("/").split("/")
-        owner, repo = parts[-2], parts[-1]
+            # Parse owner/repo
+            parts = github_url.rstrip("/").split("/")
+            owner, repo = parts[-2], parts[-1]
 
-        console.print(f"Checking {s}...", end=" ")
+            console.print(f"Checking {s}...", end=" ")
 
-        # Fetch current repo data
-        repo_data = client.get_repo(owner, repo)
-        if not repo_data:
-            console.print("[red]Failed[/red]")
-            continue
+            # Fetch current repo data
+            repo_data = client.get_repo(owner, repo)
+            if not repo_data:
+                console.print("[red]Failed[/red]")
+                continue
 
-        # Check if changed
-        cached_pushed_at = cached.get("pushed_at")
-        current_pushed_at = repo_data.get("pushed_at")
+            # Check if changed
+            cached_pushed_at = cached.get("pushed_at")
+            current_pushed_at = repo_data.get("pushed_at")
 
-        if cached_pushed_at == current_pushed_at and not force:
-            console.print("[dim]No changes[/dim]")
-            unchanged += 1
+            if cached_pushed_at == current_pushed_at and not force:
+                console.print("[dim]No changes[/dim]")
+                unchanged += 1
 
-            # Update sync time but keep cached expensive data
-            cached_readme = cached.get("_readme_content")
-            cached_languages = cached.get("_languages_breakdown")
+                # Update sync time but keep cached expensive data
+                cached_readme = cached.get("_readme_content")
+                cached_languages = cached.get("_languages_breakdown")
 
-            cache.set(s, dict(repo_data))
-            cached_new = cache.get(s)
-            if cached_new is None:
+                cache.set(s, dict(repo_data))
+                cached_new = cache.get(s)
+                if cached_new is None:
+                    continue
+                cached_new["_last_synced"] = datetime.now(timezone.utc).isoformat()
+                if cached_readme:
+                    cached_new["_readme_content"] = cached_readme
+                if cached_languages:
+                    cached_new["_languages_breakdown"] = cached_languages
+
+                # Regenerate content with updated metadata
+                overrides = db.get(s) or {}
+                merged = merge_project_data(s, cached_new, overrides)
+                generate_project_content(s, merged, dry_run)
                 continue
-            cached_new["_last_synced"] = datetime.now(timezone.utc).isoformat()
-            if cached_readme:
-                cached_new["_readme_content"] = cached_readme
-            if cached_languages:
-                cached_new["_languages_breakdown"] = cached_languages
-
-            # Regenerate content with updated metadata
-            overrides = db.get(s) or {}
-            merged = merge_project_data(s, cached_new, overrides)
-            generate_project_content(s, merged, dry_run)
-            continue
 
-        console.print("[cyan]Updating...[/cyan]")
+            console.print("[cyan]Updating...[/cyan]")
 
-        # Full refresh
-        github_data = extract_repo_metadata(repo_data, client)
-        cache.set(s, github_data)
+            # Full refresh
+            github_data = extract_repo_metadata(repo_data, client)
+            cache.set(s, github_data)
 
-        overrides = db.get(s) or {}
-        merged = merge_project_data(s, github_data, overrides)
-        generate_project_content(s, merged, dry_run)
+            overrides = db.get(s) or {}
+            merged = merge_project_data(s, github_data, overrides)
+            generate_project_content(s, merged, dry_run)
 
-        updated += 1
-        time.sleep(0.5)
+            updated += 1
+            time.sleep(0.5)
 
-    # Save cache
-    if not dry_run:
-        cache.save()
+        # Save cache
+        if not dry_run:
+            cache.save()
 
     console.print(f"\n[green]Updated:[/green] {updated}")
     console.print(f"[dim]Unchanged:[/dim] {unchanged}")
@@ -403,8 +423,8 @@ def clean_stale_projects(
     """
     console.print("Checking for stale projects...")
 
-    client = GitHubClient(token)
-    repos = client.get_user_repos(username, include_private=include_private)
+    with closing(GitHubClient(token)) as client:
+        repos = client.get_user_repos(username, include_private=include_private)
     github_slugs = {repo["name"] for repo in repos}
 
     paths = get_paths()
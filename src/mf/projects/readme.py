@@ -16,6 +16,39 @@ from __future__ import annotations
 import re
 from urllib.parse import urlparse
 
+# Images: ![alt](url) or ![alt](url "title")
+# The url group stops at ) or space-before-title
+_IMG_RE = re.compile(r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)')
+
+# Inline links (not images): [text](url) or [text](url "title")
+# Negative lookbehind to avoid matching images.
+# Text group allows one level of nested brackets for badge patterns
+# like [![Badge](https://...)](LICENSE)
+_NESTED_TEXT = r'[^\[\]]*(?:\[[^\[\]]*\](?:\([^)]*\))?[^\[\]]*)*'
+_LINK_RE = re.compile(rf'(?<!!)\[({_NESTED_TEXT})\]\(([^)\s]+)(?:\s+"([^"]*)")?\)')
+
+# Reference definitions: [label]: url or [label]: url "title"
+_REFDEF_RE = re.compile(r'^\[([^\]]+)\]:\s+(\S+)(?:\s+"([^"]*)")?$', re.MULTILINE)
+
+# URLs that are never rewritten: absolute http(s) and non-path schemes
+_ABSOLUTE_RE = re.compile(r"^https?://")
+_OTHER_SCHEME_RE = re.compile(r"^(mailto:|data:|tel:|ftp:|javascript:)", re.IGNORECASE)
+
+
+def _is_relative(url: str) -> bool:
+    """Check if a URL is relative (should be rewritten)."""
+    # Skip empty
+    if not url:
+        return False
+    # Skip anchors
+    if url.startswith("#"):
+        return False
+    # Skip absolute URLs (http://, https://, //, etc.)
+    if _ABSOLUTE_RE.match(url) or url.startswith("//"):
+        return False
+    # Skip mailto: and data: URIs
+    return not _OTHER_SCHEME_RE.match(url)
+
 
 def rewrite_readme_urls(
     content: str,
@@ -47,7 +80,7 @@ def rewrite_readme_urls(
     def _make_absolute(path: str, is_image: bool) -> str:
         """Build an absolute GitHub URL from a relative path."""
         # Strip leading ./
-        path = re.sub(r"^\./", "", path)
+        path = path.removeprefix("./")
 
         if is_image:
             return f"https://raw.githubusercontent.com/{owner_repo}/{default_branch}/{path}"
@@ -59,22 +92,6 @@ def rewrite_readme_urls(
         # Regular file links use /blob/
         return f"{html_url}/blob/{default_branch}/{path}"
 
-    def _is_relative(url: str) -> bool:
-        """Check if a URL is relative (should be rewritten)."""
-        # Skip empty
-        if not url:
-            return False
-        # Skip anchors
-        if url.startswith("#"):
-            return False
-        # Skip absolute URLs (http://, https://, //, etc.)
-        if re.match(r"^https?://", url) or url.startswith("//"):
-            return False
-        # Skip mailto: and data: URIs
-        return not re.match(
-            r"^(mailto:|data:|tel:|ftp:|javascript:)", url, re.IGNORECASE
-        )
-
     def _rewrite_image(m: re.Match[str]) -> str:
         """Rewrite an image URL: ![alt](url "title")."""
         alt = m.group(1)
@@ -105,23 +122,9 @@ def rewrite_readme_urls(
         title_part = f' "{title}"' if title else ""
         return f"[{label}]: {url}{title_part}"
 
-    # Pattern for images: ![alt](url) or ![alt](url "title")
-    # The url group stops at ) or space-before-title
-    img_pattern = r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)'
-
-    # Pattern for inline links (not images): [text](url) or [text](url "title")
-    # Negative lookbehind to avoid matching images.
-    # Text group allows one level of nested brackets for badge patterns
-    # like [![Badge](https://...)](LICENSE)
-    _nested_text = r'[^\[\]]*(?:\[[^\[\]]*\](?:\([^)]*\))?[^\[\]]*)*'
-    link_pattern = rf'(?<!!)\[({_nested_text})\]\(([^)\s]+)(?:\s+"([^"]*)")?\)'
-
-    # Pattern for reference definitions: [label]: url or [label]: url "title"
-    refdef_pattern = r'^\[([^\]]+)\]:\s+(\S+)(?:\s+"([^"]*)")?$'
-
     # Process in order: images first, then links, then reference definitions
-    content = re.sub(img_pattern, _rewrite_image, content)
-    content = re.sub(link_pattern, _rewrite_link, content)
-    content = re.sub(refdef_pattern, _rewrite_refdef, content, flags=re.MULTILINE)
+    content = _IMG_RE.sub(_rewrite_image, content)
+    content = _LINK_RE.sub(_rewrite_link, content)
+    content = _REFDEF_RE.sub(_rewrite_refdef, content)
 
     return content
@@ -16,6 +16,12 @@ from rich.console import Console
 from mf.core.config import get_paths
 from mf.core.database import PaperDatabase, PaperEntry
 
+# libyaml-backed emitter when available; same output, much faster
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
 console = Console()
 
 
@@ -143,6 +149,7 @@ def generate_publication_content(fm: dict[str, Any]) -> str:
     # Use yaml.dump for proper formatting
     yaml_content = yaml.dump(
         fm,
+        Dumper=_YamlDumper,
         default_flow_style=False,
         allow_unicode=True,
         sort_keys=False,
@@ -324,6 +331,7 @@ def _update_publication_file(pub_path: Path, entry: PaperEntry) -> None:
     # Regenerate file
     yaml_content = yaml.dump(
         existing_fm,
+        Dumper=_YamlDumper,
         default_flow_style=False,
         allow_unicode=True,
         sort_keys=False,
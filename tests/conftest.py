@@ -1,9 +1,35 @@
 """Shared test fixtures for mf package."""
 
 import json
+import os
 import pytest
 from pathlib import Path
 
+from tests.helpers import site_root_copy, write_content_file
+
+_SHM_DIR = "/dev/shm"
+
+
+def pytest_configure(config):
+    """Keep Rich/Click output free of ANSI escapes so it can be parsed directly.
+
+    Runs before collection, so module-level consoles see the environment.
+    """
+    os.environ["NO_COLOR"] = "1"
+    os.environ["TERM"] = "dumb"
+    os.environ.pop("FORCE_COLOR", None)
+
+    # Opt-in: keep tmp_path trees on tmpfs. The suite writes thousands of
+    # tiny files, so skipping the disk matters more than CPU on CI runners.
+    # xdist workers inherit the controller's basetemp, so only set it once.
+    if (
+        os.environ.get("MF_TEST_TMPFS")
+        and config.option.basetemp is None
+        and not hasattr(config, "workerinput")
+        and os.access(_SHM_DIR, os.W_OK)
+    ):
+        config.option.basetemp = str(Path(_SHM_DIR) / f"mf-tests-{os.getuid()}")
+
 
 @pytest.fixture
 def temp_dir(tmp_path):
@@ -97,11 +123,13 @@ def sample_series_db(tmp_path):
     return file_path
 
 
-@pytest.fixture
-def mock_site_root(tmp_path, monkeypatch):
-    """Create a mock site structure with .mf/ directory."""
+@pytest.fixture(scope="session")
+def _site_template(tmp_path_factory):
+    """Build the mock site directory tree once per test session."""
+    root = tmp_path_factory.mktemp("site_template")
+
     # Create .mf/ directory structure
-    mf_dir = tmp_path / ".mf"
+    mf_dir = root / ".mf"
     mf_dir.mkdir()
     (mf_dir / "cache").mkdir()
     (mf_dir / "backups" / "papers").mkdir(parents=True)
@@ -110,21 +138,22 @@ def mock_site_root(tmp_path, monkeypatch):
     (mf_dir / "backups" / "packages").mkdir(parents=True)
 
     # Create content directory structure
-    (tmp_path / "content" / "papers").mkdir(parents=True)
-    (tmp_path / "content" / "projects").mkdir(parents=True)
-    (tmp_path / "content" / "publications").mkdir(parents=True)
-    (tmp_path / "content" / "post").mkdir(parents=True)
-    (tmp_path / "content" / "series").mkdir(parents=True)
-    (tmp_path / "content" / "packages").mkdir(parents=True)
-    (tmp_path / "static" / "latex").mkdir(parents=True)
-
-    # Mock get_site_root to return our tmp_path
-    from mf.core import config
-    # Clear the lru_cache first
-    config.get_site_root.cache_clear()
-    monkeypatch.setattr(config, "get_site_root", lambda: tmp_path)
+    (root / "content" / "papers").mkdir(parents=True)
+    (root / "content" / "projects").mkdir(parents=True)
+    (root / "content" / "publications").mkdir(parents=True)
+    (root / "content" / "post").mkdir(parents=True)
+    (root / "content" / "series").mkdir(parents=True)
+    (root / "content" / "packages").mkdir(parents=True)
+    (root / "static" / "latex").mkdir(parents=True)
 
-    return tmp_path
+    return root
+
+
+@pytest.fixture
+def mock_site_root(tmp_path, _site_template):
+    """Create a mock site structure with .mf/ directory."""
+    with site_root_copy(_site_template, tmp_path) as root:
+        yield root
 
 
 @pytest.fixture
@@ -138,19 +167,9 @@ def create_content_file(mock_site_root):
         extra_fm: dict | None = None,
         draft: bool = False,
     ) -> Path:
-        content_dir = mock_site_root / "content" / content_type / slug
-        content_dir.mkdir(parents=True, exist_ok=True)
-
         fm = {"title": title, "date": "2024-01-01", "draft": draft}
         if extra_fm:
             fm.update(extra_fm)
-
-        import yaml
-        fm_str = yaml.dump(fm, default_flow_style=False)
-        content = f"---\n{fm_str}---\n\n{body}\n"
-
-        index_file = content_dir / "index.md"
-        index_file.write_text(content, encoding="utf-8")
-        return index_file
+        return write_content_file(mock_site_root, content_type, slug, fm, body)
 
     return _create
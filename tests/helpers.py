@@ -0,0 +1,76 @@
+"""Plain helpers shared by the test modules and conftest fixtures.
+
+Kept out of conftest.py so test modules can import them directly.
+"""
+
+import json
+import os
+import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+
+@contextmanager
+def site_root_copy(template: Path, root: Path) -> Iterator[Path]:
+    """Copy the site template into *root* and make it the active site root.
+
+    Uses ``MonkeyPatch.context()`` so class- and session-scoped fixtures,
+    which can't take the function-scoped ``monkeypatch``, can use it too.
+    """
+    from mf.core import config
+
+    shutil.copytree(template, root, dirs_exist_ok=True)
+
+    real_get_site_root = config.get_site_root
+    real_get_site_root.cache_clear()
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(config, "get_site_root", lambda: root)
+            yield root
+    finally:
+        # Don't leave a stale site root cached for later tests
+        real_get_site_root.cache_clear()
+
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+
+def _format_fm(fm: dict) -> str:
+    """Format a front matter dict as YAML lines without the YAML dumper.
+
+    Strings, numbers, bools and flat lists go out as JSON scalars/flow
+    sequences, which YAML reads back unchanged. Anything else falls back
+    to ``yaml.dump``.
+    """
+    lines = []
+    for key, value in fm.items():
+        if isinstance(value, (str, bool, int, float)) or (
+            isinstance(value, list)
+            and all(isinstance(v, (str, bool, int, float)) for v in value)
+        ):
+            lines.append(f"{key}: {json.dumps(value, ensure_ascii=False)}\n")
+        else:
+            import yaml
+            lines.append(yaml.dump({key: value}, Dumper=_YamlDumper))
+    return "".join(lines)
+
+
+def write_content_file(
+    site_root: Path, content_type: str, slug: str, fm: dict, body: str = "Test content."
+) -> Path:
+    """Write ``content/<type>/<slug>/index.md`` with front matter from ``_format_fm``."""
+    content_dir = os.path.join(site_root, "content", content_type, slug)
+    os.makedirs(content_dir, exist_ok=True)
+
+    content = f"---\n{_format_fm(fm)}---\n\n{body}\n"
+
+    index_file = os.path.join(content_dir, "index.md")
+    with open(index_file, "w", encoding="utf-8") as f:
+        f.write(content)
+    return Path(index_file)
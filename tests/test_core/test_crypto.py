@@ -1,9 +1,17 @@
 """Tests for mf.core.crypto module."""
 
+import os
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
-from mf.core.crypto import compute_file_hash, verify_file_hash, compute_directory_hash
+from mf.core.crypto import (
+    compute_directory_hash,
+    compute_file_hash,
+    compute_file_hash_and_fingerprint,
+    fingerprint_matches,
+    verify_file_hash,
+)
 
 
 class TestComputeFileHash:
@@ -55,6 +63,18 @@ class TestComputeFileHash:
 
         assert hash1 == hash2
 
+    def test_chunked_matches_single_read(self, tmp_path):
+        """Test that files larger than one chunk hash identically."""
+        import hashlib
+
+        data = bytes(range(256)) * 1000
+        test_file = tmp_path / "big.bin"
+        test_file.write_bytes(data)
+
+        result = compute_file_hash(test_file, chunk_size=4096, prefix=False)
+
+        assert result == hashlib.sha256(data).hexdigest()
+
     def test_raises_for_nonexistent_file(self, tmp_path):
         """Test that FileNotFoundError is raised for missing file."""
         with pytest.raises(FileNotFoundError):
@@ -69,6 +89,32 @@ class TestComputeFileHash:
             compute_file_hash(test_file, algorithm="invalid_algo")
 
 
+class TestFingerprint:
+    """Tests for compute_file_hash_and_fingerprint and fingerprint_matches."""
+
+    def test_fingerprint_matches_settled_file(self, tmp_path):
+        """Test that a fingerprint of a settled file matches its stat."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("test")
+        past = os.stat(test_file).st_mtime_ns - 10_000_000_000
+        os.utime(test_file, ns=(past, past))
+
+        file_hash, fingerprint = compute_file_hash_and_fingerprint(test_file)
+
+        assert file_hash == compute_file_hash(test_file)
+        assert fingerprint_matches(fingerprint, os.stat(test_file))
+
+    def test_fingerprint_without_recorded_time_not_trusted(self, tmp_path):
+        """Test that fingerprints lacking recorded_ns never match."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("test")
+        st = os.stat(test_file)
+        legacy = {"ino": st.st_ino, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+        assert not fingerprint_matches(legacy, st)
+        assert not fingerprint_matches(None, st)
+
+
 class TestVerifyFileHash:
     """Tests for verify_file_hash function."""
 
@@ -103,6 +149,64 @@ class TestVerifyFileHash:
 
         assert result is True
 
+    @pytest.mark.parametrize("algorithm,module", [
+        ("sha256", None),
+        ("blake2b", None),
+        ("xxh3", "xxhash"),
+        ("blake3", "blake3"),
+    ])
+    def test_round_trips_each_algorithm(self, tmp_path, algorithm, module):
+        """Test that every supported prefix verifies its own hash."""
+        if module:
+            pytest.importorskip(module)
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Hello, World!")
+
+        stored = compute_file_hash(test_file, algorithm=algorithm)
+
+        assert stored.startswith(f"{algorithm}:")
+        assert verify_file_hash(test_file, stored) is True
+        test_file.write_text("Hello, World?")
+        assert verify_file_hash(test_file, stored) is False
+
+    def test_memoizes_unchanged_file(self, tmp_path):
+        """Test that re-verifying an unchanged file skips re-hashing."""
+        test_file = tmp_path / "old.txt"
+        test_file.write_text("Hello, World!")
+        os.utime(test_file, ns=(0, 1_000_000_000))
+        expected = compute_file_hash(test_file)
+
+        with patch("mf.core.crypto.compute_file_hash", wraps=compute_file_hash) as spy:
+            assert verify_file_hash(test_file, expected) is True
+            assert verify_file_hash(test_file, expected) is True
+
+        assert spy.call_count == 1
+
+    def test_memo_invalidated_by_change(self, tmp_path):
+        """Test that a modified file is re-hashed despite the memo."""
+        test_file = tmp_path / "old.txt"
+        test_file.write_text("Hello, World!")
+        os.utime(test_file, ns=(0, 1_000_000_000))
+        expected = compute_file_hash(test_file)
+        assert verify_file_hash(test_file, expected) is True
+
+        test_file.write_text("Hello, World?")
+        os.utime(test_file, ns=(0, 2_000_000_000))
+
+        assert verify_file_hash(test_file, expected) is False
+
+    def test_recently_modified_file_not_memoized(self, tmp_path):
+        """Test that files inside the racy window are always re-hashed."""
+        test_file = tmp_path / "new.txt"
+        test_file.write_text("Hello, World!")
+        expected = compute_file_hash(test_file)
+
+        with patch("mf.core.crypto.compute_file_hash", wraps=compute_file_hash) as spy:
+            verify_file_hash(test_file, expected)
+            verify_file_hash(test_file, expected)
+
+        assert spy.call_count == 2
+
 
 class TestComputeDirectoryHash:
     """Tests for compute_directory_hash function."""
@@ -1,6 +1,5 @@
 """Tests for mf.core.database module."""
 
-import json
 import pytest
 from pathlib import Path
 
@@ -142,6 +141,37 @@ class TestPaperDatabase:
         assert stats["total"] == 2
         assert stats["category_count"] == 2
 
+    def test_load_invalid_json_exits(self, tmp_path):
+        """Test that a corrupt paper_db.json refuses to load."""
+        db_path = tmp_path / "paper_db.json"
+        db_path.write_text("{not json")
+
+        with pytest.raises(SystemExit):
+            PaperDatabase(db_path).load()
+
+    def test_paper_entry_hashable_by_slug(self):
+        """Test that entries can be used in sets and as dict keys."""
+        from mf.core.database import PaperEntry
+
+        a = PaperEntry(slug="a", data={"title": "A"})
+        same = PaperEntry(slug="a", data={"title": "A"})
+        other = PaperEntry(slug="a", data={"title": "Changed"})
+
+        assert hash(a) == hash(same) == hash(other)
+        assert {a, same} == {a}
+        assert a != other
+
+    def test_papers_with_source(self, sample_paper_db):
+        """Test that only entries with a source_path are yielded."""
+        db = PaperDatabase(sample_paper_db)
+        db.load()
+        db._data["_example"]["source_path"] = "/ignored.tex"
+
+        entries = list(db.papers_with_source())
+
+        assert [e.slug for e in entries] == ["test-paper"]
+        assert entries[0].source_hash == "sha256:abc123"
+
 
 class TestProjectsDatabase:
     """Tests for ProjectsDatabase class."""
@@ -189,6 +219,15 @@ class TestProjectsDatabase:
         assert len(results) == 1
         assert results[0][0] == "hidden-project"
 
+    def test_from_dict(self, tmp_path):
+        """Test building a loaded database without reading a file."""
+        data = {"proj": {"title": "Proj", "featured": True}}
+        db = ProjectsDatabase.from_dict(data, tmp_path / "projects_db.json")
+
+        assert db.get("proj") is data["proj"]
+        assert db.search(featured=True)[0][0] == "proj"
+        assert not (tmp_path / "projects_db.json").exists()
+
 
 class TestProjectsCache:
     """Tests for ProjectsCache class."""
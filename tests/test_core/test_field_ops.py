@@ -74,6 +74,11 @@ class TestCoerceValue:
         for v in ("false", "no", "0", "off"):
             assert coerce_value(v, fdef) is False
 
+    def test_bool_case_and_whitespace(self):
+        fdef = FieldDef(FieldType.BOOL, "")
+        assert coerce_value(" YES ", fdef) is True
+        assert coerce_value("Off", fdef) is False
+
     def test_bool_invalid(self):
         with pytest.raises(ValueError, match="Expected boolean"):
             coerce_value("maybe", FieldDef(FieldType.BOOL, ""))
@@ -81,6 +86,10 @@ class TestCoerceValue:
     def test_string_list_csv(self):
         assert coerce_value("a,b,c", FieldDef(FieldType.STRING_LIST, "")) == ["a", "b", "c"]
 
+    def test_string_list_csv_whitespace(self):
+        fdef = FieldDef(FieldType.STRING_LIST, "")
+        assert coerce_value("  a ,b,\tc d , ,", fdef) == ["a", "b", "c d"]
+
     def test_string_list_json(self):
         assert coerce_value('["a","b"]', FieldDef(FieldType.STRING_LIST, "")) == ["a", "b"]
 
@@ -267,6 +276,21 @@ class TestSetField:
         assert result.new_value == "v2"
         assert fdb._data["s"]["meta"]["k"] == "v2"
 
+    def test_set_dot_notation_does_not_mutate_original(self):
+        fdb = FakeProjectsDB()
+        meta = {"k": "v1"}
+        fdb._data["s"] = {"meta": meta}
+        set_field(DictDatabaseAdapter(fdb), "s", "meta.other", "v2")
+        assert meta == {"k": "v1"}
+        assert fdb._data["s"]["meta"] == {"k": "v1", "other": "v2"}
+
+    def test_set_dot_notation_new_dict(self):
+        fdb = FakeProjectsDB()
+        fdb._data["s"] = {"title": "T"}
+        result = set_field(DictDatabaseAdapter(fdb), "s", "meta.k", "v")
+        assert result.old_value is None
+        assert fdb._data["s"]["meta"] == {"k": "v"}
+
     def test_set_creates_entry(self):
         fdb = FakeProjectsDB()
         adapter = DictDatabaseAdapter(fdb)
@@ -369,6 +393,10 @@ class TestChangeResult:
         assert r.slug == "s"
         assert r.action == "set"
 
+    def test_no_instance_dict(self):
+        r = ChangeResult(slug="s", field="f", old_value=None, new_value=1, action="set")
+        assert not hasattr(r, "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # Regression: set_field with schema validation (Fix #7)
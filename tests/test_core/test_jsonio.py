@@ -0,0 +1,54 @@
+"""Tests for mf.core.jsonio module."""
+
+import json
+from datetime import date, datetime
+
+import pytest
+
+from mf.core import jsonio
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test against both the orjson and stdlib backends."""
+    if request.param == "orjson" and not jsonio.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsonio, "HAS_ORJSON", request.param == "orjson")
+    return request.param
+
+
+def test_load_json_file_backends(tmp_path, backend):
+    """Test that both JSON backends parse the same data from bytes."""
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"título": "Gödel", "n": [1, 2.5]}), encoding="utf-8")
+
+    assert jsonio.load_json_file(path) == {"título": "Gödel", "n": [1, 2.5]}
+
+
+def test_dumps_json_backends(backend):
+    """Test that both JSON backends emit equivalent indented output."""
+    data = {"d": date(2024, 1, 2), "t": datetime(2024, 1, 2, 3, 4), "n": [1]}
+
+    output = jsonio.dumps_json(data, default=str)
+
+    assert output.startswith('{\n  "d": ')
+    assert json.loads(output) == {"d": "2024-01-02", "t": "2024-01-02 03:04:00", "n": [1]}
+
+
+def test_dumps_json_non_string_keys(backend):
+    """Test that int and date keys (as YAML front matter yields) serialize."""
+    data = {"title": "T", "history": {1: "first", date(2024, 1, 1): [{2: "nested"}]}}
+
+    output = jsonio.dumps_json(data, default=str)
+
+    assert json.loads(output) == {
+        "title": "T",
+        "history": {"1": "first", "2024-01-01": [{"2": "nested"}]},
+    }
+
+
+def test_dumps_json_backends_match_on_non_ascii(backend):
+    """Test that non-ASCII text is written unescaped by both backends."""
+    data = {"título": "Gödel, Escher, Bach — 日本"}
+
+    assert jsonio.dumps_json(data) == '{\n  "título": "Gödel, Escher, Bach — 日本"\n}'
@@ -0,0 +1,24 @@
+"""Tests for mf.core.yaml_utils module."""
+
+import pytest
+import yaml
+
+from mf.core.yaml_utils import yaml_escape, yaml_quote
+
+
+def test_yaml_escape_quotes_and_backslashes():
+    assert yaml_escape('say "hi"') == 'say \\"hi\\"'
+    assert yaml_escape("\\alpha") == "\\\\alpha"
+
+
+def test_yaml_escape_keeps_unicode():
+    assert yaml_escape("Gödel") == "Gödel"
+
+
+@pytest.mark.parametrize(
+    "value",
+    ['plain', 'say "hi"', "C:\\path", "tab\there", "cr\rlf\n", "bell\x07", "Gödel", 42],
+)
+def test_yaml_quote_round_trips(value):
+    """Quoted values should parse back to the original string."""
+    assert yaml.safe_load(f"key: {yaml_quote(value)}") == {"key": str(value)}
@@ -4,6 +4,7 @@ import json
 
 import pytest
 
+from mf.core.config import get_paths
 from mf.packages.database import PackageDatabase, PackageEntry
 
 
@@ -392,7 +393,6 @@ class TestPackageDatabase:
 
     def test_default_db_path(self, mock_site_root):
         """PackageDatabase uses get_paths().packages_db when no path given."""
-        from mf.core.config import get_paths
         db = PackageDatabase()
         assert db.db_path == get_paths().packages_db
 
@@ -1,6 +1,8 @@
 """CLI integration tests for paper field override commands."""
 
 import json
+from types import SimpleNamespace
+
 import pytest
 from click.testing import CliRunner
 
@@ -70,42 +72,42 @@ class TestFieldsCommand:
 
 class TestSetCommand:
     def test_set_int_field(self, runner, db_env):
-        result = runner.invoke(papers, ["set", "test-paper", "stars", "5"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["set", "test-paper", "stars", "5"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         assert "5" in result.output
         db = _read_db(db_env)
         assert db["test-paper"]["stars"] == 5
 
     def test_set_string_field(self, runner, db_env):
-        result = runner.invoke(papers, ["set", "test-paper", "venue", "NeurIPS"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["set", "test-paper", "venue", "NeurIPS"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-paper"]["venue"] == "NeurIPS"
 
     def test_set_list_field(self, runner, db_env):
-        result = runner.invoke(papers, ["set", "test-paper", "tags", "a,b,c"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["set", "test-paper", "tags", "a,b,c"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-paper"]["tags"] == ["a", "b", "c"]
 
     def test_set_invalid_field(self, runner, db_env):
-        result = runner.invoke(papers, ["set", "test-paper", "bogus_field", "val"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["set", "test-paper", "bogus_field", "val"], obj=SimpleNamespace(dry_run=False))
         assert "Unknown field" in result.output
 
     def test_set_invalid_int(self, runner, db_env):
-        result = runner.invoke(papers, ["set", "test-paper", "stars", "abc"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["set", "test-paper", "stars", "abc"], obj=SimpleNamespace(dry_run=False))
         assert "Expected integer" in result.output
 
     def test_set_out_of_range(self, runner, db_env):
-        result = runner.invoke(papers, ["set", "test-paper", "stars", "10"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["set", "test-paper", "stars", "10"], obj=SimpleNamespace(dry_run=False))
         assert "above maximum" in result.output
 
     def test_set_invalid_choice(self, runner, db_env):
-        result = runner.invoke(papers, ["set", "test-paper", "status", "banana"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["set", "test-paper", "status", "banana"], obj=SimpleNamespace(dry_run=False))
         assert "not a valid choice" in result.output
 
     def test_set_dry_run(self, runner, db_env):
-        result = runner.invoke(papers, ["set", "test-paper", "stars", "5"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(papers, ["set", "test-paper", "stars", "5"], obj=SimpleNamespace(dry_run=True))
         assert "Dry run" in result.output
         db = _read_db(db_env)
         assert db["test-paper"]["stars"] == 3  # Unchanged
@@ -113,25 +115,25 @@ class TestSetCommand:
 
 class TestUnsetCommand:
     def test_unset_field(self, runner, db_env):
-        result = runner.invoke(papers, ["unset", "test-paper", "stars"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["unset", "test-paper", "stars"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert "stars" not in db["test-paper"]
 
     def test_unset_nonexistent_field(self, runner, db_env):
-        result = runner.invoke(papers, ["unset", "test-paper", "venue"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["unset", "test-paper", "venue"], obj=SimpleNamespace(dry_run=False))
         assert "was not set" in result.output
 
     def test_unset_nonexistent_paper(self, runner, db_env):
-        result = runner.invoke(papers, ["unset", "no-such-paper", "stars"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["unset", "no-such-paper", "stars"], obj=SimpleNamespace(dry_run=False))
         assert "not found" in result.output
 
     def test_unset_unknown_field(self, runner, db_env):
-        result = runner.invoke(papers, ["unset", "test-paper", "bogus"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["unset", "test-paper", "bogus"], obj=SimpleNamespace(dry_run=False))
         assert "Unknown field" in result.output
 
     def test_unset_dry_run(self, runner, db_env):
-        result = runner.invoke(papers, ["unset", "test-paper", "stars"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(papers, ["unset", "test-paper", "stars"], obj=SimpleNamespace(dry_run=True))
         assert "Dry run" in result.output
         db = _read_db(db_env)
         assert db["test-paper"]["stars"] == 3
@@ -139,19 +141,19 @@ class TestUnsetCommand:
 
 class TestFeatureCommand:
     def test_feature_on(self, runner, db_env):
-        result = runner.invoke(papers, ["feature", "other-paper"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["feature", "other-paper"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["other-paper"]["featured"] is True
 
     def test_feature_off(self, runner, db_env):
-        result = runner.invoke(papers, ["feature", "test-paper", "--off"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(papers, ["feature", "test-paper", "--off"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-paper"]["featured"] is False
 
     def test_feature_dry_run(self, runner, db_env):
-        result = runner.invoke(papers, ["feature", "other-paper"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(papers, ["feature", "other-paper"], obj=SimpleNamespace(dry_run=True))
         assert "Dry run" in result.output
         db = _read_db(db_env)
         assert "featured" not in db["other-paper"]
@@ -161,7 +163,7 @@ class TestTagCommand:
     def test_add_tags(self, runner, db_env):
         result = runner.invoke(
             papers, ["tag", "test-paper", "--add", "ai", "--add", "deep-learning"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert result.exit_code == 0
         db = _read_db(db_env)
@@ -173,7 +175,7 @@ class TestTagCommand:
     def test_remove_tags(self, runner, db_env):
         result = runner.invoke(
             papers, ["tag", "test-paper", "--remove", "ml"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert result.exit_code == 0
         db = _read_db(db_env)
@@ -183,7 +185,7 @@ class TestTagCommand:
     def test_set_tags(self, runner, db_env):
         result = runner.invoke(
             papers, ["tag", "test-paper", "--set", "a,b,c"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert result.exit_code == 0
         db = _read_db(db_env)
@@ -192,14 +194,14 @@ class TestTagCommand:
     def test_tag_no_options(self, runner, db_env):
         result = runner.invoke(
             papers, ["tag", "test-paper"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert "Specify --add, --remove, or --set" in result.output
 
     def test_tag_dry_run(self, runner, db_env):
         result = runner.invoke(
             papers, ["tag", "test-paper", "--add", "new"],
-            obj=type("Ctx", (), {"dry_run": True})(),
+            obj=SimpleNamespace(dry_run=True),
         )
         assert "Dry run" in result.output
         db = _read_db(db_env)
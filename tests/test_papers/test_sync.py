@@ -1,19 +1,26 @@
 """Tests for mf.papers.sync module (paper synchronization and staleness)."""
 
 import json
+import os
+import time
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
 from mf.papers.sync import (
     SyncStatus,
+    SyncStatusCode,
     SyncResults,
     ProcessingResult,
     check_paper_staleness,
     check_all_papers,
+    iter_check_all_papers,
+    load_sync_manifest,
     print_sync_status,
+    save_sync_manifest,
 )
+from mf.core.crypto import compute_file_hash_and_fingerprint
 from mf.core.database import PaperDatabase, PaperEntry
 
 
@@ -40,6 +47,16 @@ def test_sync_results_counts():
     assert results.failure_count == 1
 
 
+def test_sync_results_total_duration():
+    """Test that total_duration sums successes and failures."""
+    results = SyncResults()
+    results.succeeded.append(ProcessingResult(slug="a", success=True, duration=1.5))
+    results.failed.append(ProcessingResult(slug="b", success=False, duration=0.25))
+
+    assert results.total_duration == 1.75
+    assert SyncResults().total_duration == 0.0
+
+
 def test_processing_result_fields():
     """Test ProcessingResult dataclass fields."""
     r = ProcessingResult(slug="test", success=True, duration=3.5)
@@ -63,21 +80,24 @@ def test_sync_results_print_summary(capsys):
 # ---------------------------------------------------------------------------
 
 
-def test_staleness_non_tex_format():
+def test_staleness_non_tex_format(monkeypatch):
     """Test that non-tex source format is skipped."""
     entry = PaperEntry(slug="docx-paper", data={
         "source_path": "/some/file.docx",
         "source_format": "docx",
     })
+    mock_stat = MagicMock()
+    monkeypatch.setattr("mf.papers.sync.os.stat", mock_stat)
     status, path = check_paper_staleness(entry)
-    assert status == "skipped_non_tex"
+    assert status is SyncStatusCode.SKIPPED_NON_TEX
+    mock_stat.assert_not_called()
 
 
 def test_staleness_no_source_path():
     """Test that missing source_path is skipped."""
     entry = PaperEntry(slug="no-source", data={})
     status, path = check_paper_staleness(entry)
-    assert status == "skipped"
+    assert status is SyncStatusCode.SKIPPED
     assert path is None
 
 
@@ -88,8 +108,8 @@ def test_staleness_missing_file(tmp_path):
         "source_path": str(missing),
     })
     status, path = check_paper_staleness(entry)
-    assert status == "missing"
-    assert path == missing
+    assert status is SyncStatusCode.MISSING
+    assert path == str(missing)
 
 
 def test_staleness_directory_source(tmp_path):
@@ -100,7 +120,7 @@ def test_staleness_directory_source(tmp_path):
         "source_path": str(dir_path),
     })
     status, path = check_paper_staleness(entry)
-    assert status == "skipped"
+    assert status is SyncStatusCode.SKIPPED
 
 
 def test_staleness_no_hash(tmp_path):
@@ -112,13 +132,14 @@ def test_staleness_no_hash(tmp_path):
         # No source_hash
     })
     status, path = check_paper_staleness(entry)
-    assert status == "no_hash"
-    assert path == tex_file
+    assert status is SyncStatusCode.NO_HASH
+    assert path == str(tex_file)
 
 
-@patch("mf.papers.sync.verify_file_hash")
-def test_staleness_up_to_date(mock_verify, tmp_path):
+def test_staleness_up_to_date(tmp_path, monkeypatch):
     """Test that matching hash is reported as up_to_date."""
+    mock_verify = MagicMock()
+    monkeypatch.setattr("mf.papers.sync.verify_file_hash", mock_verify)
     tex_file = tmp_path / "paper.tex"
     tex_file.write_text(r"\documentclass{article}")
     mock_verify.return_value = True
@@ -128,13 +149,14 @@ def test_staleness_up_to_date(mock_verify, tmp_path):
         "source_hash": "sha256:abc123",
     })
     status, path = check_paper_staleness(entry)
-    assert status == "up_to_date"
-    mock_verify.assert_called_once_with(tex_file, "sha256:abc123")
+    assert status is SyncStatusCode.UP_TO_DATE
+    mock_verify.assert_called_once_with(str(tex_file), "sha256:abc123")
 
 
-@patch("mf.papers.sync.verify_file_hash")
-def test_staleness_stale(mock_verify, tmp_path):
+def test_staleness_stale(tmp_path, monkeypatch):
     """Test that mismatched hash is reported as stale."""
+    mock_verify = MagicMock()
+    monkeypatch.setattr("mf.papers.sync.verify_file_hash", mock_verify)
     tex_file = tmp_path / "paper.tex"
     tex_file.write_text(r"\documentclass{article}")
     mock_verify.return_value = False
@@ -144,7 +166,78 @@ def test_staleness_stale(mock_verify, tmp_path):
         "source_hash": "sha256:old_hash",
     })
     status, path = check_paper_staleness(entry)
-    assert status == "stale"
+    assert status is SyncStatusCode.STALE
+
+
+def _write_settled(path: Path, text: str) -> None:
+    """Write a file with an mtime outside the racy window."""
+    path.write_text(text)
+    past = time.time_ns() - 10_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+def test_staleness_up_to_date_uses_stat_shortcut(tmp_path, monkeypatch):
+    """Test that a matching stat fingerprint skips hash verification."""
+    mock_verify = MagicMock()
+    monkeypatch.setattr("mf.papers.sync.verify_file_hash", mock_verify)
+    tex_file = tmp_path / "paper.tex"
+    _write_settled(tex_file, r"\documentclass{article}")
+
+    entry = PaperEntry(slug="current", data={})
+    entry.set_source_tracking(tex_file, *compute_file_hash_and_fingerprint(tex_file))
+
+    status, path = check_paper_staleness(entry)
+    assert status is SyncStatusCode.UP_TO_DATE
+    assert path == str(tex_file)
+    mock_verify.assert_not_called()
+
+
+def test_staleness_stat_mismatch_verifies_hash(tmp_path, monkeypatch):
+    """Test that a changed stat fingerprint falls back to hash verification."""
+    mock_verify = MagicMock()
+    monkeypatch.setattr("mf.papers.sync.verify_file_hash", mock_verify)
+    tex_file = tmp_path / "paper.tex"
+    _write_settled(tex_file, r"\documentclass{article}")
+    mock_verify.return_value = False
+
+    entry = PaperEntry(slug="edited", data={})
+    _, fingerprint = compute_file_hash_and_fingerprint(tex_file)
+    entry.set_source_tracking(tex_file, "sha256:abc123", fingerprint)
+    tex_file.write_text(r"\documentclass{article} % edited")
+
+    status, _ = check_paper_staleness(entry)
+    assert status is SyncStatusCode.STALE
+    mock_verify.assert_called_once_with(str(tex_file), "sha256:abc123")
+
+
+def test_staleness_edit_during_build_is_stale(tmp_path):
+    """Test that an edit between hashing and recording is still detected."""
+    tex_file = tmp_path / "paper.tex"
+    _write_settled(tex_file, r"\documentclass{article}")
+
+    source_hash, fingerprint = compute_file_hash_and_fingerprint(tex_file)
+    # The LaTeX build runs here; the author saves the file meanwhile
+    tex_file.write_text(r"\documentclass{article} % edited mid-build")
+    entry = PaperEntry(slug="raced", data={})
+    entry.set_source_tracking(tex_file, source_hash, fingerprint)
+
+    status, _ = check_paper_staleness(entry)
+    assert status is SyncStatusCode.STALE
+
+
+def test_staleness_racy_fingerprint_verifies_hash(tmp_path, monkeypatch):
+    """Test that a fingerprint recorded right after a write is not trusted."""
+    mock_verify = MagicMock(return_value=True)
+    monkeypatch.setattr("mf.papers.sync.verify_file_hash", mock_verify)
+    tex_file = tmp_path / "paper.tex"
+    tex_file.write_text(r"\documentclass{article}")
+
+    entry = PaperEntry(slug="fresh", data={})
+    entry.set_source_tracking(tex_file, *compute_file_hash_and_fingerprint(tex_file))
+
+    status, _ = check_paper_staleness(entry)
+    assert status is SyncStatusCode.UP_TO_DATE
+    mock_verify.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -152,9 +245,10 @@ def test_staleness_stale(mock_verify, tmp_path):
 # ---------------------------------------------------------------------------
 
 
-@patch("mf.papers.sync.check_paper_staleness")
-def test_check_all_papers_categorization(mock_check, mock_site_root):
+def test_check_all_papers_categorization(mock_site_root, monkeypatch):
     """Test that check_all_papers correctly categorizes papers."""
+    mock_check = MagicMock()
+    monkeypatch.setattr("mf.papers.sync.check_paper_staleness", mock_check)
     db = PaperDatabase(mock_site_root / ".mf" / "paper_db.json")
     db.load()
 
@@ -174,12 +268,12 @@ def test_check_all_papers_categorization(mock_check, mock_site_root):
 
     def staleness_side_effect(entry):
         if entry.slug == "up-paper":
-            return ("up_to_date", Path("/some/up.tex"))
+            return (SyncStatusCode.UP_TO_DATE, Path("/some/up.tex"))
         elif entry.slug == "stale-paper":
-            return ("stale", Path("/some/stale.tex"))
+            return (SyncStatusCode.STALE, Path("/some/stale.tex"))
         elif entry.slug == "missing-paper":
-            return ("missing", Path("/some/missing.tex"))
-        return ("skipped", None)
+            return (SyncStatusCode.MISSING, Path("/some/missing.tex"))
+        return (SyncStatusCode.SKIPPED, None)
 
     mock_check.side_effect = staleness_side_effect
 
@@ -191,9 +285,10 @@ def test_check_all_papers_categorization(mock_check, mock_site_root):
     assert len(status.missing) == 1
 
 
-@patch("mf.papers.sync.check_paper_staleness")
-def test_check_all_papers_no_hash_is_stale(mock_check, mock_site_root):
+def test_check_all_papers_no_hash_is_stale(mock_site_root, monkeypatch):
     """Test that no_hash entries are categorized as stale."""
+    mock_check = MagicMock()
+    monkeypatch.setattr("mf.papers.sync.check_paper_staleness", mock_check)
     db = PaperDatabase(mock_site_root / ".mf" / "paper_db.json")
     db.load()
     db.set("nohash-paper", {
@@ -201,7 +296,7 @@ def test_check_all_papers_no_hash_is_stale(mock_check, mock_site_root):
         "source_path": "/some/nohash.tex",
     })
 
-    mock_check.return_value = ("no_hash", Path("/some/nohash.tex"))
+    mock_check.return_value = (SyncStatusCode.NO_HASH, Path("/some/nohash.tex"))
 
     status = check_all_papers(db)
 
@@ -211,6 +306,107 @@ def test_check_all_papers_no_hash_is_stale(mock_check, mock_site_root):
     assert reason == "no hash"
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_check_all_papers_worker_counts_agree(max_workers, mock_site_root, tmp_path):
+    """Test that serial and threaded checks produce the same buckets."""
+    db = PaperDatabase(mock_site_root / ".mf" / "paper_db.json")
+    db.load()
+    for i in range(6):
+        tex_file = tmp_path / f"paper{i}.tex"
+        tex_file.write_text(f"paper {i}")
+        db.set(f"paper-{i}", {"source_path": str(tex_file)})
+    db.set("gone", {"source_path": str(tmp_path / "gone.tex")})
+
+    status = check_all_papers(db, max_workers=max_workers)
+
+    assert sorted(e.slug for e, _, _ in status.stale) == [f"paper-{i}" for i in range(6)]
+    assert [e.slug for e, _ in status.missing] == ["gone"]
+
+
+def test_check_all_papers_manifest_skips_unchanged(mock_site_root, tmp_path, monkeypatch):
+    """Test that papers unchanged since the manifest was written are not re-checked."""
+    db = PaperDatabase(mock_site_root / ".mf" / "paper_db.json")
+    db.load()
+    for name in ("same", "edited"):
+        tex_file = tmp_path / f"{name}.tex"
+        tex_file.write_text(name)
+        db.set(name, {"source_path": str(tex_file), "source_hash": "sha256:old"})
+
+    manifest: dict = {}
+    first = check_all_papers(db, max_workers=1, manifest=manifest)
+    assert len(first.stale) == 2
+    assert set(manifest) == {"same", "edited"}
+
+    (tmp_path / "edited.tex").write_text("edited again")
+
+    spy = MagicMock(wraps=check_paper_staleness)
+    monkeypatch.setattr("mf.papers.sync.check_paper_staleness", spy)
+    second = check_all_papers(db, max_workers=1, manifest=manifest)
+
+    assert [call.args[0].slug for call in spy.call_args_list] == ["edited"]
+    assert sorted(e.slug for e, _, _ in second.stale) == ["edited", "same"]
+
+
+def test_check_all_papers_manifest_rechecks_new_hash(mock_site_root, tmp_path):
+    """Test that a changed source_hash (paper regenerated) invalidates the manifest."""
+    db = PaperDatabase(mock_site_root / ".mf" / "paper_db.json")
+    db.load()
+    tex_file = tmp_path / "paper.tex"
+    tex_file.write_text("content")
+    db.set("paper", {"source_path": str(tex_file), "source_hash": "sha256:old"})
+
+    manifest: dict = {}
+    check_all_papers(db, manifest=manifest)
+    db.get("paper").set_source_tracking(tex_file, *compute_file_hash_and_fingerprint(tex_file))
+
+    status = check_all_papers(db, manifest=manifest)
+
+    assert [e.slug for e, _ in status.up_to_date] == ["paper"]
+    assert manifest["paper"]["status"] == "up_to_date"
+
+
+def test_sync_manifest_round_trip(tmp_path):
+    """Test that the manifest survives save/load and tolerates bad files."""
+    manifest_path = tmp_path / "cache" / "sync_manifest.json"
+    assert load_sync_manifest(manifest_path) == {}
+
+    save_sync_manifest(manifest_path, {"a": {"record": {"size": 1}, "status": "stale"}})
+    assert load_sync_manifest(manifest_path)["a"]["status"] == "stale"
+
+    manifest_path.write_text("not json")
+    assert load_sync_manifest(manifest_path) == {}
+
+
+def test_iter_check_all_papers_yields_every_paper(mock_site_root, tmp_path):
+    """Test that the generator yields one result per tracked paper."""
+    db = PaperDatabase(mock_site_root / ".mf" / "paper_db.json")
+    db.load()
+    for i in range(5):
+        tex_file = tmp_path / f"p{i}.tex"
+        tex_file.write_text(str(i))
+        db.set(f"p{i}", {"source_path": str(tex_file)})
+
+    results = list(iter_check_all_papers(db, max_workers=4))
+
+    assert sorted(entry.slug for entry, _, _ in results) == [f"p{i}" for i in range(5)]
+    assert {code for _, code, _ in results} == {SyncStatusCode.NO_HASH}
+
+
+def test_iter_check_all_papers_early_exit(mock_site_root, tmp_path):
+    """Test that a consumer can stop at the first result."""
+    db = PaperDatabase(mock_site_root / ".mf" / "paper_db.json")
+    db.load()
+    for i in range(5):
+        db.set(f"p{i}", {"source_path": str(tmp_path / f"missing{i}.tex")})
+
+    gen = iter_check_all_papers(db, max_workers=2)
+    entry, code, _ = next(gen)
+    gen.close()
+
+    assert code is SyncStatusCode.MISSING
+    assert entry.slug.startswith("p")
+
+
 # ---------------------------------------------------------------------------
 # print_sync_status
 # ---------------------------------------------------------------------------
@@ -0,0 +1,60 @@
+"""Tests for mf.papers.templates module (frontmatter rendering)."""
+
+import yaml
+
+from mf.papers.templates import (
+    PAPER_TEMPLATE,
+    format_yaml_list,
+    render_paper_frontmatter,
+)
+
+
+def _frontmatter(content: str) -> dict:
+    """Parse the YAML frontmatter block of rendered content."""
+    return yaml.safe_load(content.split("---\n")[1])
+
+
+def test_format_yaml_list_escapes_items():
+    assert format_yaml_list(['a "b"']) == '\n  - "a \\"b\\""'
+
+
+def test_render_paper_frontmatter_round_trips():
+    metadata = {
+        "title": 'On "\\lambda" Calculus',
+        "date": "2024-05-01",
+        "authors": ['Jane "JD" Doe', "Bob"],
+        "abstract": "Line one\nline two",
+        "tags": ["logic"],
+        "venue": "ICML",
+        "stars": 4,
+        "featured": True,
+    }
+    vars = render_paper_frontmatter(
+        slug="lambda",
+        metadata=metadata,
+        pdf_file="lambda.pdf",
+        pdf_size="1.0 MB",
+        page_count=10,
+    )
+    fm = _frontmatter(PAPER_TEMPLATE.format(**vars))
+
+    assert fm["title"] == 'On "\\lambda" Calculus'
+    assert fm["authors"] == ['Jane "JD" Doe', "Bob"]
+    assert fm["abstract"] == "Line one line two"
+    assert fm["tags"] == ["logic"]
+    assert fm["venue"] == "ICML"
+    assert fm["stars"] == 4
+    assert fm["featured"] is True
+    assert fm["pdf_only"] is False
+    assert "doi" not in fm
+
+
+def test_render_paper_frontmatter_omits_empty_fields():
+    vars = render_paper_frontmatter(
+        slug="bare", metadata={}, pdf_file="", pdf_size="", page_count=0
+    )
+    assert vars["authors"] == ""
+    assert vars["category"] == ""
+    assert vars["draft"] == ""
+    assert vars["arxiv_link"] == ""
+    assert vars["title"] == "bare"
@@ -2,10 +2,15 @@
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+import responses
+from click.testing import CliRunner
 
+from mf.core.database import PaperEntry
+from mf.papers.commands import papers
 from mf.papers.zenodo import (
     CATEGORY_TO_UPLOAD_TYPE,
     ZenodoClient,
@@ -14,11 +19,25 @@ from mf.papers.zenodo import (
     ZenodoAuthError,
     ZenodoRecord,
     ZenodoValidationError,
+    author_last_names,
     compute_match_score,
+    compute_match_score_normalized,
     find_paper_pdf,
     is_eligible_for_zenodo,
     map_paper_to_zenodo_metadata,
+    normalize_title,
 )
+from tests.helpers import site_root_copy
+
+
+# Sandbox endpoints registered with ``responses``
+_DEPOSITIONS_URL = f"{ZenodoClient.SANDBOX_URL}/deposit/depositions"
+_RECORDS_URL = f"{ZenodoClient.SANDBOX_URL}/records/"
+
+
+def _paper(**fields):
+    """Build a lightweight stand-in for a PaperEntry."""
+    return SimpleNamespace(**fields)
 
 
 # -----------------------------------------------------------------------------
@@ -82,137 +101,148 @@ class TestZenodoDeposit:
 class TestZenodoClient:
     """Tests for ZenodoClient class."""
 
-    def test_init_production(self):
-        """Test client initialization for production."""
-        client = ZenodoClient(api_token="test-token", sandbox=False)
-        assert client.base_url == "https://zenodo.org/api"
-        assert client.sandbox is False
-
-    def test_init_sandbox(self):
-        """Test client initialization for sandbox."""
+    @pytest.mark.parametrize(
+        "sandbox,url",
+        [
+            (False, "https://zenodo.org/api"),
+            (True, "https://sandbox.zenodo.org/api"),
+        ],
+        ids=["prod", "sandbox"],
+    )
+    def test_init(self, sandbox, url):
+        """Test client initialization for production and sandbox."""
+        client = ZenodoClient(api_token="test-token", sandbox=sandbox)
+        assert client.base_url == url
+        assert client.sandbox is sandbox
+
+    def test_session_mounts_pooled_adapter(self):
+        """HTTPS requests go through a sized adapter that never retries."""
         client = ZenodoClient(api_token="test-token", sandbox=True)
-        assert client.base_url == "https://sandbox.zenodo.org/api"
-        assert client.sandbox is True
+        adapter = client._session.get_adapter(client.base_url)
+
+        assert adapter._pool_maxsize == ZenodoClient.POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
+
+    @responses.activate
+    def test_context_manager_reuses_and_closes_session(self, monkeypatch):
+        """Requests share one session, which is closed on exit."""
+        responses.add(responses.GET, _DEPOSITIONS_URL, json=[])
+        mock_close = MagicMock()
+        monkeypatch.setattr("requests.Session.close", mock_close)
 
-    @patch("requests.Session.request")
-    def test_create_deposit(self, mock_request):
+        with ZenodoClient(api_token="test-token", sandbox=True) as client:
+            session = client._session
+            client.test_connection()
+            client.test_connection()
+            assert client._session is session
+
+        assert len(responses.calls) == 2
+        mock_close.assert_called_once()
+
+    @responses.activate
+    def test_create_deposit(self):
         """Test creating a new deposit."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        responses.add(responses.POST, _DEPOSITIONS_URL, json={
             "id": 12345,
             "state": "unsubmitted",
             "submitted": False,
             "metadata": {},
-        }
-        mock_request.return_value = mock_response
+        })
 
         client = ZenodoClient(api_token="test-token", sandbox=True)
         deposit = client.create_deposit()
 
         assert deposit.id == 12345
         assert deposit.state == "unsubmitted"
+        assert responses.calls[0].request.headers["Authorization"] == "Bearer test-token"
 
-    @patch("requests.Session.request")
-    def test_auth_error(self, mock_request):
+    @responses.activate
+    def test_auth_error(self):
         """Test handling of authentication errors."""
-        mock_response = MagicMock()
-        mock_response.ok = False
-        mock_response.status_code = 401
-        mock_request.return_value = mock_response
+        responses.add(responses.POST, _DEPOSITIONS_URL, status=401)
 
         client = ZenodoClient(api_token="bad-token", sandbox=True)
         with pytest.raises(ZenodoAuthError):
             client.create_deposit()
 
-    @patch("requests.Session.request")
-    def test_validation_error(self, mock_request):
+    @responses.activate
+    def test_validation_error(self):
         """Test handling of validation errors."""
-        mock_response = MagicMock()
-        mock_response.ok = False
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "message": "Invalid metadata",
-        }
-        mock_request.return_value = mock_response
+        responses.add(
+            responses.POST, _DEPOSITIONS_URL, status=400, json={"message": "Invalid metadata"}
+        )
 
         client = ZenodoClient(api_token="test-token", sandbox=True)
         with pytest.raises(ZenodoValidationError) as exc_info:
             client.create_deposit()
         assert "Invalid metadata" in str(exc_info.value)
 
-    @patch("requests.Session.request")
-    def test_test_connection_success(self, mock_request):
+    @responses.activate
+    def test_test_connection_success(self):
         """Test successful connection test."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.json.return_value = []
-        mock_request.return_value = mock_response
+        responses.add(responses.GET, _DEPOSITIONS_URL, json=[])
 
         client = ZenodoClient(api_token="test-token", sandbox=True)
         assert client.test_connection() is True
 
-    @patch("requests.Session.request")
-    def test_test_connection_failure(self, mock_request):
+    @responses.activate
+    def test_test_connection_failure(self):
         """Test failed connection test."""
-        mock_response = MagicMock()
-        mock_response.ok = False
-        mock_response.status_code = 401
-        mock_request.return_value = mock_response
+        responses.add(responses.GET, _DEPOSITIONS_URL, status=401)
 
         client = ZenodoClient(api_token="bad-token", sandbox=True)
         assert client.test_connection() is False
 
-    @patch("mf.papers.zenodo.time.sleep")
-    @patch("requests.Session.request")
-    def test_retries_on_429(self, mock_request, mock_sleep):
+    @responses.activate
+    def test_retries_on_429(self):
         """Test that 429 rate limit triggers retry with backoff."""
-        rate_limit_response = MagicMock()
-        rate_limit_response.status_code = 429
-        rate_limit_response.ok = False
-        rate_limit_response.headers = {"Retry-After": "3"}
-        rate_limit_response.text = "30 per 1 minute"
-
-        success_response = MagicMock()
-        success_response.ok = True
-        success_response.status_code = 200
-        success_response.content = b'{"hits":{"hits":[]}}'
-        success_response.json.return_value = {"hits": {"hits": []}}
-
         # First call returns 429, second succeeds
-        mock_request.side_effect = [rate_limit_response, success_response]
+        responses.add(
+            responses.GET, _RECORDS_URL,
+            status=429, headers={"Retry-After": "3"}, body="30 per 1 minute",
+        )
+        responses.add(responses.GET, _RECORDS_URL, json={"hits": {"hits": []}})
 
-        client = ZenodoClient(api_token="test-token", sandbox=True)
+        sleeps: list[float] = []
+        client = ZenodoClient(api_token="test-token", sandbox=True, sleeper=sleeps.append)
         results = client.search_records("test query")
 
         assert results == []
-        assert mock_request.call_count == 2
+        assert len(responses.calls) == 2
         # Should have slept for the Retry-After value
-        mock_sleep.assert_called_once_with(3.0)
+        assert sleeps == [3.0]
 
-    @patch("mf.papers.zenodo.time.sleep")
-    @patch("requests.Session.request")
-    def test_429_exhausts_retries(self, mock_request, mock_sleep):
+    @responses.activate
+    def test_429_exhausts_retries(self):
         """Test that exhausting retries on 429 raises ZenodoError."""
-        rate_limit_response = MagicMock()
-        rate_limit_response.status_code = 429
-        rate_limit_response.ok = False
-        rate_limit_response.headers = {}
-        rate_limit_response.text = "30 per 1 minute"
-        rate_limit_response.json.return_value = {"message": "30 per 1 minute"}
-
         # All calls return 429
-        mock_request.return_value = rate_limit_response
+        responses.add(
+            responses.GET, _RECORDS_URL, status=429, json={"message": "30 per 1 minute"}
+        )
 
-        client = ZenodoClient(api_token="test-token", sandbox=True)
+        sleeps: list[float] = []
+        client = ZenodoClient(api_token="test-token", sandbox=True, sleeper=sleeps.append)
         with pytest.raises(ZenodoError, match="429"):
             client.search_records("test query")
 
-        # 1 initial + 3 retries = 4 total
-        assert mock_request.call_count == 4
-        assert mock_sleep.call_count == 3
+        # 1 initial + 3 retries = 4 total, with jittered exponential backoff
+        assert len(responses.calls) == 4
+        assert len(sleeps) == 3
+        for attempt, delay in enumerate(sleeps):
+            nominal = ZenodoClient.RETRY_BACKOFF_BASE * (2 ** attempt)
+            assert 0.5 * nominal <= delay <= 1.5 * nominal
+
+    def test_retry_delay_is_capped(self):
+        """Computed backoff never exceeds the cap plus jitter."""
+        client = ZenodoClient(api_token="test-token", sandbox=True)
+        delay = client._retry_delay(None, attempt=20)
+        assert delay <= 1.5 * ZenodoClient.RETRY_BACKOFF_MAX
+
+    def test_retry_delay_ignores_bad_retry_after(self):
+        """A non-numeric Retry-After falls back to computed backoff."""
+        client = ZenodoClient(api_token="test-token", sandbox=True)
+        delay = client._retry_delay("Wed, 21 Oct 2015 07:28:00 GMT", attempt=0)
+        assert 0.5 * ZenodoClient.RETRY_BACKOFF_BASE <= delay <= 1.5 * ZenodoClient.RETRY_BACKOFF_BASE
 
 
 # -----------------------------------------------------------------------------
@@ -223,31 +253,27 @@ class TestZenodoClient:
 class TestMetadataMapping:
     """Tests for paper to Zenodo metadata mapping."""
 
-    def test_category_mapping_research_paper(self):
-        """Test mapping for research paper category."""
-        upload_type, pub_type = CATEGORY_TO_UPLOAD_TYPE["research paper"]
-        assert upload_type == "publication"
-        assert pub_type == "article"
-
-    def test_category_mapping_thesis(self):
-        """Test mapping for thesis category."""
-        upload_type, pub_type = CATEGORY_TO_UPLOAD_TYPE["Master's Thesis"]
-        assert upload_type == "publication"
-        assert pub_type == "thesis"
-
-    def test_category_mapping_software(self):
-        """Test mapping for software category."""
-        upload_type, pub_type = CATEGORY_TO_UPLOAD_TYPE["Python package"]
-        assert upload_type == "software"
-        assert pub_type is None
+    @pytest.mark.parametrize(
+        "category,upload_type,pub_type",
+        [
+            ("research paper", "publication", "article"),
+            ("Master's Thesis", "publication", "thesis"),
+            ("Python package", "software", None),
+        ],
+        ids=["research-paper", "thesis", "software"],
+    )
+    def test_category_mapping(self, category, upload_type, pub_type):
+        """Test category to upload/publication type mapping."""
+        assert CATEGORY_TO_UPLOAD_TYPE[category] == (upload_type, pub_type)
 
     def test_map_paper_minimal(self):
         """Test mapping paper with minimal data."""
-        paper = MagicMock()
-        paper.data = {
-            "title": "Test Paper",
-        }
-        paper.authors = []
+        paper = _paper(
+            data={
+                "title": "Test Paper",
+            },
+            authors=[],
+        )
 
         metadata = map_paper_to_zenodo_metadata(paper, "test-paper")
 
@@ -258,20 +284,21 @@ class TestMetadataMapping:
 
     def test_map_paper_full(self):
         """Test mapping paper with full data."""
-        paper = MagicMock()
-        paper.data = {
-            "title": "Full Test Paper",
-            "abstract": "This is an abstract",
-            "date": "2024-01-15",
-            "category": "conference paper",
-            "tags": ["machine-learning", "ai"],
-            "github_url": "https://github.com/test/repo",
-            "venue": "Test Conference 2024",
-        }
-        paper.authors = [
-            {"name": "Alice Author", "affiliation": "University"},
-            {"name": "Bob Coauthor"},
-        ]
+        paper = _paper(
+            data={
+                "title": "Full Test Paper",
+                "abstract": "This is an abstract",
+                "date": "2024-01-15",
+                "category": "conference paper",
+                "tags": ["machine-learning", "ai"],
+                "github_url": "https://github.com/test/repo",
+                "venue": "Test Conference 2024",
+            },
+            authors=[
+                {"name": "Alice Author", "affiliation": "University"},
+                {"name": "Bob Coauthor"},
+            ],
+        )
 
         metadata = map_paper_to_zenodo_metadata(paper, "full-test")
 
@@ -288,15 +315,16 @@ class TestMetadataMapping:
 
     def test_map_paper_with_advisors(self):
         """Test mapping thesis with advisors."""
-        paper = MagicMock()
-        paper.data = {
-            "title": "My Thesis",
-            "category": "Master's Thesis",
-            "advisors": [
-                {"name": "Dr. Advisor", "affiliation": "University"},
-            ],
-        }
-        paper.authors = [{"name": "Student Name"}]
+        paper = _paper(
+            data={
+                "title": "My Thesis",
+                "category": "Master's Thesis",
+                "advisors": [
+                    {"name": "Dr. Advisor", "affiliation": "University"},
+                ],
+            },
+            authors=[{"name": "Student Name"}],
+        )
 
         metadata = map_paper_to_zenodo_metadata(paper, "thesis")
 
@@ -314,100 +342,75 @@ class TestMetadataMapping:
 class TestEligibility:
     """Tests for paper eligibility checking."""
 
-    def test_eligible_with_high_stars(self):
-        """Test paper with high stars is eligible."""
-        paper = MagicMock()
-        paper.data = {"stars": 4}
-        paper.doi = None
-
-        assert is_eligible_for_zenodo(paper, min_stars=3) is True
-
-    def test_not_eligible_with_low_stars(self):
-        """Test paper with low stars is not eligible."""
-        paper = MagicMock()
-        paper.data = {"stars": 2}
-        paper.doi = None
+    @pytest.mark.parametrize(
+        "stars,doi,expected",
+        [
+            (4, None, True),
+            (2, None, False),
+            (5, "10.5281/zenodo.12345", False),
+            (4, "10.1109/EXAMPLE.2024", True),
+        ],
+        ids=["high-stars", "low-stars", "on-zenodo", "non-zenodo-doi"],
+    )
+    def test_eligibility(self, stars, doi, expected):
+        """Eligibility depends on star rating and whether the DOI is Zenodo's."""
+        paper = _paper(data={"stars": stars}, doi=doi)
 
-        assert is_eligible_for_zenodo(paper, min_stars=3) is False
+        assert is_eligible_for_zenodo(paper, min_stars=3) is expected
 
-    def test_not_eligible_already_on_zenodo(self):
-        """Test paper already on Zenodo is not eligible."""
-        paper = MagicMock()
-        paper.data = {"stars": 5}
-        paper.doi = "10.5281/zenodo.12345"
 
-        assert is_eligible_for_zenodo(paper, min_stars=3) is False
+# -----------------------------------------------------------------------------
+# PDF finding tests
+# -----------------------------------------------------------------------------
 
-    def test_eligible_with_non_zenodo_doi(self):
-        """Test paper with non-Zenodo DOI is eligible."""
-        paper = MagicMock()
-        paper.data = {"stars": 4}
-        paper.doi = "10.1109/EXAMPLE.2024"
 
-        assert is_eligible_for_zenodo(paper, min_stars=3) is True
+def _make_pdf(root: Path, rel: str) -> Path:
+    """Create a placeholder PDF at ``root / rel``."""
+    pdf = root / rel
+    pdf.parent.mkdir(parents=True, exist_ok=True)
+    pdf.write_bytes(b"x")
+    return pdf
 
 
-# -----------------------------------------------------------------------------
-# PDF finding tests
-# -----------------------------------------------------------------------------
+@pytest.fixture(scope="class")
+def static_dir(tmp_path_factory):
+    """Static directory shared by a test class; each test uses its own slug."""
+    return tmp_path_factory.mktemp("static")
 
 
 class TestFindPaperPdf:
     """Tests for finding paper PDFs."""
 
-    def test_find_from_pdf_path(self, tmp_path):
+    def test_find_from_pdf_path(self, static_dir):
         """Test finding PDF from explicit path."""
-        static_dir = tmp_path / "static"
-        static_dir.mkdir()
-        pdf = static_dir / "latex" / "test" / "main.pdf"
-        pdf.parent.mkdir(parents=True)
-        pdf.write_text("fake pdf")
+        pdf = _make_pdf(static_dir, "latex/test/main.pdf")
 
-        paper = MagicMock()
-        paper.slug = "test"
-        paper.pdf_path = "/latex/test/main.pdf"
+        paper = _paper(slug="test", pdf_path="/latex/test/main.pdf")
 
         result = find_paper_pdf(paper, static_dir)
         assert result == pdf
 
-    def test_find_from_latex_dir(self, tmp_path):
+    def test_find_from_latex_dir(self, static_dir):
         """Test finding PDF from standard latex directory."""
-        static_dir = tmp_path / "static"
-        static_dir.mkdir()
-        pdf = static_dir / "latex" / "test-paper" / "test-paper.pdf"
-        pdf.parent.mkdir(parents=True)
-        pdf.write_text("fake pdf")
+        pdf = _make_pdf(static_dir, "latex/test-paper/test-paper.pdf")
 
-        paper = MagicMock()
-        paper.slug = "test-paper"
-        paper.pdf_path = None
+        paper = _paper(slug="test-paper", pdf_path=None)
 
         result = find_paper_pdf(paper, static_dir)
         assert result == pdf
 
-    def test_not_found(self, tmp_path):
+    def test_not_found(self, static_dir):
         """Test when no PDF exists."""
-        static_dir = tmp_path / "static"
-        static_dir.mkdir()
-
-        paper = MagicMock()
-        paper.slug = "missing"
-        paper.pdf_path = None
+        paper = _paper(slug="missing", pdf_path=None)
 
         result = find_paper_pdf(paper, static_dir)
         assert result is None
 
-    def test_find_from_publications_dir(self, tmp_path):
+    def test_find_from_publications_dir(self, static_dir):
         """Test finding PDF from publications directory."""
-        static_dir = tmp_path / "static"
-        static_dir.mkdir()
-        pdf = static_dir / "publications" / "thesis" / "thesis.pdf"
-        pdf.parent.mkdir(parents=True)
-        pdf.write_text("fake pdf")
+        pdf = _make_pdf(static_dir, "publications/thesis/thesis.pdf")
 
-        paper = MagicMock()
-        paper.slug = "thesis"
-        paper.pdf_path = None
+        paper = _paper(slug="thesis", pdf_path=None)
 
         result = find_paper_pdf(paper, static_dir)
         assert result == pdf
@@ -423,8 +426,6 @@ class TestPaperEntryZenodo:
 
     def test_zenodo_properties_empty(self):
         """Test zenodo properties when not set."""
-        from mf.core.database import PaperEntry
-
         entry = PaperEntry(slug="test", data={})
 
         assert entry.zenodo_deposit_id is None
@@ -436,8 +437,6 @@ class TestPaperEntryZenodo:
 
     def test_zenodo_properties_set(self):
         """Test zenodo properties when set."""
-        from mf.core.database import PaperEntry
-
         entry = PaperEntry(slug="test", data={
             "zenodo_deposit_id": 12345,
             "zenodo_doi": "10.5281/zenodo.12345",
@@ -455,8 +454,6 @@ class TestPaperEntryZenodo:
 
     def test_set_zenodo_registration(self):
         """Test setting zenodo registration."""
-        from mf.core.database import PaperEntry
-
         entry = PaperEntry(slug="test", data={})
         entry.set_zenodo_registration(
             deposit_id=12345,
@@ -473,8 +470,6 @@ class TestPaperEntryZenodo:
 
     def test_stars_property(self):
         """Test stars property."""
-        from mf.core.database import PaperEntry
-
         entry_no_stars = PaperEntry(slug="test", data={})
         assert entry_no_stars.stars == 0
 
@@ -544,71 +539,85 @@ class TestZenodoRecord:
 # -----------------------------------------------------------------------------
 
 
+# (paper_title, paper_authors, record_title, record_creators, predicate)
+_MATCH_CASES = {
+    # Exact title + authors should produce score close to 1.0
+    "exact-match": (
+        "Exposition of Masked Fill-in Models",
+        ["Alex Towell"],
+        "Exposition of Masked Fill-in Models",
+        [{"name": "Towell, Alex"}],
+        lambda score: score > 0.95,
+    ),
+    # Completely unrelated title and authors should score low
+    "no-match": (
+        "Exposition of Masked Fill-in Models",
+        ["Alex Towell"],
+        "Introduction to Quantum Computing for Beginners",
+        [{"name": "Doe, John"}],
+        lambda score: score < 0.5,
+    ),
+    # Similar title with matching author -> moderate-to-high score
+    "partial-title": (
+        "Algebraic Hashing for Content-Addressable Storage",
+        ["Alex Towell"],
+        "Algebraic Hashing: A Content-Addressable Approach",
+        [{"name": "Towell, Alex"}],
+        lambda score: 0.5 < score < 1.0,
+    ),
+    # Missing authors on both sides should not penalize: 0.7 + 0.3 = 1.0
+    "no-authors": (
+        "Same Title Exactly",
+        [],
+        "Same Title Exactly",
+        [],
+        lambda score: score > 0.95,
+    ),
+    # Authors as dicts with "name" key should work
+    "dict-authors": (
+        "Test Paper",
+        [{"name": "Alice Author"}, {"name": "Bob Coauthor"}],
+        "Test Paper",
+        [{"name": "Author, Alice"}, {"name": "Coauthor, Bob"}],
+        lambda score: score > 0.95,
+    ),
+    # Authors on one side only: 0.7 * 1.0 + 0.3 * 0.0 = 0.7
+    "one-side-no-authors": (
+        "Same Title",
+        ["Alex Towell"],
+        "Same Title",
+        [],
+        lambda score: abs(score - 0.7) < 0.05,
+    ),
+}
+
+
 class TestComputeMatchScore:
     """Tests for compute_match_score function."""
 
-    def test_exact_match(self):
-        """Exact title + authors should produce score close to 1.0."""
-        score = compute_match_score(
-            paper_title="Exposition of Masked Fill-in Models",
-            paper_authors=["Alex Towell"],
-            record_title="Exposition of Masked Fill-in Models",
-            record_creators=[{"name": "Towell, Alex"}],
+    @pytest.mark.parametrize(
+        "paper_title,paper_authors,record_title,record_creators,predicate",
+        list(_MATCH_CASES.values()),
+        ids=list(_MATCH_CASES),
+    )
+    def test_scores(self, paper_title, paper_authors, record_title, record_creators, predicate):
+        """Scores fall in the expected range for each scenario."""
+        score = compute_match_score(paper_title, paper_authors, record_title, record_creators)
+        assert predicate(score), score
+
+    def test_normalized_matches_compute_match_score(self):
+        """Pre-normalized scoring agrees with the convenience wrapper."""
+        authors = ["Alex Towell", {"name": "Jane Doe"}]
+        creators = [{"name": "Towell, Alex"}]
+        expected = compute_match_score("  My Paper ", authors, "my paper v2", creators)
+
+        score = compute_match_score_normalized(
+            normalize_title("  My Paper "),
+            author_last_names(authors),
+            "my paper v2",
+            creators,
         )
-        assert score > 0.95
-
-    def test_no_match(self):
-        """Completely unrelated title and authors should score low."""
-        score = compute_match_score(
-            paper_title="Exposition of Masked Fill-in Models",
-            paper_authors=["Alex Towell"],
-            record_title="Introduction to Quantum Computing for Beginners",
-            record_creators=[{"name": "Doe, John"}],
-        )
-        assert score < 0.5
-
-    def test_partial_title_match(self):
-        """Similar titles with different authors → intermediate score."""
-        score = compute_match_score(
-            paper_title="Algebraic Hashing for Content-Addressable Storage",
-            paper_authors=["Alex Towell"],
-            record_title="Algebraic Hashing: A Content-Addressable Approach",
-            record_creators=[{"name": "Towell, Alex"}],
-        )
-        # Should be moderate-to-high because title is similar and author matches
-        assert 0.5 < score < 1.0
-
-    def test_no_authors(self):
-        """Missing authors on both sides should not penalize score."""
-        score = compute_match_score(
-            paper_title="Same Title Exactly",
-            paper_authors=[],
-            record_title="Same Title Exactly",
-            record_creators=[],
-        )
-        # 0.7 * 1.0 (exact title) + 0.3 * 1.0 (both empty) = 1.0
-        assert score > 0.95
-
-    def test_dict_authors(self):
-        """Authors as dicts with 'name' key should work."""
-        score = compute_match_score(
-            paper_title="Test Paper",
-            paper_authors=[{"name": "Alice Author"}, {"name": "Bob Coauthor"}],
-            record_title="Test Paper",
-            record_creators=[{"name": "Author, Alice"}, {"name": "Coauthor, Bob"}],
-        )
-        assert score > 0.95
-
-    def test_one_side_no_authors(self):
-        """One side with authors and other without should reduce score."""
-        score = compute_match_score(
-            paper_title="Same Title",
-            paper_authors=["Alex Towell"],
-            record_title="Same Title",
-            record_creators=[],
-        )
-        # 0.7 * 1.0 + 0.3 * 0.0 = 0.7
-        assert abs(score - 0.7) < 0.05
+        assert score == expected
 
 
 # -----------------------------------------------------------------------------
@@ -619,14 +628,10 @@ class TestComputeMatchScore:
 class TestSearchRecords:
     """Tests for ZenodoClient.search_records method."""
 
-    @patch("requests.Session.request")
-    def test_search_records_success(self, mock_request):
+    @responses.activate
+    def test_search_records_success(self):
         """Successful search returns parsed hits."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.content = b'{"hits":{"hits":[{"id":1}]}}'
-        mock_response.json.return_value = {
+        responses.add(responses.GET, _RECORDS_URL, json={
             "hits": {
                 "total": 1,
                 "hits": [
@@ -637,41 +642,31 @@ class TestSearchRecords:
                     }
                 ],
             }
-        }
-        mock_request.return_value = mock_response
+        })
 
         client = ZenodoClient(api_token="test-token", sandbox=True)
         results = client.search_records('title:"Found Paper"')
 
         assert len(results) == 1
         assert results[0]["id"] == 99999
+        assert responses.calls[0].request.params["q"] == 'title:"Found Paper"'
 
-    @patch("requests.Session.request")
-    def test_search_records_empty(self, mock_request):
+    @responses.activate
+    def test_search_records_empty(self):
         """No results returns empty list."""
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.content = b'{"hits":{"hits":[]}}'
-        mock_response.json.return_value = {
-            "hits": {"total": 0, "hits": []},
-        }
-        mock_request.return_value = mock_response
+        responses.add(responses.GET, _RECORDS_URL, json={"hits": {"total": 0, "hits": []}})
 
         client = ZenodoClient(api_token="test-token", sandbox=True)
         results = client.search_records('title:"Nonexistent Paper"')
 
         assert results == []
 
-    @patch("requests.Session.request")
-    def test_search_records_api_error(self, mock_request):
+    @responses.activate
+    def test_search_records_api_error(self):
         """API error raises ZenodoError."""
-        mock_response = MagicMock()
-        mock_response.ok = False
-        mock_response.status_code = 500
-        mock_response.json.return_value = {"message": "Internal Server Error"}
-        mock_response.text = "Internal Server Error"
-        mock_request.return_value = mock_response
+        responses.add(
+            responses.GET, _RECORDS_URL, status=500, json={"message": "Internal Server Error"}
+        )
 
         client = ZenodoClient(api_token="test-token", sandbox=True)
         with pytest.raises(ZenodoError):
@@ -683,6 +678,32 @@ class TestSearchRecords:
 # -----------------------------------------------------------------------------
 
 
+# Canonical paper database for the import command tests
+_DB_TEMPLATE = {
+    "_comment": "Test",
+    "_schema_version": "2.0",
+    "test-paper": {
+        "title": "Test Paper on Algebraic Hashing",
+        "authors": ["Alex Towell"],
+        "category": "research paper",
+        "stars": 4,
+    },
+    "registered-paper": {
+        "title": "Already Registered Paper",
+        "authors": ["Alex Towell"],
+        "zenodo_doi": "10.5281/zenodo.11111",
+        "zenodo_url": "https://zenodo.org/record/11111",
+        "zenodo_deposit_id": 11111,
+    },
+}
+_DB_BYTES = json.dumps(_DB_TEMPLATE).encode()
+
+
+def _ctx(dry_run: bool = False) -> SimpleNamespace:
+    """Build the CLI context object passed via ``obj``."""
+    return SimpleNamespace(dry_run=dry_run)
+
+
 def _make_search_hit(
     record_id: int = 99999,
     doi: str = "10.5281/zenodo.99999",
@@ -703,54 +724,44 @@ def _make_search_hit(
     }
 
 
+@pytest.fixture(scope="class")
+def site_root(tmp_path_factory, _site_template):
+    """Build a site root with Zenodo config once per test class."""
+    with site_root_copy(_site_template, tmp_path_factory.mktemp("site")) as root:
+        # Config file with zenodo token
+        config_path = root / ".mf" / "config.yaml"
+        config_path.write_text("zenodo:\n  api_token: fake-token\n  sandbox: true\n")
+        yield root
+
+
 class TestZenodoImportCommand:
     """Tests for the 'mf papers zenodo import' CLI command."""
 
+    runner = CliRunner()
+
     @pytest.fixture
-    def mock_db_and_client(self, tmp_path, monkeypatch):
-        """Set up a mock paper database and Zenodo client."""
-        from mf.core import config
-
-        # Set up site root
-        mf_dir = tmp_path / ".mf"
-        mf_dir.mkdir()
-        (mf_dir / "backups" / "papers").mkdir(parents=True)
-
-        db_data = {
-            "_comment": "Test",
-            "_schema_version": "2.0",
-            "test-paper": {
-                "title": "Test Paper on Algebraic Hashing",
-                "authors": ["Alex Towell"],
-                "category": "research paper",
-                "stars": 4,
-            },
-            "registered-paper": {
-                "title": "Already Registered Paper",
-                "authors": ["Alex Towell"],
-                "zenodo_doi": "10.5281/zenodo.11111",
-                "zenodo_url": "https://zenodo.org/record/11111",
-                "zenodo_deposit_id": 11111,
-            },
-        }
-        db_path = mf_dir / "paper_db.json"
-        db_path.write_text(json.dumps(db_data, indent=2))
+    def mock_db_and_client(self, site_root):
+        """Reset the mock paper database before each test."""
+        db_path = site_root / ".mf" / "paper_db.json"
+        db_path.write_bytes(_DB_BYTES)
 
-        # Config file with zenodo token
-        config_path = mf_dir / "config.yaml"
-        config_path.write_text("zenodo:\n  api_token: fake-token\n  sandbox: true\n")
+        return site_root
 
-        config.get_site_root.cache_clear()
-        monkeypatch.setattr(config, "get_site_root", lambda: tmp_path)
+    @pytest.fixture
+    def mock_client(self):
+        """Spec'd Zenodo client whose searches find nothing by default."""
+        client = MagicMock(spec=ZenodoClient)
+        client.search_records.return_value = []
+        return client
 
-        return tmp_path
+    @pytest.fixture
+    def patched_client(self, mock_client):
+        """Make the CLI use ``mock_client`` as its sandbox Zenodo client."""
+        with patch("mf.papers.commands._get_zenodo_client", return_value=(mock_client, True)):
+            yield mock_client
 
-    def test_import_single_paper(self, mock_db_and_client):
+    def test_import_single_paper(self, mock_db_and_client, patched_client):
         """Import zenodo fields for a single paper."""
-        from click.testing import CliRunner
-
-        from mf.papers.commands import papers
-
         hit = _make_search_hit(
             record_id=99999,
             doi="10.5281/zenodo.99999",
@@ -758,105 +769,68 @@ class TestZenodoImportCommand:
             creators=[{"name": "Towell, Alex"}],
         )
 
-        mock_client = MagicMock()
-        mock_client.search_records.return_value = [hit]
+        patched_client.search_records.return_value = [hit]
 
-        with patch("mf.papers.commands._get_zenodo_client", return_value=(mock_client, True)):
-            runner = CliRunner()
-            result = runner.invoke(papers, ["zenodo", "import", "test-paper"], obj=MagicMock(dry_run=False))
+        result = self.runner.invoke(papers, ["zenodo", "import", "test-paper"], obj=_ctx())
 
         assert result.exit_code == 0, result.output
         assert "Imported" in result.output
         assert "10.5281/zenodo.99999" in result.output
 
-    def test_import_dry_run(self, mock_db_and_client):
+    def test_import_dry_run(self, mock_db_and_client, patched_client):
         """Dry run should not save database."""
-        from click.testing import CliRunner
-
-        from mf.papers.commands import papers
-
         hit = _make_search_hit(title="Test Paper on Algebraic Hashing")
 
-        mock_client = MagicMock()
-        mock_client.search_records.return_value = [hit]
+        patched_client.search_records.return_value = [hit]
 
-        with patch("mf.papers.commands._get_zenodo_client", return_value=(mock_client, True)):
-            runner = CliRunner()
-            result = runner.invoke(
-                papers, ["zenodo", "import", "test-paper"],
-                obj=MagicMock(dry_run=True),
-            )
+        result = self.runner.invoke(
+            papers, ["zenodo", "import", "test-paper"],
+            obj=_ctx(dry_run=True),
+        )
 
         assert result.exit_code == 0, result.output
         assert "Dry run" in result.output or "dry" in result.output.lower()
 
-    def test_import_no_match(self, mock_db_and_client):
+    def test_import_no_match(self, mock_db_and_client, patched_client):
         """Reports when no Zenodo record found."""
-        from click.testing import CliRunner
-
-        from mf.papers.commands import papers
-
-        mock_client = MagicMock()
-        mock_client.search_records.return_value = []
-
-        with patch("mf.papers.commands._get_zenodo_client", return_value=(mock_client, True)):
-            runner = CliRunner()
-            result = runner.invoke(papers, ["zenodo", "import", "test-paper"], obj=MagicMock(dry_run=False))
+        result = self.runner.invoke(papers, ["zenodo", "import", "test-paper"], obj=_ctx())
 
         assert result.exit_code == 0, result.output
         assert "No match" in result.output or "no match" in result.output.lower()
 
-    def test_import_already_registered(self, mock_db_and_client):
+    def test_import_already_registered(self, mock_db_and_client, patched_client):
         """Skips papers that already have zenodo_doi."""
-        from click.testing import CliRunner
-
-        from mf.papers.commands import papers
-
-        mock_client = MagicMock()
-
-        with patch("mf.papers.commands._get_zenodo_client", return_value=(mock_client, True)):
-            runner = CliRunner()
-            result = runner.invoke(
-                papers, ["zenodo", "import", "registered-paper"],
-                obj=MagicMock(dry_run=False),
-            )
+        result = self.runner.invoke(
+            papers, ["zenodo", "import", "registered-paper"],
+            obj=_ctx(),
+        )
 
         assert result.exit_code == 0, result.output
         assert "already registered" in result.output.lower()
         # Client should not have been asked to search
-        mock_client.search_records.assert_not_called()
+        patched_client.search_records.assert_not_called()
 
-    def test_import_json_output(self, mock_db_and_client):
+    def test_import_json_output(self, mock_db_and_client, patched_client):
         """--json outputs candidates without importing."""
-        import re
-
-        from click.testing import CliRunner
-
-        from mf.papers.commands import papers
-
         hit = _make_search_hit(
             record_id=99999,
             doi="10.5281/zenodo.99999",
             title="Test Paper on Algebraic Hashing",
         )
 
-        mock_client = MagicMock()
-        mock_client.search_records.return_value = [hit]
+        patched_client.search_records.return_value = [hit]
 
-        with patch("mf.papers.commands._get_zenodo_client", return_value=(mock_client, True)):
-            runner = CliRunner()
-            result = runner.invoke(
-                papers, ["zenodo", "import", "--all", "--json"],
-                obj=MagicMock(dry_run=False),
-            )
+        result = self.runner.invoke(
+            papers, ["zenodo", "import", "--all", "--json"],
+            obj=_ctx(),
+        )
 
         assert result.exit_code == 0, result.output
-        # Strip ANSI escape codes from Rich output
-        clean = re.sub(r"\x1b\[[0-9;]*m", "", result.output)
-        # Find the JSON array in the output (may have console prefix text)
-        json_start = clean.find("[")
-        assert json_start >= 0, f"No JSON array found in output: {clean!r}"
-        output_json = json.loads(clean[json_start:])
+        # Find the JSON array in the raw output (may have console prefix text)
+        output = result.stdout_bytes
+        json_start = output.find(b"[")
+        assert json_start >= 0, f"No JSON array found in output: {output!r}"
+        output_json = json.loads(output[json_start:])
         assert isinstance(output_json, list)
         # Only test-paper should be in results (registered-paper is skipped)
         assert len(output_json) == 1
@@ -865,31 +839,18 @@ class TestZenodoImportCommand:
 
     def test_import_no_slug_and_no_all(self, mock_db_and_client):
         """Should error when neither slug nor --all provided."""
-        from click.testing import CliRunner
-
-        from mf.papers.commands import papers
-
-        runner = CliRunner()
-        result = runner.invoke(
+        result = self.runner.invoke(
             papers, ["zenodo", "import"],
-            obj=MagicMock(dry_run=False),
+            obj=_ctx(),
         )
 
         assert result.exit_code != 0
 
-    def test_import_paper_not_found(self, mock_db_and_client):
+    def test_import_paper_not_found(self, mock_db_and_client, patched_client):
         """Should error when slug doesn't exist in database."""
-        from click.testing import CliRunner
-
-        from mf.papers.commands import papers
-
-        mock_client = MagicMock()
-
-        with patch("mf.papers.commands._get_zenodo_client", return_value=(mock_client, True)):
-            runner = CliRunner()
-            result = runner.invoke(
-                papers, ["zenodo", "import", "nonexistent"],
-                obj=MagicMock(dry_run=False),
-            )
+        result = self.runner.invoke(
+            papers, ["zenodo", "import", "nonexistent"],
+            obj=_ctx(),
+        )
 
         assert result.exit_code != 0
@@ -3,146 +3,134 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
+import os
+import re
 
 import pytest
 import yaml
 from click.testing import CliRunner
 
 from mf.cli import main
-
-
-@pytest.fixture
+from mf.core.jsonio import dumps_json
+from mf.posts.commands import (
+    PostNotFoundError,
+    _create_post_file,
+    _filter_posts,
+    _post_errors,
+    _post_to_dict,
+    _set_post_featured,
+    _set_post_field,
+    _unset_post_field,
+    _update_post_tags,
+)
+from tests.helpers import site_root_copy, write_content_file
+
+
+@pytest.fixture(scope="module")
 def runner():
     return CliRunner()
 
 
 # ---- helpers ---------------------------------------------------------------
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
 
-def _load_fm(path: Path) -> dict:
-    """Parse front matter from a markdown file."""
-    text = path.read_text(encoding="utf-8")
-    parts = text.split("---", 2)
-    assert len(parts) >= 3, f"Bad front matter in {path}"
-    return yaml.safe_load(parts[1])
+_FM_RE = re.compile(rb"^---\n(.*?)\n---", re.S)
 
 
-# ---- TestPostsList ---------------------------------------------------------
+def _read_fm_block(
+    path: str | os.PathLike, chunk_size: int = 4096, limit: int = 65536
+) -> bytes:
+    """Read a file only up to the end of its front matter block."""
+    data = b""
+    with open(os.fspath(path), "rb") as f:
+        while len(data) < limit:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            data += chunk
+            # Closing delimiter follows the opening "---\n"
+            if data.find(b"\n---", 3) != -1:
+                break
+    return data
 
 
-class TestPostsList:
-    """Tests for ``mf posts list``."""
-
-    def test_list_all(self, runner, create_content_file):
-        create_content_file(slug="2024-01-01-alpha", title="Alpha")
-        create_content_file(slug="2024-02-01-beta", title="Beta")
-
-        result = runner.invoke(main, ["posts", "list", "--include-drafts"])
-        assert result.exit_code == 0
-        assert "Alpha" in result.output
-        assert "Beta" in result.output
-
-    def test_list_excludes_drafts_by_default(self, runner, create_content_file):
-        create_content_file(slug="2024-01-01-pub", title="Published", draft=False)
-        create_content_file(slug="2024-01-02-draft", title="Drafted", draft=True)
+def _load_fm(path: str | os.PathLike) -> dict:
+    """Parse front matter from a markdown file."""
+    data = _read_fm_block(path)
+    match = _FM_RE.match(data)
+    assert match, f"Bad front matter in {path}"
+    return yaml.load(match.group(1), Loader=_Loader)
 
-        result = runner.invoke(main, ["posts", "list"])
-        assert result.exit_code == 0
-        assert "Published" in result.output
-        assert "Drafted" not in result.output
 
-    def test_list_with_drafts(self, runner, create_content_file):
-        create_content_file(slug="2024-01-01-pub", title="Published", draft=False)
-        create_content_file(slug="2024-01-02-draft", title="Drafted", draft=True)
+def _target_fm(runner: CliRunner) -> dict:
+    """Front matter of the ``2024-01-01-target`` post, read via ``posts show``."""
+    result = runner.invoke(main, ["posts", "show", "--json", "target"])
+    assert result.exit_code == 0, result.output
+    return json.loads(result.output)
 
-        result = runner.invoke(main, ["posts", "list", "--include-drafts"])
-        assert result.exit_code == 0
-        assert "Published" in result.output
-        assert "Drafted" in result.output
 
-    def test_filter_by_tag(self, runner, create_content_file):
-        create_content_file(
-            slug="2024-01-01-tagged",
-            title="Tagged Post",
-            extra_fm={"tags": ["python", "ml"]},
-        )
-        create_content_file(
-            slug="2024-01-02-other",
-            title="Other Post",
-            extra_fm={"tags": ["rust"]},
-        )
-
-        result = runner.invoke(main, ["posts", "list", "-t", "python"])
-        assert result.exit_code == 0
-        assert "Tagged Post" in result.output
-        assert "Other Post" not in result.output
-
-    def test_filter_by_series(self, runner, create_content_file):
-        create_content_file(
-            slug="2024-01-01-in-series",
-            title="Series Post",
-            extra_fm={"series": ["stepanov"]},
-        )
-        create_content_file(slug="2024-01-02-standalone", title="Standalone")
+# ---- TestPostsList ---------------------------------------------------------
 
-        result = runner.invoke(main, ["posts", "list", "--series", "stepanov"])
-        assert result.exit_code == 0
-        assert "Series Post" in result.output
-        assert "Standalone" not in result.output
+# One post per filter, plus a draft, shared by every TestPostsList case
+_CORPUS = [
+    ("2024-01-01-tagged", {"title": "Tagged Post", "tags": ["python", "ml"]}),
+    ("2024-01-02-other", {"title": "Other Post", "tags": ["rust"]}),
+    ("2024-01-03-in-series", {"title": "Series Post", "series": ["stepanov"]}),
+    ("2024-01-04-featured", {"title": "Featured", "featured": True}),
+    ("2024-01-05-crypto", {"title": "Cryptographic Hash Functions"}),
+    ("2024-01-06-cat", {"title": "Categorized", "categories": ["research"]}),
+    ("2024-01-07-draft", {"title": "Drafted", "draft": True}),
+]
+_PUBLISHED = {fm["title"] for _, fm in _CORPUS if not fm.get("draft")}
+
+
+@pytest.fixture(scope="class")
+def filter_corpus(tmp_path_factory, _site_template):
+    """Write the list-filter corpus once per test class."""
+    with site_root_copy(_site_template, tmp_path_factory.mktemp("posts")) as root:
+        for slug, fm in _CORPUS:
+            write_content_file(root, "post", slug, {"date": "2024-01-01", "draft": False, **fm})
+        yield root
+
+
+class TestPostsListFilters:
+    """``mf posts list`` filters, run against one shared corpus."""
+
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            ([], _PUBLISHED),
+            (["--include-drafts"], _PUBLISHED | {"Drafted"}),
+            (["-t", "python"], {"Tagged Post"}),
+            (["--series", "stepanov"], {"Series Post"}),
+            (["--featured"], {"Featured"}),
+            (["-q", "cryptographic"], {"Cryptographic Hash Functions"}),
+            (["-c", "research"], {"Categorized"}),
+        ],
+    )
+    def test_filter(self, runner, filter_corpus, args, expected):
+        result = runner.invoke(main, ["posts", "list", "--json", *args])
+        assert result.exit_code == 0, result.output
+        assert {p["title"] for p in json.loads(result.output)} == expected
 
-    def test_filter_featured(self, runner, create_content_file):
-        create_content_file(
-            slug="2024-01-01-featured",
-            title="Featured",
-            extra_fm={"featured": True},
-        )
-        create_content_file(slug="2024-01-02-normal", title="Normal")
 
-        result = runner.invoke(main, ["posts", "list", "--featured"])
-        assert result.exit_code == 0
-        assert "Featured" in result.output
-        assert "Normal" not in result.output
+class TestPostsList:
+    """Tests for ``mf posts list``."""
 
-    def test_json_output(self, runner, create_content_file):
+    def test_json_output(self, create_content_file):
         create_content_file(slug="2024-01-01-hello", title="Hello World")
 
-        result = runner.invoke(main, ["posts", "list", "--json"])
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert isinstance(data, list)
+        # Round-trip through the same serializer the CLI uses
+        output = dumps_json([_post_to_dict(it) for it in _filter_posts()], default=str)
+        data = json.loads(output)
         assert len(data) == 1
         assert data[0]["title"] == "Hello World"
         assert data[0]["slug"] == "2024-01-01-hello"
 
-    def test_filter_by_query(self, runner, create_content_file):
-        create_content_file(
-            slug="2024-01-01-crypto",
-            title="Cryptographic Hash Functions",
-        )
-        create_content_file(slug="2024-01-02-bloom", title="Bloom Filters")
-
-        result = runner.invoke(main, ["posts", "list", "-q", "cryptographic"])
-        assert result.exit_code == 0
-        assert "Cryptographic" in result.output
-        assert "Bloom" not in result.output
-
-    def test_filter_by_category(self, runner, create_content_file):
-        create_content_file(
-            slug="2024-01-01-cat",
-            title="Categorized",
-            extra_fm={"categories": ["research"]},
-        )
-        create_content_file(
-            slug="2024-01-02-other",
-            title="Uncategorized",
-        )
-
-        result = runner.invoke(main, ["posts", "list", "-c", "research"])
-        assert result.exit_code == 0
-        assert "Categorized" in result.output
-        assert "Uncategorized" not in result.output
-
     def test_empty_listing(self, runner, mock_site_root):
         result = runner.invoke(main, ["posts", "list"])
         assert result.exit_code == 0
@@ -170,30 +158,17 @@ class TestPostsCreate:
         assert fm["title"] == "My New Post"
         assert fm["draft"] is True
 
-    def test_create_with_metadata(self, runner, mock_site_root):
-        result = runner.invoke(
-            main,
-            [
-                "posts",
-                "create",
-                "--title",
-                "Rich Post",
-                "--date",
-                "2025-03-01",
-                "-t",
-                "python",
-                "-t",
-                "ml",
-                "-c",
-                "research",
-                "-s",
-                "stepanov",
-                "--featured",
-            ],
+    def test_create_with_metadata(self, mock_site_root):
+        index_file = _create_post_file(
+            "Rich Post",
+            date="2025-03-01",
+            tags=("python", "ml"),
+            categories=("research",),
+            series=("stepanov",),
+            featured=True,
         )
-        assert result.exit_code == 0
 
-        index_file = (
+        assert index_file == (
             mock_site_root / "content" / "post" / "2025-03-01-rich-post" / "index.md"
         )
         fm = _load_fm(index_file)
@@ -203,85 +178,67 @@ class TestPostsCreate:
         assert fm["featured"] is True
         assert fm["draft"] is True
 
-    def test_auto_slug_from_title(self, runner, mock_site_root):
-        result = runner.invoke(
-            main,
-            [
-                "posts",
-                "create",
-                "--title",
-                "Hello, World! This is Great",
-                "--date",
-                "2025-01-01",
-            ],
-        )
-        assert result.exit_code == 0
-        expected_dir = (
-            mock_site_root
-            / "content"
-            / "post"
-            / "2025-01-01-hello-world-this-is-great"
-        )
-        assert expected_dir.exists()
+    def test_auto_slug_from_title(self, mock_site_root):
+        index_file = _create_post_file("Hello, World! This is Great", date="2025-01-01")
+
+        assert index_file.parent.name == "2025-01-01-hello-world-this-is-great"
+        assert index_file.exists()
+
+    def test_duplicate_slug_rejection(self, mock_site_root):
+        _create_post_file("Dup", slug="dup", date="2025-01-01")
 
-    def test_duplicate_slug_rejection(self, runner, mock_site_root):
-        # First create
-        runner.invoke(
-            main,
-            ["posts", "create", "--title", "Dup", "--date", "2025-01-01", "--slug", "dup"],
-        )
         # Second with same slug + date should fail
-        result = runner.invoke(
-            main,
-            ["posts", "create", "--title", "Dup2", "--date", "2025-01-01", "--slug", "dup"],
-        )
-        assert result.exit_code != 0
-        assert "already exists" in result.output
+        with pytest.raises(FileExistsError):
+            _create_post_file("Dup2", slug="dup", date="2025-01-01")
 
-    def test_create_with_description(self, runner, mock_site_root):
-        result = runner.invoke(
-            main,
-            [
-                "posts",
-                "create",
-                "--title",
-                "Described",
-                "--date",
-                "2025-02-01",
-                "--description",
-                "A short preview",
-            ],
-        )
-        assert result.exit_code == 0
-        index_file = (
-            mock_site_root / "content" / "post" / "2025-02-01-described" / "index.md"
+    def test_create_with_description(self, mock_site_root):
+        index_file = _create_post_file(
+            "Described", date="2025-02-01", description="A short preview"
         )
+
         fm = _load_fm(index_file)
         assert fm["description"] == "A short preview"
 
-    def test_create_with_explicit_slug(self, runner, mock_site_root):
-        result = runner.invoke(
-            main,
-            [
-                "posts",
-                "create",
-                "--title",
-                "Some Long Title",
-                "--date",
-                "2025-04-01",
-                "--slug",
-                "short",
-            ],
-        )
-        assert result.exit_code == 0
-        index_file = (
-            mock_site_root / "content" / "post" / "2025-04-01-short" / "index.md"
-        )
-        assert index_file.exists()
+    def test_create_with_explicit_slug(self, mock_site_root):
+        index_file = _create_post_file("Some Long Title", slug="short", date="2025-04-01")
+
+        assert index_file.parent.name == "2025-04-01-short"
         fm = _load_fm(index_file)
         assert fm["title"] == "Some Long Title"
 
 
+# ---- TestPostsShow ---------------------------------------------------------
+
+
+class TestPostsShow:
+    """Tests for ``mf posts show``."""
+
+    def test_show_json(self, runner, create_content_file):
+        create_content_file(
+            slug="2024-01-01-target",
+            title="Target",
+            extra_fm={"tags": ["python"]},
+        )
+
+        result = runner.invoke(main, ["posts", "show", "--json", "target"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["title"] == "Target"
+        assert data["tags"] == ["python"]
+
+    def test_show_panel(self, runner, create_content_file):
+        create_content_file(slug="2024-01-01-target", title="Target")
+
+        result = runner.invoke(main, ["posts", "show", "target"])
+        assert result.exit_code == 0
+        assert "Target" in result.output
+
+    def test_show_nonexistent_post(self, runner, mock_site_root):
+        result = runner.invoke(main, ["posts", "show", "ghost"])
+        assert result.exit_code != 0
+        assert "not found" in result.output
+
+
 # ---- TestPostsSet ----------------------------------------------------------
 
 
@@ -290,37 +247,21 @@ class TestPostsSet:
 
     def test_set_field(self, runner, create_content_file):
         create_content_file(slug="2024-01-01-target", title="Target")
-        result = runner.invoke(main, ["posts", "set", "target", "author", "Alex"])
-        assert result.exit_code == 0
-        assert "Set" in result.output
 
-        from mf.core.config import get_paths
-
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
-        assert fm["author"] == "Alex"
+        assert _set_post_field("target", "author", "Alex") == "Alex"
+        assert _target_fm(runner)["author"] == "Alex"
 
     def test_set_boolean(self, runner, create_content_file):
         create_content_file(slug="2024-01-01-target", title="Target")
-        result = runner.invoke(main, ["posts", "set", "target", "featured", "true"])
-        assert result.exit_code == 0
 
-        from mf.core.config import get_paths
-
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
-        assert fm["featured"] is True
+        _set_post_field("target", "featured", "true")
+        assert _target_fm(runner)["featured"] is True
 
     def test_set_integer(self, runner, create_content_file):
         create_content_file(slug="2024-01-01-target", title="Target")
-        result = runner.invoke(main, ["posts", "set", "target", "series_weight", "5"])
-        assert result.exit_code == 0
-
-        from mf.core.config import get_paths
 
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
-        assert fm["series_weight"] == 5
+        _set_post_field("target", "series_weight", "5")
+        assert _target_fm(runner)["series_weight"] == 5
 
     def test_nonexistent_post(self, runner, mock_site_root):
         result = runner.invoke(main, ["posts", "set", "no-such-post", "x", "1"])
@@ -334,21 +275,13 @@ class TestPostsSet:
             extra_fm={"custom": "value"},
         )
 
-        result = runner.invoke(main, ["posts", "unset", "target", "custom"])
-        assert result.exit_code == 0
-        assert "Removed" in result.output
-
-        from mf.core.config import get_paths
-
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
-        assert "custom" not in fm
+        assert _unset_post_field("target", "custom") is True
+        assert "custom" not in _target_fm(runner)
 
-    def test_unset_missing_field(self, runner, create_content_file):
+    def test_unset_missing_field(self, create_content_file):
         create_content_file(slug="2024-01-01-target", title="Target")
-        result = runner.invoke(main, ["posts", "unset", "target", "nonexistent"])
-        assert result.exit_code == 0
-        assert "not present" in result.output
+
+        assert _unset_post_field("target", "nonexistent") is False
 
 
 # ---- TestPostsTag ----------------------------------------------------------
@@ -364,16 +297,9 @@ class TestPostsTag:
             extra_fm={"tags": ["existing"]},
         )
 
-        result = runner.invoke(main, ["posts", "tag", "target", "--add", "new-tag"])
-        assert result.exit_code == 0
-        assert "Updated tags" in result.output
-
-        from mf.core.config import get_paths
-
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
-        assert "existing" in fm["tags"]
-        assert "new-tag" in fm["tags"]
+        tags = _update_post_tags("target", add=("new-tag",))
+        assert tags == ["existing", "new-tag"]
+        assert _target_fm(runner)["tags"] == ["existing", "new-tag"]
 
     def test_remove_tag(self, runner, create_content_file):
         create_content_file(
@@ -382,17 +308,8 @@ class TestPostsTag:
             extra_fm={"tags": ["keep", "remove-me"]},
         )
 
-        result = runner.invoke(
-            main, ["posts", "tag", "target", "--remove", "remove-me"]
-        )
-        assert result.exit_code == 0
-
-        from mf.core.config import get_paths
-
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
-        assert "keep" in fm["tags"]
-        assert "remove-me" not in fm["tags"]
+        _update_post_tags("target", remove=("remove-me",))
+        assert _target_fm(runner)["tags"] == ["keep"]
 
     def test_set_tags(self, runner, create_content_file):
         create_content_file(
@@ -401,16 +318,8 @@ class TestPostsTag:
             extra_fm={"tags": ["old1", "old2"]},
         )
 
-        result = runner.invoke(
-            main, ["posts", "tag", "target", "--set", "new1, new2, new3"]
-        )
-        assert result.exit_code == 0
-
-        from mf.core.config import get_paths
-
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
-        assert fm["tags"] == ["new1", "new2", "new3"]
+        _update_post_tags("target", set_tags="new1, new2, new3")
+        assert _target_fm(runner)["tags"] == ["new1", "new2", "new3"]
 
     def test_add_duplicate_tag(self, runner, create_content_file):
         create_content_file(
@@ -419,20 +328,13 @@ class TestPostsTag:
             extra_fm={"tags": ["python"]},
         )
 
-        result = runner.invoke(main, ["posts", "tag", "target", "--add", "python"])
-        assert result.exit_code == 0
-
-        from mf.core.config import get_paths
-
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
+        _update_post_tags("target", add=("python",))
         # Should not duplicate
-        assert fm["tags"].count("python") == 1
+        assert _target_fm(runner)["tags"].count("python") == 1
 
-    def test_tag_nonexistent_post(self, runner, mock_site_root):
-        result = runner.invoke(main, ["posts", "tag", "ghost", "--add", "x"])
-        assert result.exit_code != 0
-        assert "not found" in result.output
+    def test_tag_nonexistent_post(self, mock_site_root):
+        with pytest.raises(PostNotFoundError):
+            _update_post_tags("ghost", add=("x",))
 
 
 # ---- TestPostsFeature ------------------------------------------------------
@@ -444,15 +346,8 @@ class TestPostsFeature:
     def test_feature_post(self, runner, create_content_file):
         create_content_file(slug="2024-01-01-target", title="Target")
 
-        result = runner.invoke(main, ["posts", "feature", "target"])
-        assert result.exit_code == 0
-        assert "Featured" in result.output
-
-        from mf.core.config import get_paths
-
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
-        assert fm["featured"] is True
+        _set_post_featured("target")
+        assert _target_fm(runner)["featured"] is True
 
     def test_unfeature_post(self, runner, create_content_file):
         create_content_file(
@@ -461,17 +356,18 @@ class TestPostsFeature:
             extra_fm={"featured": True},
         )
 
-        result = runner.invoke(main, ["posts", "feature", "target", "--off"])
-        assert result.exit_code == 0
-        assert "Unfeatured" in result.output
+        _set_post_featured("target", featured=False)
+        assert "featured" not in _target_fm(runner)
 
-        from mf.core.config import get_paths
+    def test_feature_nonexistent_post(self, mock_site_root):
+        with pytest.raises(PostNotFoundError):
+            _set_post_featured("ghost")
 
-        path = get_paths().posts / "2024-01-01-target" / "index.md"
-        fm = _load_fm(path)
-        assert "featured" not in fm
 
-    def test_feature_nonexistent_post(self, runner, mock_site_root):
-        result = runner.invoke(main, ["posts", "feature", "ghost"])
-        assert result.exit_code != 0
-        assert "not found" in result.output
+def test_post_errors_only_reports_missing_posts():
+    """Unrelated KeyErrors propagate instead of reading as "Post not found"."""
+    with pytest.raises(SystemExit), _post_errors("ghost"):
+        raise PostNotFoundError("ghost")
+
+    with pytest.raises(KeyError, match="title"), _post_errors("target"):
+        raise KeyError("title")
@@ -1,5 +1,7 @@
 """Tests for mf.projects.codemeta module (codemeta.json parsing)."""
 
+import json
+
 import pytest
 
 from mf.projects.codemeta import (
@@ -166,6 +168,20 @@ class TestParseCodemeta:
         assert result.authors[0]["name"] == "John Doe"
         assert result.authors[1]["name"] == "Jane Smith"
 
+    @pytest.mark.parametrize(
+        "person, expected",
+        [
+            ({"givenName": "Jane", "familyName": "Doe"}, [{"name": "Jane Doe"}]),
+            ({"givenName": "Solo"}, [{"name": "Solo"}]),
+            ({"familyName": "Doe", "givenName": ""}, [{"name": "Doe"}]),
+            ({"givenName": "", "familyName": ""}, []),
+        ],
+    )
+    def test_parse_person_name_parts(self, person, expected):
+        """Test that a Person's name is joined from the parts present."""
+        result = parse_codemeta(json.dumps({"author": {"@type": "Person", **person}}))
+        assert result.authors == expected
+
     def test_parse_author_with_affiliation_object(self):
         """Test parsing author with affiliation as an object."""
         content = """
@@ -203,6 +219,59 @@ class TestParseCodemeta:
 
         assert result.authors[0]["affiliation"] == "Stanford University"
 
+    @pytest.mark.parametrize("backend", ["simdjson", "orjson", "json"])
+    def test_json_backends(self, monkeypatch, backend):
+        """Test that every JSON backend parses identically."""
+        from mf.projects import codemeta
+
+        if backend != "json" and not getattr(codemeta, f"HAS_{backend.upper()}"):
+            pytest.skip(f"{backend} not installed")
+        monkeypatch.setattr(codemeta, "HAS_SIMDJSON", backend == "simdjson")
+        monkeypatch.setattr(codemeta, "HAS_ORJSON", backend == "orjson")
+        codemeta._parse_codemeta_cached.cache_clear()
+
+        result = parse_codemeta(
+            '{"@context": {"x": 1}, "name": "Caf\u00e9", "keywords": ["a", "b"],'
+            ' "license": {"@id": "https://spdx.org/licenses/MIT"}}'
+        )
+        assert result.name == "Café"
+        assert result.keywords == ["a", "b"]
+        assert result.license_id == "MIT"
+        assert parse_codemeta("{not json") == CodeMetadata()
+        assert parse_codemeta("[1, 2]") == CodeMetadata()
+
+    def test_simdjson_parser_is_per_thread(self):
+        """Test that concurrent threads each parse with their own parser."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from mf.projects import codemeta
+
+        if not codemeta.HAS_SIMDJSON:
+            pytest.skip("simdjson not installed")
+
+        docs = [json.dumps({"name": f"proj-{i}", "keywords": [str(i)] * 50}) for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(codemeta._load_codemeta_object, docs))
+
+        assert [r["name"] for r in results] == [f"proj-{i}" for i in range(200)]
+        assert all(r["keywords"] == [str(i)] * 50 for i, r in enumerate(results))
+        main_parser = codemeta._simdjson_parser()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_parser = executor.submit(codemeta._simdjson_parser).result()
+        assert codemeta._simdjson_parser() is main_parser
+        assert other_parser is not main_parser
+
+    def test_cached_results_are_independent(self):
+        """Test that mutating one parse result does not leak into the cache."""
+        content = '{"name": "Test", "author": ["Jane Doe"], "keywords": ["a"]}'
+        first = parse_codemeta(content)
+        first.authors[0]["name"] = "Changed"
+        first.keywords.append("b")
+
+        second = parse_codemeta(content)
+        assert second.authors == [{"name": "Jane Doe"}]
+        assert second.keywords == ["a"]
+
 
 class TestParseLicense:
     """Tests for license parsing."""
@@ -261,6 +330,14 @@ class TestParseLicense:
         result = parse_codemeta(content)
         assert result.license_id == "BSD-3-Clause"
 
+    def test_spdx_id_shared_across_parses(self):
+        """Test that SPDX IDs sliced from URLs reuse one canonical string."""
+        a = parse_codemeta('{"name": "A", "license": "https://spdx.org/licenses/Apache-2.0"}')
+        b = parse_codemeta('{"name": "B", "license": "https://spdx.org/licenses/Apache-2.0/"}')
+
+        assert a.license_id == "Apache-2.0"
+        assert a.license_id is b.license_id
+
 
 class TestParseDevStatus:
     """Tests for development status parsing."""
@@ -472,6 +549,33 @@ class TestCodemetaToProjectFields:
         result = codemeta_to_project_fields(cm)
         assert "year_started" not in result
 
+    @pytest.mark.parametrize(
+        "repo, included",
+        [
+            ("https://github.com/user/repo", True),
+            ("git@github.com:user/repo.git", True),
+            ("git+https://github.com/user/repo.git", True),
+            ("git://github.com/user/repo.git", True),
+            ("ssh://git@github.com/user/repo.git", True),
+            ("github.com/user/repo", True),
+            ("https://www.github.com/user/repo", True),
+            ("https://notgithub.com/user/repo", False),
+            ("https://gitlab.com/github.com/repo", False),
+            ("git@gitlab.com:github.com/repo.git", False),
+            ("https://github.com.evil.example/user/repo", False),
+        ],
+    )
+    def test_github_repo_prefixes(self, repo, included):
+        """Test that only GitHub-hosted repository URLs are taken."""
+        result = codemeta_to_project_fields(CodeMetadata(code_repository=repo))
+        assert ("github" in result) is included
+
+    @pytest.mark.parametrize("date_created", ["202", " 2024-01-01", "+202-01-01"])
+    def test_short_or_padded_year_ignored(self, date_created):
+        """Test that only a leading 4-digit year is taken."""
+        result = codemeta_to_project_fields(CodeMetadata(date_created=date_created))
+        assert "year_started" not in result
+
 
 class TestCodeMetadata:
     """Tests for CodeMetadata dataclass."""
@@ -523,3 +627,11 @@ class TestCodeMetadata:
         assert metadata.citation == "Test Citation"
         assert metadata.readme == "README.md"
         assert metadata.issue_tracker == "https://github.com/test/repo/issues"
+
+    def test_default_lists_not_shared(self):
+        """Test that each instance gets its own default lists."""
+        a, b = CodeMetadata(), CodeMetadata()
+        a.keywords.append("x")
+
+        assert b.keywords == []
+        assert not hasattr(a, "__dict__")
@@ -1,6 +1,5 @@
 """Tests for mf.projects.field_ops module."""
 
-import json
 import pytest
 
 from mf.projects.field_ops import (
@@ -179,7 +178,6 @@ class TestSetProjectField:
         """Create a ProjectsDatabase with test data."""
         from mf.core.database import ProjectsDatabase
 
-        db_path = tmp_path / "projects_db.json"
         data = {
             "_comment": "test",
             "_schema_version": "2.0",
@@ -190,10 +188,7 @@ class TestSetProjectField:
                 "packages": {"pypi": "old-pkg"},
             },
         }
-        db_path.write_text(json.dumps(data, indent=2))
-        db = ProjectsDatabase(db_path)
-        db.load()
-        return db
+        return ProjectsDatabase.from_dict(data, tmp_path / "projects_db.json")
 
     def test_set_simple_field(self, db):
         result = set_project_field(db, "my-project", "stars", 5)
@@ -237,7 +232,6 @@ class TestUnsetProjectField:
     def db(self, tmp_path):
         from mf.core.database import ProjectsDatabase
 
-        db_path = tmp_path / "projects_db.json"
         data = {
             "_comment": "test",
             "my-project": {
@@ -246,10 +240,7 @@ class TestUnsetProjectField:
                 "packages": {"pypi": "my-pkg", "npm": "my-npm"},
             },
         }
-        db_path.write_text(json.dumps(data, indent=2))
-        db = ProjectsDatabase(db_path)
-        db.load()
-        return db
+        return ProjectsDatabase.from_dict(data, tmp_path / "projects_db.json")
 
     def test_unset_simple_field(self, db):
         result = unset_project_field(db, "my-project", "stars")
@@ -288,17 +279,13 @@ class TestModifyListField:
     def db(self, tmp_path):
         from mf.core.database import ProjectsDatabase
 
-        db_path = tmp_path / "projects_db.json"
         data = {
             "_comment": "test",
             "my-project": {
                 "tags": ["python", "stats"],
             },
         }
-        db_path.write_text(json.dumps(data, indent=2))
-        db = ProjectsDatabase(db_path)
-        db.load()
-        return db
+        return ProjectsDatabase.from_dict(data, tmp_path / "projects_db.json")
 
     def test_add_tags(self, db):
         result = modify_list_field(db, "my-project", "tags", add=["ml", "ai"])
@@ -1,5 +1,7 @@
 """Tests for mf.projects.generator module (Hugo content generation for projects)."""
 
+from types import MappingProxyType
+
 import pytest
 from unittest.mock import patch
 
@@ -14,11 +16,12 @@ from mf.projects.generator import (
 
 
 # -- Fixtures --
+# Session-scoped and read-only; tests that need a variant build a new dict
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def github_data():
     """Sample GitHub API data for a repository."""
-    return {
+    return MappingProxyType({
         "name": "test-repo",
         "full_name": "user/test-repo",
         "html_url": "https://github.com/user/test-repo",
@@ -32,13 +35,13 @@ def github_data():
         "_readme_content": "# Test Repo\n\nThis is the README.",
         "_github_pages_url": "https://user.github.io/test-repo",
         "_languages_breakdown": {"Python": 85.0, "Shell": 15.0},
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def manual_overrides():
     """Sample manual overrides from projects_db.json."""
-    return {
+    return MappingProxyType({
         "title": "My Custom Title",
         "abstract": "Custom abstract override.",
         "tags": ["custom-tag", "override"],
@@ -48,7 +51,7 @@ def manual_overrides():
         "external_docs": {
             "readthedocs": "https://test-repo.readthedocs.io/",
         },
-    }
+    })
 
 
 # -- merge_project_data tests --
@@ -186,8 +189,7 @@ def test_frontmatter_includes_external_docs(github_data, manual_overrides):
 
 def test_frontmatter_description_escapes_quotes(github_data):
     """Description with quotes should have them escaped."""
-    github_data_copy = dict(github_data)
-    github_data_copy["description"] = 'A "quoted" description'
+    github_data_copy = {**github_data, "description": 'A "quoted" description'}
     metadata = {
         "github_url": "https://github.com/user/test-repo",
         "github_data": github_data_copy,
@@ -227,6 +229,35 @@ def test_frontmatter_related_posts(github_data):
     assert '"/post/2024-01-01-intro/"' in fm
 
 
+def test_frontmatter_round_trips_through_yaml(github_data):
+    """Quotes, backslashes and newlines in values should survive YAML parsing."""
+    import yaml
+
+    metadata = {
+        "github_url": "https://github.com/user/test-repo",
+        "github_data": github_data,
+        "title": 'The "C:\\path" project',
+        "abstract": "Line one\nline two",
+        "tags": ['say "hi"', "back\\slash", "tab\there", "cr\rhere"],
+        "packages": {"pypi": "test-repo"},
+        "external_docs": {"mkdocs": "https://user.github.io/test-repo/"},
+        "papers": [{"title": 'A "Bold" Claim', "venue": "NeurIPS", "year": 2024}],
+        "related_posts": ["/post/a\\b/"],
+    }
+    fm = generate_project_frontmatter("test-repo", metadata)
+    data = yaml.safe_load(fm.strip().strip("-"))
+
+    assert data["title"] == 'The "C:\\path" project'
+    assert data["description"] == "Line one line two"
+    assert data["tech"]["topics"] == ['say "hi"', "back\\slash", "tab\there", "cr\rhere"]
+    assert data["tech"]["languages"] == ["Python"]
+    assert data["packages"]["pypi"] == "test-repo"
+    assert data["packages"]["npm"] == ""
+    assert data["external_docs"] == {"mkdocs": "https://user.github.io/test-repo/"}
+    assert data["papers"] == [{"title": 'A "Bold" Claim', "venue": "NeurIPS", "year": 2024}]
+    assert data["related_posts"] == ["/post/a\\b/"]
+
+
 # -- generate_section_frontmatter tests --
 
 def test_section_frontmatter_uses_template():
@@ -274,6 +305,23 @@ def test_generate_project_content_leaf_bundle(mock_site_root, github_data):
     assert "# Test Repo" in text  # README content
 
 
+def test_generate_project_content_truncates_existing_file(mock_site_root, github_data):
+    """Regenerating should fully replace a longer existing index.md."""
+    content_file = mock_site_root / "content" / "projects" / "test-repo" / "index.md"
+    content_file.parent.mkdir(parents=True)
+    content_file.write_text("stale line\n" * 5000, encoding="utf-8")
+
+    metadata = {
+        "github_url": "https://github.com/user/test-repo",
+        "github_data": github_data,
+    }
+    generate_project_content("test-repo", metadata)
+
+    text = content_file.read_text(encoding="utf-8")
+    assert text.startswith("---\n")
+    assert "stale line" not in text
+
+
 def test_generate_project_content_branch_bundle(mock_site_root, github_data):
     """Rich project should create _index.md (branch bundle) and section pages."""
     metadata = {
@@ -374,9 +422,10 @@ def test_generate_all_projects(mock_site_root):
     }
     cache._loaded = True
 
-    db = ProjectsDatabase(mock_site_root / ".mf" / "projects_db.json")
-    db._data = {"_comment": "test"}
-    db._loaded = True
+    db = ProjectsDatabase.from_dict(
+        {"_comment": "test"},
+        mock_site_root / ".mf" / "projects_db.json",
+    )
 
     success, failed = generate_all_projects(cache, db)
 
@@ -406,12 +455,13 @@ def test_generate_all_projects_skips_hidden(mock_site_root):
     }
     cache._loaded = True
 
-    db = ProjectsDatabase(mock_site_root / ".mf" / "projects_db.json")
-    db._data = {
-        "_comment": "test",
-        "hidden-proj": {"hide": True},
-    }
-    db._loaded = True
+    db = ProjectsDatabase.from_dict(
+        {
+            "_comment": "test",
+            "hidden-proj": {"hide": True},
+        },
+        mock_site_root / ".mf" / "projects_db.json",
+    )
 
     success, failed = generate_all_projects(cache, db)
 
@@ -425,11 +475,13 @@ def test_generate_all_projects_skips_hidden(mock_site_root):
 
 def test_generate_project_content_rewrites_readme_urls(mock_site_root, github_data):
     """GitHub README relative URLs should be rewritten to absolute GitHub URLs."""
-    github_data_copy = dict(github_data)
-    github_data_copy["_readme_content"] = (
-        "# Test Repo\n\n"
-        "See [docs](docs/api.md) and ![logo](images/logo.png).\n"
-    )
+    github_data_copy = {
+        **github_data,
+        "_readme_content": (
+            "# Test Repo\n\n"
+            "See [docs](docs/api.md) and ![logo](images/logo.png).\n"
+        ),
+    }
     metadata = {
         "github_url": "https://github.com/user/test-repo",
         "github_data": github_data_copy,
@@ -1,46 +1,24 @@
 """Tests for mf.projects.github module (GitHub API client)."""
 
 import base64
-import json
-import urllib.error
-import urllib.request
-from io import BytesIO
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+import responses
 
 from mf.projects.github import GitHubClient, GITHUB_API, _get_gh_auth_token, check_rate_limit
 
 
-# -- Helpers --
-
-def _mock_response(data, status=200, headers=None):
-    """Create a mock HTTP response from a dict or list."""
-    body = json.dumps(data).encode("utf-8")
-    response = MagicMock()
-    response.read.return_value = body
-    response.status = status
-    response.headers = headers or {}
-    response.__enter__ = MagicMock(return_value=response)
-    response.__exit__ = MagicMock(return_value=False)
-    return response
-
-
-def _mock_http_error(code, reason="Error", headers=None):
-    """Create a mock urllib.error.HTTPError."""
-    err = urllib.error.HTTPError(
-        url="https://api.github.com/test",
-        code=code,
-        msg=reason,
-        hdrs=headers or {},
-        fp=BytesIO(b""),
-    )
-    # Set headers attribute separately since HTTPError uses hdrs
-    err.headers = headers or {}
-    return err
+# -- _get_gh_auth_token tests --
 
+@pytest.fixture(autouse=True)
+def _clear_gh_token_cache():
+    """Keep the memoized gh CLI lookup from leaking between tests."""
+    _get_gh_auth_token.cache_clear()
+    yield
+    _get_gh_auth_token.cache_clear()
 
-# -- _get_gh_auth_token tests --
 
 @patch("mf.projects.github.subprocess.run")
 def test_get_gh_auth_token_success(mock_run):
@@ -61,6 +39,16 @@ def test_get_gh_auth_token_not_installed(mock_run):
     assert token is None
 
 
+@patch("mf.projects.github.subprocess.run")
+def test_get_gh_auth_token_runs_gh_once(mock_run):
+    """Repeated lookups should reuse the first gh auth token result."""
+    mock_run.return_value = MagicMock(returncode=0, stdout="ghp_cached\n")
+
+    assert _get_gh_auth_token() == "ghp_cached"
+    assert _get_gh_auth_token() == "ghp_cached"
+    mock_run.assert_called_once()
+
+
 @patch("mf.projects.github.subprocess.run")
 def test_get_gh_auth_token_not_authenticated(mock_run):
     """Should return None when gh CLI returns non-zero exit code."""
@@ -88,80 +76,183 @@ def test_client_uses_env_token(mock_gh):
     assert client.token == "env-token"
 
 
+def test_client_session_mounts_pooled_adapter():
+    """HTTPS requests go through a sized adapter that never retries."""
+    client = GitHubClient(token="test-token")
+    adapter = client._session.get_adapter(GITHUB_API)
+
+    assert adapter._pool_maxsize == GitHubClient.POOL_MAXSIZE
+    assert adapter.max_retries.total == 0
+
+
+@responses.activate
+def test_client_reuses_and_closes_session(monkeypatch):
+    """Requests share one session, which is closed on exit."""
+    responses.add(responses.GET, f"{GITHUB_API}/user", json={"login": "user"})
+    mock_close = MagicMock()
+    monkeypatch.setattr("requests.Session.close", mock_close)
+
+    with GitHubClient(token="test-token") as client:
+        session = client._session
+        client._make_request(f"{GITHUB_API}/user")
+        client._make_request(f"{GITHUB_API}/user")
+        assert client._session is session
+
+    assert len(responses.calls) == 2
+    mock_close.assert_called_once()
+
+
 # -- _make_request tests --
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_make_request_success(mock_urlopen):
+@responses.activate
+def test_make_request_success():
     """Successful API request should return parsed JSON."""
-    mock_urlopen.return_value = _mock_response({"login": "user", "id": 123})
+    responses.add(responses.GET, f"{GITHUB_API}/user", json={"login": "user", "id": 123})
 
     client = GitHubClient(token="test-token")
-    result = client._make_request("https://api.github.com/user")
+    result = client._make_request(f"{GITHUB_API}/user")
 
     assert result == {"login": "user", "id": 123}
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_make_request_includes_auth_header(mock_urlopen):
+@pytest.mark.parametrize("use_orjson", [True, False])
+@responses.activate
+def test_make_request_json_backends(monkeypatch, use_orjson):
+    """Both JSON backends should parse the raw response bytes alike."""
+    from mf.projects import github
+
+    if use_orjson and not github.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(github, "HAS_ORJSON", use_orjson)
+    responses.add(responses.GET, f"{GITHUB_API}/user", json={"login": "Gödel", "ids": [1, 2.5]})
+    responses.add(responses.GET, f"{GITHUB_API}/bad", body=b"{not json")
+
+    client = GitHubClient(token="test-token")
+
+    assert client._make_request(f"{GITHUB_API}/user") == {"login": "Gödel", "ids": [1, 2.5]}
+    assert client._make_request(f"{GITHUB_API}/bad", max_retries=1) is None
+
+
+@responses.activate
+def test_make_request_includes_auth_header():
     """Request should include Authorization header when token is set."""
-    mock_urlopen.return_value = _mock_response({"ok": True})
+    responses.add(responses.GET, f"{GITHUB_API}/test", json={"ok": True})
 
     client = GitHubClient(token="my-secret-token")
-    client._make_request("https://api.github.com/test")
+    client._make_request(f"{GITHUB_API}/test")
 
     # Verify the request was made with auth header
-    call_args = mock_urlopen.call_args
-    request_obj = call_args[0][0]
-    assert request_obj.get_header("Authorization") == "token my-secret-token"
+    headers = responses.calls[0].request.headers
+    assert headers["Authorization"] == "token my-secret-token"
+    assert headers["Accept"] == "application/vnd.github.v3+json"
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_make_request_no_auth_without_token(mock_urlopen):
+@responses.activate
+def test_make_request_no_auth_without_token():
     """Request should not include Authorization header when no token."""
-    mock_urlopen.return_value = _mock_response({"ok": True})
+    responses.add(responses.GET, f"{GITHUB_API}/test", json={"ok": True})
 
     client = GitHubClient(token="placeholder")
     client.token = None  # bypass auto-detection, force no token
-    client._make_request("https://api.github.com/test")
+    client._make_request(f"{GITHUB_API}/test")
+
+    assert "Authorization" not in responses.calls[0].request.headers
+
+
+@responses.activate
+def test_make_request_records_rate_limit_headers():
+    """Rate limit headers from a successful response should be stored."""
+    responses.add(
+        responses.GET,
+        f"{GITHUB_API}/test",
+        json={"ok": True},
+        headers={"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "1700000000"},
+    )
+
+    client = GitHubClient(token="test-token")
+    client._make_request(f"{GITHUB_API}/test")
 
-    call_args = mock_urlopen.call_args
-    request_obj = call_args[0][0]
-    assert request_obj.get_header("Authorization") is None
+    assert client._rate_limit_remaining == "4999"
+    assert client._rate_limit_reset == "1700000000"
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_make_request_returns_none_on_http_error(mock_urlopen):
+@responses.activate
+def test_make_request_returns_none_on_http_error():
     """Non-rate-limit HTTP errors should return None."""
-    mock_urlopen.side_effect = _mock_http_error(404, "Not Found")
+    url = f"{GITHUB_API}/repos/user/nonexistent"
+    responses.add(responses.GET, url, status=404)
 
     client = GitHubClient(token="test-token")
-    result = client._make_request("https://api.github.com/repos/user/nonexistent", max_retries=1)
+    result = client._make_request(url, max_retries=1)
 
     assert result is None
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_make_request_returns_none_on_url_error(mock_urlopen):
+@responses.activate
+def test_make_request_returns_none_on_url_error():
     """Network errors should return None after retries."""
-    mock_urlopen.side_effect = urllib.error.URLError("Connection refused")
+    responses.add(
+        responses.GET,
+        f"{GITHUB_API}/test",
+        body=requests.ConnectionError("Connection refused"),
+    )
 
     client = GitHubClient(token="test-token")
     # Use max_retries=1 to avoid slow test
-    result = client._make_request("https://api.github.com/test", max_retries=1)
+    result = client._make_request(f"{GITHUB_API}/test", max_retries=1)
 
     assert result is None
 
 
+# -- ETag cache tests --
+
+@responses.activate
+def test_make_request_etag_cache_round_trip(tmp_path):
+    """A stored ETag is sent back and a 304 is answered from the cache."""
+    url = f"{GITHUB_API}/repos/user/repo"
+    etag_path = tmp_path / "cache" / "http_etags.json"
+    responses.add(responses.GET, url, json={"name": "repo"}, headers={"ETag": '"abc"'})
+
+    with GitHubClient(token="test-token", etag_cache=etag_path) as client:
+        assert client._make_request(url) == {"name": "repo"}
+    assert etag_path.exists()
+
+    responses.replace(responses.GET, url, status=304)
+    client = GitHubClient(token="test-token", etag_cache=etag_path)
+    result = client._make_request(url)
+
+    assert result == {"name": "repo"}
+    assert responses.calls[1].request.headers["If-None-Match"] == '"abc"'
+
+
+@responses.activate
+def test_make_request_without_etag_cache_is_unconditional(tmp_path):
+    """Without an ETag cache, no conditional headers are sent or stored."""
+    url = f"{GITHUB_API}/repos/user/repo"
+    responses.add(responses.GET, url, json={"name": "repo"}, headers={"ETag": '"abc"'})
+
+    client = GitHubClient(token="test-token")
+    client._make_request(url)
+    client._make_request(url)
+    client.close()
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert list(tmp_path.iterdir()) == []
+
+
 # -- get_user_repos tests --
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_user_repos_single_page(mock_urlopen):
+_REPOS_URL = f"{GITHUB_API}/users/testuser/repos"
+
+
+@responses.activate
+def test_get_user_repos_single_page():
     """Should return repos from a single page response."""
     repos = [
         {"name": "repo-1", "language": "Python"},
         {"name": "repo-2", "language": "Rust"},
     ]
-    mock_urlopen.return_value = _mock_response(repos)
+    responses.add(responses.GET, _REPOS_URL, json=repos)
 
     client = GitHubClient(token="test-token")
     result = client.get_user_repos("testuser")
@@ -171,29 +262,64 @@ def test_get_user_repos_single_page(mock_urlopen):
     assert result[1]["name"] == "repo-2"
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_user_repos_paginates(mock_urlopen):
-    """Should handle pagination when there are 100+ repos."""
-    # First page: 100 repos (triggers pagination)
+@responses.activate
+def test_get_user_repos_paginates():
+    """Should follow the Link header's rel="next" URL to later pages."""
     page1 = [{"name": f"repo-{i}"} for i in range(100)]
-    # Second page: fewer than 100 (signals end)
     page2 = [{"name": "repo-100"}, {"name": "repo-101"}]
+    page2_url = "https://api.github.com/user/42/repos?per_page=100&type=public&page=2"
 
-    mock_urlopen.side_effect = [
-        _mock_response(page1),
-        _mock_response(page2),
-    ]
+    responses.add(
+        responses.GET,
+        _REPOS_URL,
+        json=page1,
+        headers={"Link": f'<{page2_url}>; rel="next", <{page2_url}>; rel="last"'},
+    )
+    responses.add(responses.GET, page2_url, json=page2)
 
     client = GitHubClient(token="test-token")
     result = client.get_user_repos("testuser")
 
     assert len(result) == 102
+    assert len(responses.calls) == 2
+    assert responses.calls[1].request.url == page2_url
+
+
+@responses.activate
+def test_get_page_returns_next_url_without_client_state():
+    """The rel="next" URL is returned per call, not kept on the client."""
+    page2_url = f"{_REPOS_URL}?page=2"
+    responses.add(
+        responses.GET, _REPOS_URL, json=[{"name": "a"}],
+        headers={"Link": f'<{page2_url}>; rel="next"'},
+    )
+    responses.add(responses.GET, f"{GITHUB_API}/repos/user/repo", json={"name": "repo"})
+
+    client = GitHubClient(token="test-token")
+
+    assert client._get_page(_REPOS_URL) == ([{"name": "a"}], page2_url)
+    assert client._get_page(f"{GITHUB_API}/repos/user/repo") == ({"name": "repo"}, None)
+    assert not hasattr(client, "_next_url")
+
+
+@responses.activate
+def test_get_user_repos_full_last_page_stops():
+    """A full page without a rel="next" link should not trigger another request."""
+    responses.add(
+        responses.GET, _REPOS_URL, json=[{"name": f"repo-{i}"} for i in range(100)]
+    )
 
+    client = GitHubClient(token="test-token")
+    result = client.get_user_repos("testuser")
+
+    assert len(result) == 100
+    assert len(responses.calls) == 1
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_user_repos_empty(mock_urlopen):
+
+@responses.activate
+def test_get_user_repos_empty():
     """Should return empty list when user has no repos."""
-    mock_urlopen.return_value = _mock_response([])
+    responses.add(responses.GET, f"{GITHUB_API}/users/emptyuser/repos", json=[])
 
     client = GitHubClient(token="test-token")
     result = client.get_user_repos("emptyuser")
@@ -203,8 +329,8 @@ def test_get_user_repos_empty(mock_urlopen):
 
 # -- get_repo tests --
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_repo_success(mock_urlopen):
+@responses.activate
+def test_get_repo_success():
     """Should return repo data for a valid owner/repo."""
     repo_data = {
         "name": "my-repo",
@@ -212,7 +338,7 @@ def test_get_repo_success(mock_urlopen):
         "description": "A cool project.",
         "stargazers_count": 99,
     }
-    mock_urlopen.return_value = _mock_response(repo_data)
+    responses.add(responses.GET, f"{GITHUB_API}/repos/user/my-repo", json=repo_data)
 
     client = GitHubClient(token="test-token")
     result = client.get_repo("user", "my-repo")
@@ -223,10 +349,13 @@ def test_get_repo_success(mock_urlopen):
 
 # -- get_repo_languages tests --
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_repo_languages(mock_urlopen):
+_LANGUAGES_URL = f"{GITHUB_API}/repos/user/repo/languages"
+
+
+@responses.activate
+def test_get_repo_languages():
     """Should return language percentages."""
-    mock_urlopen.return_value = _mock_response({
+    responses.add(responses.GET, _LANGUAGES_URL, json={
         "Python": 8000,
         "Shell": 2000,
     })
@@ -238,10 +367,10 @@ def test_get_repo_languages(mock_urlopen):
     assert abs(result["Shell"] - 20.0) < 0.01
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_repo_languages_empty(mock_urlopen):
+@responses.activate
+def test_get_repo_languages_empty():
     """Should return empty dict when no languages found."""
-    mock_urlopen.return_value = _mock_response({})
+    responses.add(responses.GET, _LANGUAGES_URL, json={})
 
     client = GitHubClient(token="test-token")
     result = client.get_repo_languages("user", "repo")
@@ -249,10 +378,10 @@ def test_get_repo_languages_empty(mock_urlopen):
     assert result == {}
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_repo_languages_api_failure(mock_urlopen):
+@responses.activate
+def test_get_repo_languages_api_failure():
     """Should return empty dict on API failure."""
-    mock_urlopen.side_effect = _mock_http_error(404)
+    responses.add(responses.GET, _LANGUAGES_URL, status=404)
 
     client = GitHubClient(token="test-token")
     result = client.get_repo_languages("user", "repo")
@@ -262,12 +391,15 @@ def test_get_repo_languages_api_failure(mock_urlopen):
 
 # -- get_repo_readme tests --
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_repo_readme_success(mock_urlopen):
+_README_URL = f"{GITHUB_API}/repos/user/repo/readme"
+
+
+@responses.activate
+def test_get_repo_readme_success():
     """Should decode base64 README content."""
     readme_text = "# My Project\n\nWelcome to the project."
     encoded = base64.b64encode(readme_text.encode("utf-8")).decode("utf-8")
-    mock_urlopen.return_value = _mock_response({
+    responses.add(responses.GET, _README_URL, json={
         "content": encoded,
         "encoding": "base64",
     })
@@ -278,10 +410,24 @@ def test_get_repo_readme_success(mock_urlopen):
     assert result == readme_text
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_repo_readme_not_found(mock_urlopen):
+@responses.activate
+def test_get_repo_readme_line_wrapped():
+    """Should decode base64 wrapped at 60 columns, as GitHub returns it."""
+    readme_text = "# Ünïcode README\n\n" + "Lorem ipsum dolor sit amet. " * 20
+    encoded = base64.b64encode(readme_text.encode("utf-8")).decode("ascii")
+    wrapped = "\n".join(encoded[i:i + 60] for i in range(0, len(encoded), 60)) + "\n"
+    responses.add(responses.GET, _README_URL, json={"content": wrapped, "encoding": "base64"})
+
+    client = GitHubClient(token="test-token")
+    result = client.get_repo_readme("user", "repo")
+
+    assert result == readme_text
+
+
+@responses.activate
+def test_get_repo_readme_not_found():
     """Should return None when README doesn't exist."""
-    mock_urlopen.side_effect = _mock_http_error(404)
+    responses.add(responses.GET, _README_URL, status=404)
 
     client = GitHubClient(token="test-token")
     result = client.get_repo_readme("user", "repo")
@@ -289,10 +435,10 @@ def test_get_repo_readme_not_found(mock_urlopen):
     assert result is None
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_repo_readme_no_content_field(mock_urlopen):
+@responses.activate
+def test_get_repo_readme_no_content_field():
     """Should return None when response lacks content field."""
-    mock_urlopen.return_value = _mock_response({"name": "README.md"})
+    responses.add(responses.GET, _README_URL, json={"name": "README.md"})
 
     client = GitHubClient(token="test-token")
     result = client.get_repo_readme("user", "repo")
@@ -302,10 +448,13 @@ def test_get_repo_readme_no_content_field(mock_urlopen):
 
 # -- get_github_pages_url tests --
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_github_pages_url_enabled(mock_urlopen):
+_PAGES_URL = f"{GITHUB_API}/repos/user/repo/pages"
+
+
+@responses.activate
+def test_get_github_pages_url_enabled():
     """Should return Pages URL when enabled."""
-    mock_urlopen.return_value = _mock_response({
+    responses.add(responses.GET, _PAGES_URL, json={
         "html_url": "https://user.github.io/repo",
         "status": "built",
     })
@@ -316,10 +465,10 @@ def test_get_github_pages_url_enabled(mock_urlopen):
     assert result == "https://user.github.io/repo"
 
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_get_github_pages_url_not_enabled(mock_urlopen):
+@responses.activate
+def test_get_github_pages_url_not_enabled():
     """Should return None when Pages is not enabled (404)."""
-    mock_urlopen.side_effect = _mock_http_error(404)
+    responses.add(responses.GET, _PAGES_URL, status=404)
 
     client = GitHubClient(token="test-token")
     result = client.get_github_pages_url("user", "repo")
@@ -329,10 +478,10 @@ def test_get_github_pages_url_not_enabled(mock_urlopen):
 
 # -- check_rate_limit tests --
 
-@patch("mf.projects.github.urllib.request.urlopen")
-def test_check_rate_limit_displays_info(mock_urlopen, capsys):
+@responses.activate
+def test_check_rate_limit_displays_info(capsys):
     """check_rate_limit should query the rate limit endpoint."""
-    mock_urlopen.return_value = _mock_response({
+    responses.add(responses.GET, f"{GITHUB_API}/rate_limit", json={
         "resources": {
             "core": {
                 "limit": 5000,
@@ -1,5 +1,6 @@
 """Tests for mf.projects.importer module (GitHub repository import)."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -179,6 +180,30 @@ def test_extract_repo_metadata_augments_data(sample_repos):
     assert "_last_synced" in result
 
 
+def test_extract_repo_metadata_fetches_concurrently(sample_repos):
+    """The three enrichment lookups should be in flight at the same time."""
+    import threading
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def arrive(value):
+        def side_effect(owner, name):
+            barrier.wait()  # raises BrokenBarrierError if calls are serialized
+            return value
+        return side_effect
+
+    mock_client = MagicMock()
+    mock_client.get_repo_languages.side_effect = arrive({"Python": 100.0})
+    mock_client.get_github_pages_url.side_effect = arrive(None)
+    mock_client.get_repo_readme.side_effect = arrive("readme")
+
+    result = extract_repo_metadata(sample_repos[0], mock_client)
+
+    assert result["_languages_breakdown"] == {"Python": 100.0}
+    assert result["_readme_content"] == "readme"
+    mock_client.get_repo_readme.assert_called_once_with("user", "alpha")
+
+
 def test_extract_repo_metadata_no_pages(sample_repos):
     """When pages URL is None, key should not appear."""
     repo = sample_repos[0]
@@ -273,6 +298,36 @@ def test_import_user_repos_skips_existing(
     mock_extract.assert_not_called()
 
 
+@patch("mf.projects.importer.generate_project_content")
+@patch("mf.projects.importer.extract_repo_metadata")
+@patch("mf.projects.importer.check_rate_limit")
+@patch("mf.projects.importer.GitHubClient")
+@patch("mf.projects.importer.ProjectsCache")
+@patch("mf.projects.importer.ProjectsDatabase")
+def test_import_user_repos_closes_client_on_error(
+    mock_db_cls, mock_cache_cls,
+    mock_client_cls, mock_rate_limit,
+    mock_extract, mock_generate,
+    sample_repos,
+):
+    """The client (and its ETag cache) should be closed even if import fails."""
+    mock_client = MagicMock()
+    mock_client.get_user_repos.return_value = [sample_repos[0]]
+    mock_client_cls.return_value = mock_client
+
+    mock_cache = MagicMock()
+    mock_cache.__contains__ = MagicMock(return_value=False)
+    mock_cache_cls.return_value = mock_cache
+    mock_db_cls.return_value.get.return_value = None
+    mock_generate.side_effect = OSError("disk full")
+
+    with pytest.raises(OSError):
+        import_user_repos(username="testuser", token="test-token")
+
+    mock_client.close.assert_called_once()
+    mock_cache.save.assert_not_called()
+
+
 # -- refresh_projects tests --
 
 @patch("mf.projects.importer.generate_project_content")
@@ -408,3 +463,28 @@ def test_clean_stale_no_stale(mock_client_cls, mock_site_root):
             token="test-token",
             dry_run=True,
         )
+
+
+@patch("mf.projects.importer.GitHubClient")
+def test_clean_stale_prunes_overrides_in_one_save(mock_client_cls, mock_site_root, monkeypatch):
+    """Pruning several orphaned overrides should write projects_db.json once."""
+    mock_client_cls.return_value.get_user_repos.return_value = [{"name": "kept"}]
+    db_path = mock_site_root / ".mf" / "projects_db.json"
+    db_path.write_text(json.dumps({"kept": {}, "gone-a": {}, "gone-b": {}}))
+
+    writes = []
+    monkeypatch.setattr(
+        "mf.core.database.safe_write_json",
+        lambda path, data, **kw: writes.append(sorted(data)),
+    )
+
+    with patch("mf.projects.importer.ProjectsCache") as pc_cls:
+        pc_cls.return_value.__iter__ = MagicMock(return_value=iter([]))
+        clean_stale_projects(
+            username="testuser", auto_confirm=True, prune_overrides=True
+        )
+
+    assert len(writes) == 1
+    assert "gone-a" not in writes[0] and "gone-b" not in writes[0]
+    assert "kept" in writes[0]
+
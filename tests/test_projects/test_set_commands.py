@@ -1,6 +1,8 @@
 """CLI integration tests for project field override commands."""
 
 import json
+from types import SimpleNamespace
+
 import pytest
 from click.testing import CliRunner
 
@@ -80,32 +82,32 @@ class TestSetCommand:
     """Tests for 'mf projects set'."""
 
     def test_set_int_field(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "stars", "5"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "test-project", "stars", "5"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         assert "5" in result.output
         db = _read_db(db_env)
         assert db["test-project"]["stars"] == 5
 
     def test_set_string_field(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "title", "New Title"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "test-project", "title", "New Title"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-project"]["title"] == "New Title"
 
     def test_set_bool_field(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "hide", "true"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "test-project", "hide", "true"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-project"]["hide"] is True
 
     def test_set_list_field(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "tags", "a,b,c"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "test-project", "tags", "a,b,c"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-project"]["tags"] == ["a", "b", "c"]
 
     def test_set_dot_notation(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "packages.npm", "my-npm"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "test-project", "packages.npm", "my-npm"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-project"]["packages"]["npm"] == "my-npm"
@@ -113,31 +115,31 @@ class TestSetCommand:
         assert db["test-project"]["packages"]["pypi"] == "test-pkg"
 
     def test_set_invalid_field(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "bogus_field", "val"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "test-project", "bogus_field", "val"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0  # Click doesn't fail, we print error
         assert "Unknown field" in result.output
 
     def test_set_invalid_int(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "stars", "abc"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "test-project", "stars", "abc"], obj=SimpleNamespace(dry_run=False))
         assert "Expected integer" in result.output
 
     def test_set_out_of_range(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "stars", "10"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "test-project", "stars", "10"], obj=SimpleNamespace(dry_run=False))
         assert "above maximum" in result.output
 
     def test_set_invalid_choice(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "category", "banana"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "test-project", "category", "banana"], obj=SimpleNamespace(dry_run=False))
         assert "not a valid choice" in result.output
 
     def test_set_dry_run(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "test-project", "stars", "5"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(projects, ["set", "test-project", "stars", "5"], obj=SimpleNamespace(dry_run=True))
         assert result.exit_code == 0
         assert "Dry run" in result.output
         db = _read_db(db_env)
         assert db["test-project"]["stars"] == 3  # Unchanged
 
     def test_set_creates_new_project(self, runner, db_env):
-        result = runner.invoke(projects, ["set", "brand-new", "stars", "4"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["set", "brand-new", "stars", "4"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["brand-new"]["stars"] == 4
@@ -147,32 +149,32 @@ class TestUnsetCommand:
     """Tests for 'mf projects unset'."""
 
     def test_unset_field(self, runner, db_env):
-        result = runner.invoke(projects, ["unset", "test-project", "stars"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["unset", "test-project", "stars"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert "stars" not in db["test-project"]
 
     def test_unset_dot_notation(self, runner, db_env):
-        result = runner.invoke(projects, ["unset", "test-project", "packages.pypi"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["unset", "test-project", "packages.pypi"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert "pypi" not in db["test-project"].get("packages", {})
 
     def test_unset_nonexistent_field(self, runner, db_env):
-        result = runner.invoke(projects, ["unset", "test-project", "license"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["unset", "test-project", "license"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         assert "was not set" in result.output
 
     def test_unset_nonexistent_project(self, runner, db_env):
-        result = runner.invoke(projects, ["unset", "no-such-project", "stars"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["unset", "no-such-project", "stars"], obj=SimpleNamespace(dry_run=False))
         assert "not found" in result.output
 
     def test_unset_unknown_field(self, runner, db_env):
-        result = runner.invoke(projects, ["unset", "test-project", "bogus"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["unset", "test-project", "bogus"], obj=SimpleNamespace(dry_run=False))
         assert "Unknown field" in result.output
 
     def test_unset_dry_run(self, runner, db_env):
-        result = runner.invoke(projects, ["unset", "test-project", "stars"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(projects, ["unset", "test-project", "stars"], obj=SimpleNamespace(dry_run=True))
         assert "Dry run" in result.output
         db = _read_db(db_env)
         assert db["test-project"]["stars"] == 3  # Unchanged
@@ -182,19 +184,19 @@ class TestFeatureCommand:
     """Tests for 'mf projects feature'."""
 
     def test_feature_on(self, runner, db_env):
-        result = runner.invoke(projects, ["feature", "hidden-project"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["feature", "hidden-project"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["hidden-project"]["featured"] is True
 
     def test_feature_off(self, runner, db_env):
-        result = runner.invoke(projects, ["feature", "test-project", "--off"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["feature", "test-project", "--off"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-project"]["featured"] is False
 
     def test_feature_dry_run(self, runner, db_env):
-        result = runner.invoke(projects, ["feature", "hidden-project"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(projects, ["feature", "hidden-project"], obj=SimpleNamespace(dry_run=True))
         assert "Dry run" in result.output
         db = _read_db(db_env)
         assert "featured" not in db["hidden-project"]
@@ -204,19 +206,19 @@ class TestHideCommand:
     """Tests for 'mf projects hide'."""
 
     def test_hide_on(self, runner, db_env):
-        result = runner.invoke(projects, ["hide", "test-project"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["hide", "test-project"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-project"]["hide"] is True
 
     def test_hide_off(self, runner, db_env):
-        result = runner.invoke(projects, ["hide", "hidden-project", "--off"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(projects, ["hide", "hidden-project", "--off"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["hidden-project"]["hide"] is False
 
     def test_hide_dry_run(self, runner, db_env):
-        result = runner.invoke(projects, ["hide", "test-project"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(projects, ["hide", "test-project"], obj=SimpleNamespace(dry_run=True))
         assert "Dry run" in result.output
 
 
@@ -226,7 +228,7 @@ class TestTagCommand:
     def test_add_tags(self, runner, db_env):
         result = runner.invoke(
             projects, ["tag", "test-project", "--add", "ml", "--add", "ai"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert result.exit_code == 0
         db = _read_db(db_env)
@@ -238,7 +240,7 @@ class TestTagCommand:
     def test_remove_tags(self, runner, db_env):
         result = runner.invoke(
             projects, ["tag", "test-project", "--remove", "test"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert result.exit_code == 0
         db = _read_db(db_env)
@@ -248,7 +250,7 @@ class TestTagCommand:
     def test_set_tags(self, runner, db_env):
         result = runner.invoke(
             projects, ["tag", "test-project", "--set", "a,b,c"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert result.exit_code == 0
         db = _read_db(db_env)
@@ -257,14 +259,14 @@ class TestTagCommand:
     def test_tag_no_options(self, runner, db_env):
         result = runner.invoke(
             projects, ["tag", "test-project"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert "Specify --add, --remove, or --set" in result.output
 
     def test_tag_dry_run(self, runner, db_env):
         result = runner.invoke(
             projects, ["tag", "test-project", "--add", "new"],
-            obj=type("Ctx", (), {"dry_run": True})(),
+            obj=SimpleNamespace(dry_run=True),
         )
         assert "Dry run" in result.output
         db = _read_db(db_env)
@@ -185,6 +185,29 @@ def test_generate_publication_content_format():
     assert parsed["tags"] == ["a", "b"]
 
 
+def test_generate_publication_content_matches_pure_python_dumper():
+    """Test that the libyaml emitter produces the same text as SafeDumper."""
+    fm = {
+        "title": "Über: \"quoted\" title",
+        "abstract": "A long abstract " * 40,
+        "authors": [{"name": "Alex Towell", "email": "a@example.com"}],
+        "date": "2024-01-15T00:00:00Z",
+        "publication": {"venue": "IEEE", "year": 2024, "doi": "10.1/x"},
+        "tags": ["stats", "reliability"],
+    }
+    content = generate_publication_content(fm)
+
+    expected = yaml.dump(
+        fm,
+        Dumper=yaml.SafeDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        width=1000,
+    )
+    assert content == f"---\n{expected}---\n"
+
+
 # ---------------------------------------------------------------------------
 # get_publication_slug tests
 # ---------------------------------------------------------------------------
@@ -5,8 +5,10 @@ import pytest
 from pathlib import Path
 
 import yaml
+from click.testing import CliRunner
 
 from mf.core.database import PaperDatabase, ProjectsDatabase, SeriesEntry
+from mf.series.commands import series
 from mf.series.mkdocs import (
     validate_mkdocs_repo,
     get_site_base_url,
@@ -109,11 +111,7 @@ def projects_db(tmp_path, mock_site_root):
             "description": "A library for alpha processing.",
         },
     }
-    db_path = mock_site_root / ".mf" / "projects_db.json"
-    db_path.write_text(json.dumps(data, indent=2))
-    db = ProjectsDatabase(db_path)
-    db.load()
-    return db
+    return ProjectsDatabase.from_dict(data, mock_site_root / ".mf" / "projects_db.json")
 
 
 class TestValidateMkdocsRepo:
@@ -668,9 +666,6 @@ class TestSyncCommandMkdocsFlag:
 
     def test_add_mkdocs_requires_push(self, series_with_mkdocs):
         """Test that --add-mkdocs errors without --push."""
-        from click.testing import CliRunner
-        from mf.series.commands import series
-
         runner = CliRunner()
         result = runner.invoke(series, [
             "sync", "test-series", "--add-mkdocs",
@@ -681,9 +676,6 @@ class TestSyncCommandMkdocsFlag:
 
     def test_add_mkdocs_with_push_runs(self, series_with_mkdocs):
         """Test that --add-mkdocs with --push runs mkdocs sync."""
-        from click.testing import CliRunner
-        from mf.series.commands import series
-
         runner = CliRunner()
         result = runner.invoke(series, [
             "sync", "test-series", "--push", "--add-mkdocs", "--dry-run",
@@ -1,6 +1,8 @@
 """CLI integration tests for series field override commands."""
 
 import json
+from types import SimpleNamespace
+
 import pytest
 from click.testing import CliRunner
 
@@ -69,33 +71,33 @@ class TestFieldsCommand:
 
 class TestSetCommand:
     def test_set_string_field(self, runner, db_env):
-        result = runner.invoke(series, ["set", "test-series", "status", "completed"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["set", "test-series", "status", "completed"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-series"]["status"] == "completed"
 
     def test_set_color(self, runner, db_env):
-        result = runner.invoke(series, ["set", "test-series", "color", "#ff0000"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["set", "test-series", "color", "#ff0000"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-series"]["color"] == "#ff0000"
 
     def test_set_list_field(self, runner, db_env):
-        result = runner.invoke(series, ["set", "test-series", "tags", "a,b,c"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["set", "test-series", "tags", "a,b,c"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-series"]["tags"] == ["a", "b", "c"]
 
     def test_set_invalid_field(self, runner, db_env):
-        result = runner.invoke(series, ["set", "test-series", "bogus_field", "val"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["set", "test-series", "bogus_field", "val"], obj=SimpleNamespace(dry_run=False))
         assert "Unknown field" in result.output
 
     def test_set_invalid_choice(self, runner, db_env):
-        result = runner.invoke(series, ["set", "test-series", "status", "banana"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["set", "test-series", "status", "banana"], obj=SimpleNamespace(dry_run=False))
         assert "not a valid choice" in result.output
 
     def test_set_dry_run(self, runner, db_env):
-        result = runner.invoke(series, ["set", "test-series", "status", "completed"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(series, ["set", "test-series", "status", "completed"], obj=SimpleNamespace(dry_run=True))
         assert "Dry run" in result.output
         db = _read_db(db_env)
         assert db["test-series"]["status"] == "active"  # Unchanged
@@ -103,25 +105,25 @@ class TestSetCommand:
 
 class TestUnsetCommand:
     def test_unset_field(self, runner, db_env):
-        result = runner.invoke(series, ["unset", "test-series", "color"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["unset", "test-series", "color"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert "color" not in db["test-series"]
 
     def test_unset_nonexistent_field(self, runner, db_env):
-        result = runner.invoke(series, ["unset", "test-series", "icon"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["unset", "test-series", "icon"], obj=SimpleNamespace(dry_run=False))
         assert "was not set" in result.output
 
     def test_unset_nonexistent_series(self, runner, db_env):
-        result = runner.invoke(series, ["unset", "no-such-series", "status"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["unset", "no-such-series", "status"], obj=SimpleNamespace(dry_run=False))
         assert "not found" in result.output
 
     def test_unset_unknown_field(self, runner, db_env):
-        result = runner.invoke(series, ["unset", "test-series", "bogus"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["unset", "test-series", "bogus"], obj=SimpleNamespace(dry_run=False))
         assert "Unknown field" in result.output
 
     def test_unset_dry_run(self, runner, db_env):
-        result = runner.invoke(series, ["unset", "test-series", "color"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(series, ["unset", "test-series", "color"], obj=SimpleNamespace(dry_run=True))
         assert "Dry run" in result.output
         db = _read_db(db_env)
         assert db["test-series"]["color"] == "#667eea"  # Unchanged
@@ -129,19 +131,19 @@ class TestUnsetCommand:
 
 class TestFeatureCommand:
     def test_feature_on(self, runner, db_env):
-        result = runner.invoke(series, ["feature", "other-series"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["feature", "other-series"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["other-series"]["featured"] is True
 
     def test_feature_off(self, runner, db_env):
-        result = runner.invoke(series, ["feature", "test-series", "--off"], obj=type("Ctx", (), {"dry_run": False})())
+        result = runner.invoke(series, ["feature", "test-series", "--off"], obj=SimpleNamespace(dry_run=False))
         assert result.exit_code == 0
         db = _read_db(db_env)
         assert db["test-series"]["featured"] is False
 
     def test_feature_dry_run(self, runner, db_env):
-        result = runner.invoke(series, ["feature", "other-series"], obj=type("Ctx", (), {"dry_run": True})())
+        result = runner.invoke(series, ["feature", "other-series"], obj=SimpleNamespace(dry_run=True))
         assert "Dry run" in result.output
         db = _read_db(db_env)
         assert "featured" not in db["other-series"]
@@ -151,7 +153,7 @@ class TestTagCommand:
     def test_add_tags(self, runner, db_env):
         result = runner.invoke(
             series, ["tag", "test-series", "--add", "philosophy", "--add", "logic"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert result.exit_code == 0
         db = _read_db(db_env)
@@ -163,7 +165,7 @@ class TestTagCommand:
     def test_remove_tags(self, runner, db_env):
         result = runner.invoke(
             series, ["tag", "test-series", "--remove", "computing"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert result.exit_code == 0
         db = _read_db(db_env)
@@ -173,7 +175,7 @@ class TestTagCommand:
     def test_set_tags(self, runner, db_env):
         result = runner.invoke(
             series, ["tag", "test-series", "--set", "a,b,c"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert result.exit_code == 0
         db = _read_db(db_env)
@@ -182,14 +184,14 @@ class TestTagCommand:
     def test_tag_no_options(self, runner, db_env):
         result = runner.invoke(
             series, ["tag", "test-series"],
-            obj=type("Ctx", (), {"dry_run": False})(),
+            obj=SimpleNamespace(dry_run=False),
         )
         assert "Specify --add, --remove, or --set" in result.output
 
     def test_tag_dry_run(self, runner, db_env):
         result = runner.invoke(
             series, ["tag", "test-series", "--add", "new"],
-            obj=type("Ctx", (), {"dry_run": True})(),
+            obj=SimpleNamespace(dry_run=True),
         )
         assert "Dry run" in result.output
         db = _read_db(db_env)